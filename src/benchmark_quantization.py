@@ -0,0 +1,129 @@
+import sys
+import os
+import argparse
+import hashlib
+import io
+import logging
+import time
+
+# Add the src directory to the path to allow absolute imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.label_store import create_label_store, DEFAULT_LABEL_BACKEND, DEFAULT_LABEL_DB, LABEL_BACKENDS
+from src.core.question_record import LabelRecord, UNANSWERABLE_TEXT
+from src.ml import plugins
+from src.ml.bleu import corpus_bleu
+
+logger = logging.getLogger(__name__)
+
+# Model producing the English sources from our Vietnamese labels
+BACK_TRANSLATION_MODEL = "Helsinki-NLP/opus-mt-vi-en"
+
+# One label in this many (chosen by a hash of the image id, so the set is stable) is held out
+HOLDOUT_EVERY = 5
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Compare int8 dynamic-quantised and fp32 translation on a held-out set of our labels"
+    )
+    parser.add_argument("--labels", default="data/labels", help="JSON label folder")
+    parser.add_argument("--backend", choices=LABEL_BACKENDS, default=DEFAULT_LABEL_BACKEND, help="Label store backend")
+    parser.add_argument("--db", default=DEFAULT_LABEL_DB, help="SQLite database path")
+    parser.add_argument("--limit", type=int, default=200, help="Maximum number of held-out sentences")
+    parser.add_argument("--model", default=None, help="English to Vietnamese model (default TRANSLATION_MODEL)")
+    parser.add_argument("--back-model", default=BACK_TRANSLATION_MODEL,
+                        help="Vietnamese to English model used to create the English sources")
+    parser.add_argument("--threads", type=int, default=None, help="CPU threads used by torch")
+    parser.add_argument("--batch-size", type=int, default=None, help="Sentences per forward pass for throughput")
+    parser.add_argument("--latency-samples", type=int, default=50, help="Sentences translated one at a time for latency")
+    return parser.parse_args()
+
+def is_held_out(image_id):
+    """Check if a label belongs to the held-out set"""
+    return int(hashlib.sha1(image_id.encode('utf-8')).hexdigest(), 16) % HOLDOUT_EVERY == 0
+
+def held_out_sentences(label_store, limit):
+    """Return the Vietnamese questions and answers of the held-out labels, sorted by image id"""
+    sentences = []
+    for image_id, data in label_store.iter_labels():
+        if not is_held_out(image_id):
+            continue
+        for question in LabelRecord.from_dict(data, image_id).questions:
+            sentences.append(question.question)
+            sentences.extend(answer for answer in question.answers if answer != UNANSWERABLE_TEXT)
+    return [sentence for sentence in sentences if sentence][:limit]
+
+def model_megabytes(model):
+    """Return the serialised size of a model's weights in MB"""
+    import torch
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+def measure(translator, sources, latency_samples):
+    """Translate sources one by one for latency, then batched for throughput
+
+    Returns:
+        dict: Latencies (sorted ms), sentences per second and the batched translations
+    """
+    translator.translate(sources[:translator.batch_size])  # warm up kernels and caches
+
+    latencies = []
+    for source in sources[:latency_samples]:
+        started = time.perf_counter()
+        translator.translate([source], 1)
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+
+    started = time.perf_counter()
+    outputs = translator.translate(sources)
+    elapsed = time.perf_counter() - started
+    return {'latencies': latencies, 'throughput': len(sources) / elapsed, 'outputs': outputs}
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    args = parse_args()
+
+    label_store = create_label_store(args.backend, args.labels, args.db)
+    references = held_out_sentences(label_store, args.limit)
+    label_store.close()
+    if not references:
+        logger.error("No held-out labels to benchmark on")
+        sys.exit(1)
+    logger.info(f"Held out {len(references)} Vietnamese sentences (1 label in {HOLDOUT_EVERY})")
+
+    def create_translator(model, quantize=False):
+        return plugins.registry.create("translator", model_name=model, device="cpu", num_threads=args.threads,
+                                       quantize=quantize, batch_size=args.batch_size)
+
+    # Our labels are Vietnamese only, so the English sources are back-translations of them
+    try:
+        back_translator = create_translator(args.back_model)
+    except plugins.PluginUnavailable as e:
+        logger.error(str(e))
+        sys.exit(1)
+    sources = back_translator.translate(references)
+    del back_translator
+
+    results = {}
+    for name, quantize in (("fp32", False), ("int8", True)):
+        translator = create_translator(args.model, quantize)
+        result = measure(translator, sources, args.latency_samples)
+        result['size_mb'] = model_megabytes(translator.model)
+        result['bleu'] = corpus_bleu(result['outputs'], references)
+        results[name] = result
+        del translator
+
+    for name, result in results.items():
+        latencies = result['latencies']
+        logger.info(f"{name}: latency p50 {latencies[len(latencies) // 2]:.1f} ms, "
+                    f"p95 {latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)]:.1f} ms, "
+                    f"throughput {result['throughput']:.1f} sentences/s, weights {result['size_mb']:.0f} MB, "
+                    f"BLEU vs labels {result['bleu']:.1f}")
+
+    fp32, int8 = results['fp32'], results['int8']
+    agreement = corpus_bleu(int8['outputs'], fp32['outputs'])
+    identical = sum(a == b for a, b in zip(int8['outputs'], fp32['outputs']))
+    logger.info(f"int8 drift: BLEU {int8['bleu'] - fp32['bleu']:+.1f} vs labels, BLEU {agreement:.1f} against fp32 "
+                f"output, {identical}/{len(sources)} translations identical; "
+                f"speed-up {int8['throughput'] / fp32['throughput']:.2f}x")
@@ -0,0 +1,107 @@
+import sys
+import os
+import argparse
+import logging
+import shutil
+import tempfile
+import time
+
+# Add the src directory to the path to allow absolute imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.image_list import is_image_file
+from src.core.label_session import LabelSession, validate_question
+from src.core.label_store import create_label_store, copy_labels, JsonLabelStore, LABEL_BACKENDS
+from src.core.question_record import QuestionRecord
+
+logger = logging.getLogger(__name__)
+
+# Tag added by the simulated edit when an image has none
+BENCHMARK_TAG = "WATER_BOTTLE"
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Measure labelling throughput of LabelSession without a display"
+    )
+    parser.add_argument("--images", default="data/image", help="Image folder")
+    parser.add_argument("--labels", default="data/labels", help="JSON label folder copied into the benchmark store")
+    parser.add_argument("--backend", choices=LABEL_BACKENDS, default="json", help="Label store backend to measure")
+    parser.add_argument("--passes", type=int, default=3, help="Number of passes over the image list")
+    return parser.parse_args()
+
+def edit(label):
+    """Return the question a labeller would confirm for an image: the saved one with a changed text"""
+    if label is not None and label.questions:
+        question = label.questions[0]
+    else:
+        question = QuestionRecord.create(question="Có vật thể nào trong ảnh không?")
+    tags = question.tags or (BENCHMARK_TAG,)
+    return question.replace(question=question.question.rstrip('?') + "?", tags=tags)
+
+def percentile(values, fraction):
+    """Return the value below which the given fraction of sorted values fall"""
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+def run(session, passes):
+    """Open, edit, validate and save every image, timing each step
+
+    Returns:
+        dict: Step name -> sorted durations in milliseconds
+    """
+    timings = {'open': [], 'edit': [], 'save': []}
+    for _ in range(passes):
+        for index in range(len(session.image_files)):
+            started = time.perf_counter()
+            label = session.open(index)
+            opened = time.perf_counter()
+
+            question = edit(label)
+            image_source = label.image_source if label is not None else None
+            # The comparison the question form runs once a burst of edits is over
+            question.diff(label.questions[0] if label is not None and label.questions else QuestionRecord())
+            missing = validate_question(question)
+            edited = time.perf_counter()
+
+            if not missing:
+                session.save(question, image_source)
+            saved = time.perf_counter()
+
+            timings['open'].append((opened - started) * 1000)
+            timings['edit'].append((edited - opened) * 1000)
+            timings['save'].append((saved - edited) * 1000)
+    for values in timings.values():
+        values.sort()
+    return timings
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    args = parse_args()
+
+    names = sorted(name for name in os.listdir(args.images) if is_image_file(name))
+    if not names:
+        logger.error(f"No images found in {args.images}")
+        sys.exit(1)
+
+    # Work on a copy so the benchmark never touches the real labels
+    work_dir = tempfile.mkdtemp(prefix="label-session-")
+    try:
+        store = create_label_store(args.backend, os.path.join(work_dir, "labels"),
+                                   os.path.join(work_dir, "labels.sqlite3"))
+        copied = copy_labels(JsonLabelStore(args.labels), store)
+        session = LabelSession(store)
+        session.set_images(names)
+        logger.info(f"Benchmarking {len(names)} images ({copied} labeled) on the '{args.backend}' store, "
+                    f"{args.passes} passes")
+
+        started = time.perf_counter()
+        timings = run(session, args.passes)
+        elapsed = time.perf_counter() - started
+        store.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    count = len(names) * args.passes
+    logger.info(f"{count} images in {elapsed:.2f} s: {count / elapsed:.0f} images/s")
+    for step, values in timings.items():
+        logger.info(f"{step:>5}: mean {sum(values) / len(values):.3f} ms, "
+                    f"p50 {percentile(values, 0.5):.3f} ms, p95 {percentile(values, 0.95):.3f} ms")
@@ -0,0 +1,6 @@
+"""
+Core package for the Image Labelling Tool
+Contains label storage and indexing logic that does not depend on Qt widgets
+"""
+# Empty __init__.py to make the directory a package
+# Each module should be imported directly to avoid circular imports
@@ -0,0 +1,122 @@
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Default location of the draft journal
+DRAFT_JOURNAL_PATH = "data/drafts.jsonl"
+
+# Compact the journal once it holds this many records
+DRAFT_COMPACT_THRESHOLD = 500
+
+
+class DraftJournal:
+    """Append-only journal of unsaved edits, used to recover work after a crash
+
+    Every record is one JSON line holding the latest draft of an image, or a
+    null draft once the image has been saved or its edits discarded. Appending a
+    line is a single small write, so the journal can be updated on every burst
+    of edits. Replaying the file on startup gives the drafts that were never
+    saved. Once the journal grows past a threshold it is rewritten with only the
+    live drafts.
+    """
+
+    def __init__(self, path=DRAFT_JOURNAL_PATH, compact_threshold=DRAFT_COMPACT_THRESHOLD):
+        self.path = path
+        self.compact_threshold = compact_threshold
+        self._drafts = {}  # image id -> latest draft dict
+        self._records = 0
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._replay()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._terminate_torn_line()
+
+    def _replay(self):
+        """Rebuild the live drafts from the journal file"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn last line is expected if the app died mid-write
+                        logger.warning(f"Skipping unreadable draft journal line {line_number}")
+                        continue
+                    self._apply(record)
+                    self._records += 1
+        except FileNotFoundError:
+            return
+        logger.info(f"Replayed draft journal: {self._records} records, {len(self._drafts)} unsaved drafts")
+
+    def _terminate_torn_line(self):
+        """Start a fresh line if the last write was cut short, so new records stay readable"""
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) == b"\n":
+                return
+        self._file.write("\n")
+        self._file.flush()
+
+    def _apply(self, record):
+        image_id = record.get('image_id')
+        if image_id is None:
+            return
+        if record.get('draft') is None:
+            self._drafts.pop(image_id, None)
+        else:
+            self._drafts[image_id] = record['draft']
+
+    def _append(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._apply(record)
+        self._records += 1
+        if self._records >= self.compact_threshold and self._records > 2 * len(self._drafts):
+            self.compact()
+
+    def record(self, image_id, draft):
+        """Store the latest unsaved edits of an image"""
+        if self._drafts.get(image_id) == draft:
+            return
+        self._append({'image_id': image_id, 'draft': draft})
+
+    def discard(self, image_id):
+        """Forget the draft of an image once it was saved or its edits were dropped"""
+        if image_id in self._drafts:
+            self._append({'image_id': image_id, 'draft': None})
+
+    def discard_all(self):
+        """Forget every draft"""
+        self._drafts.clear()
+        self.compact()
+
+    def pending(self):
+        """Return a dict of image id -> draft for every unsaved draft"""
+        return dict(self._drafts)
+
+    def compact(self):
+        """Rewrite the journal with only the live drafts"""
+        self._file.close()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for image_id, draft in self._drafts.items():
+                f.write(json.dumps({'image_id': image_id, 'draft': draft}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._records = len(self._drafts)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        logger.info(f"Compacted draft journal to {self._records} records")
+
+    def close(self):
+        """Close the journal file"""
+        self._file.close()
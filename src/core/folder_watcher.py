@@ -0,0 +1,125 @@
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+
+logger = logging.getLogger(__name__)
+
+# inotify flags, from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# A file counts as added once it is fully written or renamed into the folder,
+# and as removed when it is deleted or renamed away
+ADDED_MASK = IN_CLOSE_WRITE | IN_MOVED_TO
+REMOVED_MASK = IN_DELETE | IN_MOVED_FROM
+WATCH_MASK = ADDED_MASK | REMOVED_MASK | IN_ONLYDIR
+
+# struct inotify_event header: int wd, uint32 mask, uint32 cookie, uint32 len
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Enough for a few hundred events per read
+_READ_SIZE = 64 * 1024
+
+
+def _load_libc():
+    if not hasattr(os, 'O_DIRECTORY'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+_libc = _load_libc()
+
+
+def is_supported():
+    """Check if inotify is available on this platform"""
+    return _libc is not None
+
+
+class FolderWatcher:
+    """Report files added to or removed from a set of folders, using inotify
+
+    The kernel delivers the name of each changed entry, so changes can be
+    applied incrementally without listing the folder again. The watcher does
+    not block: callers poll read_events() when fileno() becomes readable.
+    """
+
+    def __init__(self):
+        if _libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        self._fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._folders = {}  # watch descriptor -> folder
+        self.overflowed = False
+
+    def fileno(self):
+        return self._fd
+
+    def add_folder(self, folder):
+        """Start watching a folder (not recursive)"""
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(folder), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), folder)
+        self._folders[wd] = folder
+        logger.info(f"Watching {folder} for changes")
+
+    def read_events(self):
+        """Return the pending changes as a list of (folder, file name, added)
+
+        added is True for new or rewritten files and False for removed ones.
+        Sets overflowed if the kernel queue overflowed and events were lost.
+        """
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+
+                if mask & IN_Q_OVERFLOW:
+                    logger.warning("inotify event queue overflowed, some changes were lost")
+                    self.overflowed = True
+                    continue
+                if mask & IN_IGNORED:
+                    folder = self._folders.pop(wd, None)
+                    logger.warning(f"Stopped watching {folder}, it was removed or unmounted")
+                    continue
+                folder = self._folders.get(wd)
+                if folder is None or not name:
+                    continue
+                events.append((folder, os.fsdecode(name), bool(mask & ADDED_MASK)))
+        return events
+
+    def close(self):
+        """Stop watching every folder"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._folders.clear()
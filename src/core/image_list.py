@@ -0,0 +1,103 @@
+import json
+import logging
+import os
+from bisect import bisect_left, bisect_right
+
+logger = logging.getLogger(__name__)
+
+# File extensions recognised as images
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Default location of the persisted image list
+IMAGE_LIST_CACHE_PATH = ".cache/image_list.json"
+
+# The first batch is small so the first image shows up quickly; later batches
+# grow so merging them into the sorted list stays cheap on huge folders
+FIRST_BATCH_SIZE = 256
+MAX_BATCH_SIZE = 65536
+
+
+def is_image_file(name):
+    """Check if a file name has one of the supported image extensions"""
+    return name.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def folder_mtime_ns(folder):
+    """Return the folder's mtime - it changes whenever an entry is added, removed or renamed"""
+    return os.stat(folder).st_mtime_ns
+
+
+def scan_images(folder, first_batch_size=FIRST_BATCH_SIZE, max_batch_size=MAX_BATCH_SIZE):
+    """Yield the image file names of a folder in batches, in directory order
+
+    Uses os.scandir, which reads names without stat'ing each file.
+    """
+    batch = []
+    batch_size = first_batch_size
+    with os.scandir(folder) as it:
+        for entry in it:
+            if is_image_file(entry.name):
+                batch.append(entry.name)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                    batch_size = min(batch_size * 2, max_batch_size)
+    if batch:
+        yield batch
+
+
+def merge_sorted(names, new_names):
+    """Return the sorted list names with the sorted list new_names merged in
+
+    Both inputs are sorted runs, so this is a linear merge inside the C sort.
+    """
+    return sorted(names + new_names)
+
+
+def next_name_after(sorted_names, name):
+    """Return the first entry of sorted_names that sorts after name, or None"""
+    pos = bisect_right(sorted_names, name)
+    return sorted_names[pos] if pos < len(sorted_names) else None
+
+
+def previous_name_before(sorted_names, name):
+    """Return the last entry of sorted_names that sorts before name, or None"""
+    pos = bisect_left(sorted_names, name)
+    return sorted_names[pos - 1] if pos > 0 else None
+
+
+class ImageListCache:
+    """Persisted sorted image list of a folder
+
+    Stored together with the folder's mtime, so a later start can tell whether
+    the folder changed since the list was written and skip the scan if not.
+    """
+
+    def __init__(self, path=IMAGE_LIST_CACHE_PATH):
+        self.path = path
+
+    def load(self, folder):
+        """Return (sorted names, folder mtime_ns) saved for the folder, or None"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable image list cache {self.path}: {str(e)}")
+            return None
+
+        if data.get('folder') != os.path.abspath(folder):
+            return None
+        return data.get('names', []), data.get('mtime_ns')
+
+    def save(self, folder, names, mtime_ns):
+        """Persist the sorted names of the folder and the mtime they were scanned at"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'folder': os.path.abspath(folder), 'mtime_ns': mtime_ns, 'names': names}, f)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved image list cache with {len(names)} images")
@@ -0,0 +1,106 @@
+import logging
+import time
+
+from src.core.question_record import LabelRecord, DRAFT_KEY
+
+logger = logging.getLogger(__name__)
+
+# Label fields that can be filtered on; image_source and needs_review are per label, the others per question
+FACET_FIELDS = ('tags', 'question_type', 'answerable', 'qa_source', 'image_source', 'needs_review')
+
+
+def label_facets(data):
+    """Return a dict of field -> set of values found in a label document
+
+    Values are read through LabelRecord, so they are normalised exactly as in
+    the question form ("0" is not answerable, question type spellings merge).
+    """
+    facets = {field: set() for field in FACET_FIELDS}
+    record = LabelRecord.from_dict(data)
+    facets['image_source'].add(record.image_source)
+    facets['needs_review'].add(int(bool(data.get(DRAFT_KEY))))
+    for question in record.questions:
+        facets['tags'].update(question.tags)
+        facets['question_type'].add(question.question_type)
+        facets['answerable'].add(int(question.answerable))
+        facets['qa_source'].add(question.qa_source)
+    return facets
+
+
+class FacetIndex:
+    """Inverted index from label field values to the images that have them
+
+    For every field in FACET_FIELDS it maps each value to the set of image ids
+    whose label contains it, so a combination of filters is answered by
+    intersecting a few sets. The values of each image are remembered too, so a
+    saved label can be re-indexed without rebuilding.
+    """
+
+    def __init__(self):
+        self._postings = {field: {} for field in FACET_FIELDS}  # field -> value -> set of image ids
+        self._facets = {}  # image id -> facets of its label
+
+    def build(self, label_store):
+        """Index every label in the store in a single pass"""
+        started = time.perf_counter()
+        for image_id, data in label_store.iter_labels():
+            self.update(image_id, data)
+        logger.info(f"Built facet index over {len(self._facets)} labels in "
+                    f"{(time.perf_counter() - started) * 1000:.1f} ms")
+
+    def update(self, image_id, data):
+        """Index the label of an image, replacing what was indexed for it before"""
+        self.remove(image_id)
+        facets = label_facets(data)
+        for field, values in facets.items():
+            postings = self._postings[field]
+            for value in values:
+                postings.setdefault(value, set()).add(image_id)
+        self._facets[image_id] = facets
+
+    def remove(self, image_id):
+        """Drop an image from the index"""
+        facets = self._facets.pop(image_id, None)
+        if facets is None:
+            return
+        for field, values in facets.items():
+            postings = self._postings[field]
+            for value in values:
+                ids = postings.get(value)
+                if ids is None:
+                    continue
+                ids.discard(image_id)
+                if not ids:
+                    del postings[value]
+
+    def values(self, field):
+        """Return [(value, number of images)] for a field, sorted by value"""
+        return sorted(
+            ((value, len(ids)) for value, ids in self._postings[field].items()),
+            key=lambda item: str(item[0])
+        )
+
+    def counts(self, field):
+        """Return {value: number of images} for a field"""
+        return {value: len(ids) for value, ids in self._postings[field].items()}
+
+    def match(self, filters):
+        """Return the set of image ids matching every field -> value filter"""
+        result = None
+        # Start from the smallest posting list so the intersection stays small
+        for field, value in sorted(filters.items(), key=lambda item: len(self._postings[item[0]].get(item[1], ()))):
+            ids = self._postings[field].get(value, set())
+            result = set(ids) if result is None else result & ids
+            if not result:
+                break
+        return result if result is not None else set(self._facets)
+
+    def matches(self, image_id, filters):
+        """Check if a single image matches every filter"""
+        facets = self._facets.get(image_id)
+        if facets is None:
+            return False
+        return all(value in facets[field] for field, value in filters.items())
+
+    def __len__(self):
+        return len(self._facets)
@@ -0,0 +1,122 @@
+import logging
+import time
+from bisect import bisect_left
+
+from src.core.image_list import next_name_after, previous_name_before
+
+logger = logging.getLogger(__name__)
+
+
+class LabelIndex:
+    """In-memory index of labeled images
+
+    Maps image id (the image file name without extension) to the modification
+    time of its label. The label store is scanned once at startup and the index
+    is kept up to date on save, so status checks never touch the file system.
+    """
+
+    def __init__(self, label_store):
+        self.label_store = label_store
+        self._mtimes = {}  # image id -> label mtime
+
+    def build(self):
+        """Scan the label store once and rebuild the index"""
+        started = time.perf_counter()
+        mtimes = self.label_store.scan()
+        self._mtimes = mtimes
+        logger.info(f"Built label index: {len(mtimes)} labeled images in "
+                    f"{(time.perf_counter() - started) * 1000:.1f} ms")
+
+    def is_labeled(self, image_id):
+        """Check if the image has a saved label"""
+        return image_id in self._mtimes
+
+    def label_mtime(self, image_id):
+        """Return the mtime of the image's label, or None if it is unlabeled"""
+        return self._mtimes.get(image_id)
+
+    def mark_saved(self, image_id, mtime=None):
+        """Record that a label was saved for the image"""
+        self._mtimes[image_id] = mtime if mtime is not None else time.time()
+
+    def remove(self, image_id):
+        """Record that the image's label no longer exists"""
+        self._mtimes.pop(image_id, None)
+
+    def labeled_ids(self):
+        """Return the ids of all labeled images"""
+        return self._mtimes.keys()
+
+    def __len__(self):
+        return len(self._mtimes)
+
+
+class UnlabeledIndex:
+    """Sorted file names of the images that are still unlabeled
+
+    Kept in step with the image list and the label index, so the next or
+    previous unlabeled image is found with a binary search instead of walking
+    (and loading) every image in between.
+    """
+
+    def __init__(self):
+        self._names = {}  # image id -> image file name
+        self._unlabeled = []  # sorted file names of unlabeled images
+
+    @staticmethod
+    def image_id(name):
+        """Return the image id of an image file name"""
+        return name.rsplit('.', 1)[0]
+
+    def rebuild(self, image_files, label_index):
+        """Rebuild from the sorted image list"""
+        self._names = {self.image_id(name): name for name in image_files}
+        self._unlabeled = [name for name in image_files if not label_index.is_labeled(self.image_id(name))]
+
+    def add_images(self, names, label_index):
+        """Add a sorted batch of new image file names"""
+        for name in names:
+            self._names[self.image_id(name)] = name
+        new_unlabeled = [name for name in names if not label_index.is_labeled(self.image_id(name))]
+        if new_unlabeled:
+            # Both lists are sorted, so this is a linear merge
+            self._unlabeled = sorted(self._unlabeled + new_unlabeled)
+
+    def remove_images(self, names):
+        """Forget image file names that no longer exist"""
+        gone = set(names)
+        for name in gone:
+            self._names.pop(self.image_id(name), None)
+        self._unlabeled = [name for name in self._unlabeled if name not in gone]
+
+    def set_labeled(self, image_id, labeled):
+        """Record a change in the labeled status of an image"""
+        name = self._names.get(image_id)
+        if name is None:
+            return
+        pos = bisect_left(self._unlabeled, name)
+        present = pos < len(self._unlabeled) and self._unlabeled[pos] == name
+        if labeled and present:
+            del self._unlabeled[pos]
+        elif not labeled and not present:
+            self._unlabeled.insert(pos, name)
+
+    def name_for(self, image_id):
+        """Return the image file name of an image id, or None if there is no such image"""
+        return self._names.get(image_id)
+
+    def next_after(self, name):
+        """Return the first unlabeled file name sorting after name, or None"""
+        return next_name_after(self._unlabeled, name)
+
+    def previous_before(self, name):
+        """Return the last unlabeled file name sorting before name, or None"""
+        return previous_name_before(self._unlabeled, name)
+
+    def names_from(self, name, count):
+        """Return up to count unlabeled file names sorting at or after name"""
+        start = bisect_left(self._unlabeled, name)
+        return self._unlabeled[start:start + count]
+
+    def __len__(self):
+        return len(self._unlabeled)
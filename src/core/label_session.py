@@ -0,0 +1,212 @@
+import logging
+from bisect import bisect_left
+
+from src.core.image_list import merge_sorted
+from src.core.label_index import LabelIndex, UnlabeledIndex
+from src.core.question_record import LabelRecord, normalize_source, DEFAULT_IMAGE_SOURCE
+
+logger = logging.getLogger(__name__)
+
+
+def validate_question(question):
+    """Return the required fields a question is missing before it can be confirmed
+
+    A confirmed question needs its text and at least one tag; an answerable
+    question also needs an answer.
+
+    Args:
+        question: QuestionRecord to check
+
+    Returns:
+        list: Names of the missing fields ('question', 'tags', 'answers'), empty if valid
+    """
+    missing = []
+    if not question.question:
+        missing.append('question')
+    if not question.tags:
+        missing.append('tags')
+    if question.answerable and not question.answer:
+        missing.append('answers')
+    return missing
+
+
+class LabelSession:
+    """Labelling state of an image folder, independent of any widget
+
+    Owns the sorted image list, the current image, the label it was opened
+    with and the save pipeline. The main window is a view over a session, and
+    batch tools and benchmarks drive the same session without a display.
+
+    Labels are handed to save_label(image_id, label) - the background
+    LabelWriter in the UI, or a synchronous write to the label store by default.
+    Detecting edits is left to the question form, which compares its fields
+    against the opened question as they change.
+    """
+
+    def __init__(self, label_store, label_index=None, save_label=None):
+        self.label_store = label_store
+        if label_index is None:
+            label_index = LabelIndex(label_store)
+            label_index.build()
+        self.label_index = label_index
+        # Sorted unlabeled images, for jumping straight to the remaining work
+        self.unlabeled_index = UnlabeledIndex()
+        self.save_label = save_label if save_label is not None else self._write_label
+
+        self.image_files = []
+        self._image_file_set = set()
+        self.current_index = 0
+        self.original = None  # LabelRecord the current image was opened with or last saved as, None if unlabeled
+
+    def _write_label(self, image_id, label):
+        """Write a label to the label store on the calling thread"""
+        mtime = self.label_store.save(image_id, label.to_dict())
+        self.label_index.mark_saved(image_id, mtime)
+
+    # Image list
+
+    def set_images(self, names):
+        """Replace the image list with a sorted list of file names"""
+        self.image_files = list(names)
+        self._image_file_set = set(self.image_files)
+        self.unlabeled_index.rebuild(self.image_files, self.label_index)
+        self.current_index = min(self.current_index, max(len(self.image_files) - 1, 0))
+
+    def merge_images(self, names):
+        """Merge a sorted batch of image names into the list, keeping the current image selected
+
+        Returns:
+            list: The names that were not listed yet
+        """
+        new_names = [name for name in names if name not in self._image_file_set]
+        if not new_names:
+            return new_names
+        current_name = self.current_name
+        self._image_file_set.update(new_names)
+        self.image_files = merge_sorted(self.image_files, new_names)
+        self.unlabeled_index.add_images(new_names, self.label_index)
+        if current_name is not None:
+            self.current_index = bisect_left(self.image_files, current_name)
+        return new_names
+
+    def remove_images(self, names):
+        """Drop image names from the list, keeping the current image selected if it still exists
+
+        If the current image is removed, its neighbour becomes current.
+
+        Returns:
+            set: The names that were listed and are now gone
+        """
+        gone = self._image_file_set.intersection(names)
+        if not gone:
+            return gone
+        current_name = self.current_name
+        self._image_file_set -= gone
+        self.image_files = [name for name in self.image_files if name not in gone]
+        self.unlabeled_index.remove_images(gone)
+        if current_name not in gone:
+            self.current_index = bisect_left(self.image_files, current_name)
+        else:
+            self.current_index = min(self.current_index, max(len(self.image_files) - 1, 0))
+        return gone
+
+    def index_of(self, name):
+        """Return the position of an image file name in the sorted list"""
+        return bisect_left(self.image_files, name)
+
+    @property
+    def current_name(self):
+        """File name of the current image, or None if the list is empty"""
+        return self.image_files[self.current_index] if self.image_files else None
+
+    @property
+    def current_image_id(self):
+        """Id (file name without extension) of the current image, or None if the list is empty"""
+        name = self.current_name
+        return UnlabeledIndex.image_id(name) if name is not None else None
+
+    # Labeled status
+
+    def is_labeled(self, image_id=None):
+        """Check if an image (the current one by default) has a saved label"""
+        return self.label_index.is_labeled(image_id if image_id is not None else self.current_image_id)
+
+    def mark_labeled(self, image_id, mtime=None):
+        """Record that the image has a saved label"""
+        self.label_index.mark_saved(image_id, mtime)
+        self.unlabeled_index.set_labeled(image_id, True)
+
+    def mark_unlabeled(self, image_id):
+        """Record that the image has no label"""
+        self.label_index.remove(image_id)
+        self.unlabeled_index.set_labeled(image_id, False)
+
+    def next_unlabeled_index(self):
+        """Return the index of the next unlabeled image after the current one, or None"""
+        name = self.unlabeled_index.next_after(self.current_name)
+        return self.index_of(name) if name is not None else None
+
+    def upcoming_unlabeled(self, count):
+        """Return up to count unlabeled image names, starting with the current image"""
+        if not self.image_files:
+            return []
+        return self.unlabeled_index.names_from(self.current_name, count)
+
+    def previous_unlabeled_index(self):
+        """Return the index of the previous unlabeled image before the current one, or None"""
+        name = self.unlabeled_index.previous_before(self.current_name)
+        return self.index_of(name) if name is not None else None
+
+    # Current label
+
+    def open(self, index=None):
+        """Make an image current and load its label
+
+        The label is kept as the original that edits are compared against.
+
+        Args:
+            index: Position in the image list, the current image by default
+
+        Returns:
+            LabelRecord: The saved label, or None if the image is unlabeled
+
+        Raises:
+            FileNotFoundError: If the label index lists a label the store no longer has
+            ValueError: If the stored label is not valid JSON
+        """
+        if index is not None:
+            self.current_index = index
+        self.original = None
+        image_id = self.current_image_id
+        if image_id is None or not self.label_index.is_labeled(image_id):
+            return None
+        data = self.label_store.load(image_id)
+        if data is None:
+            raise FileNotFoundError(f"Label for {image_id} disappeared from the label store")
+        # The record renames legacy values such as 'self_collected' and
+        # normalises the answers, so views get one canonical format
+        self.original = LabelRecord.from_dict(data, image_id)
+        return self.original
+
+    def build_label(self, question, image_source):
+        """Return the label of the current image with an edited question and image source"""
+        return LabelRecord(
+            image_id=self.current_image_id,
+            image_source=normalize_source(image_source, DEFAULT_IMAGE_SOURCE),
+            questions=(question,),
+        )
+
+    def save(self, question, image_source):
+        """Save an edited question as the label of the current image
+
+        The label is handed to save_label and the image is marked labeled right
+        away; a background writer reports failed writes on its own.
+
+        Returns:
+            LabelRecord: The saved label, which becomes the new original
+        """
+        label = self.build_label(question, image_source)
+        self.save_label(label.image_id, label)
+        self.mark_labeled(label.image_id, self.label_index.label_mtime(label.image_id))
+        self.original = label
+        return label
@@ -0,0 +1,347 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Available storage backends
+LABEL_BACKENDS = ("json", "sqlite")
+
+# Backend used by the application, overridable through the environment
+DEFAULT_LABEL_BACKEND = os.environ.get("LABEL_STORE_BACKEND", "json")
+
+# Default location of the SQLite database
+DEFAULT_LABEL_DB = "data/labels.sqlite3"
+
+
+def format_label(data):
+    """Serialise a label document exactly like the per-file JSON format"""
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class LabelStore:
+    """Base class for label storage backends
+
+    A label is the document saved for one image (image_id, image_source and
+    questions). Backends store the serialised JSON text as-is, so moving labels
+    between backends is lossless.
+    """
+
+    def load_text(self, image_id):
+        """Return the serialised label of the image, or None if it is unlabeled"""
+        raise NotImplementedError
+
+    def save_text(self, image_id, text):
+        """Store a serialised label and return its modification time"""
+        raise NotImplementedError
+
+    def delete(self, image_id):
+        """Remove the label of the image if it exists"""
+        raise NotImplementedError
+
+    def scan(self):
+        """Return a dict mapping every labeled image id to its label modification time"""
+        raise NotImplementedError
+
+    def iter_texts(self):
+        """Yield (image_id, serialised label) for every label, sorted by image id"""
+        raise NotImplementedError
+
+    def release(self):
+        """Release what the calling thread opened, e.g. at the end of a worker thread"""
+
+    def close(self):
+        """Release any resources held by the backend, for all threads"""
+
+    def load(self, image_id):
+        """Return the label of the image as a dict, or None if it is unlabeled"""
+        text = self.load_text(image_id)
+        return json.loads(text) if text is not None else None
+
+    def save(self, image_id, data):
+        """Store a label document and return its modification time"""
+        return self.save_text(image_id, format_label(data))
+
+    def iter_labels(self):
+        """Yield (image_id, label dict) for every label"""
+        for image_id, text in self.iter_texts():
+            try:
+                yield image_id, json.loads(text)
+            except ValueError as e:
+                logger.error(f"Skipping malformed label {image_id}: {str(e)}")
+
+
+class JsonLabelStore(LabelStore):
+    """One JSON file per image in a folder - the original data/labels layout"""
+
+    def __init__(self, label_folder):
+        self.label_folder = label_folder
+        os.makedirs(self.label_folder, exist_ok=True)
+
+    def path_for(self, image_id):
+        """Return the label file path of the image"""
+        return os.path.join(self.label_folder, f"{image_id}.json")
+
+    def load_text(self, image_id):
+        try:
+            with open(self.path_for(image_id), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def save_text(self, image_id, text):
+        """Write the label atomically: temp file, fsync, then rename over the old file
+
+        Readers therefore see either the previous label or the new one, never a
+        partially written file, even if the process dies mid-write.
+        """
+        path = self.path_for(image_id)
+        tmp_path = os.path.join(self.label_folder, f".{image_id}.json.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._fsync_folder()
+        return os.path.getmtime(path)
+
+    def _fsync_folder(self):
+        """Persist the rename itself - not supported on every platform"""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        try:
+            fd = os.open(self.label_folder, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def delete(self, image_id):
+        try:
+            os.remove(self.path_for(image_id))
+        except FileNotFoundError:
+            pass
+
+    def scan(self):
+        mtimes = {}
+        try:
+            with os.scandir(self.label_folder) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith('.json'):
+                        mtimes[entry.name[:-len('.json')]] = entry.stat().st_mtime
+        except FileNotFoundError:
+            logger.warning(f"Label folder {self.label_folder} does not exist")
+        return mtimes
+
+    def iter_texts(self):
+        for image_id in sorted(self.scan()):
+            text = self.load_text(image_id)
+            if text is not None:
+                yield image_id, text
+
+
+class SqliteLabelStore(LabelStore):
+    """All labels in one SQLite database in WAL mode
+
+    The full document is kept in the labels table; the question fields used for
+    filtering (question_type, answerable, qa_source and tags) are denormalised
+    into indexed tables. Each thread gets its own connection, and WAL lets
+    readers run concurrently with a writer.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS labels (
+            image_id TEXT PRIMARY KEY,
+            image_source TEXT,
+            document TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS questions (
+            image_id TEXT NOT NULL REFERENCES labels(image_id) ON DELETE CASCADE,
+            question_id INTEGER NOT NULL,
+            question_type TEXT,
+            answerable INTEGER,
+            qa_source TEXT,
+            PRIMARY KEY (image_id, question_id)
+        );
+        CREATE TABLE IF NOT EXISTS question_tags (
+            image_id TEXT NOT NULL REFERENCES labels(image_id) ON DELETE CASCADE,
+            question_id INTEGER NOT NULL,
+            tag TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_questions_type ON questions(question_type);
+        CREATE INDEX IF NOT EXISTS idx_questions_answerable ON questions(answerable);
+        CREATE INDEX IF NOT EXISTS idx_questions_qa_source ON questions(qa_source);
+        CREATE INDEX IF NOT EXISTS idx_question_tags_tag ON question_tags(tag);
+        CREATE INDEX IF NOT EXISTS idx_question_tags_image ON question_tags(image_id);
+    """
+
+    def __init__(self, db_path=DEFAULT_LABEL_DB):
+        self.db_path = db_path
+        self._local = threading.local()
+        # Every open connection, so close() can close those of the writer and index threads too.
+        # A thread whose connection is no longer in the set opens a new one
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(self.SCHEMA)
+
+    def _connection(self):
+        """Return this thread's connection, opening it on first use"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or connection not in self._connections:
+            # Used only by this thread, but closed by whichever thread calls close()
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.add(connection)
+        return connection
+
+    def load_text(self, image_id):
+        row = self._connection().execute(
+            "SELECT document FROM labels WHERE image_id = ?", (image_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def save_text(self, image_id, text):
+        data = json.loads(text)
+        updated_at = time.time()
+        connection = self._connection()
+        with connection:
+            self._write(connection, image_id, text, data, updated_at)
+        return updated_at
+
+    def save_many(self, items):
+        """Store many (image_id, serialised label) pairs in a single transaction
+
+        Malformed labels are logged and skipped, like in iter_labels, so one bad
+        file does not roll back the whole import.
+        """
+        connection = self._connection()
+        updated_at = time.time()
+        count = 0
+        skipped = []
+        with connection:
+            for image_id, text in items:
+                try:
+                    data = json.loads(text)
+                except ValueError as e:
+                    logger.error(f"Skipping malformed label {image_id}: {str(e)}")
+                    skipped.append(image_id)
+                    continue
+                self._write(connection, image_id, text, data, updated_at)
+                count += 1
+        if skipped:
+            logger.warning(f"Skipped {len(skipped)} malformed labels: {', '.join(skipped)}")
+        return count
+
+    @staticmethod
+    def _write(connection, image_id, text, data, updated_at):
+        connection.execute(
+            "INSERT OR REPLACE INTO labels (image_id, image_source, document, updated_at) VALUES (?, ?, ?, ?)",
+            (image_id, data.get('image_source'), text, updated_at)
+        )
+        connection.execute("DELETE FROM questions WHERE image_id = ?", (image_id,))
+        connection.execute("DELETE FROM question_tags WHERE image_id = ?", (image_id,))
+        for question in data.get('questions', []):
+            question_id = question.get('question_id', 1)
+            connection.execute(
+                "INSERT OR REPLACE INTO questions (image_id, question_id, question_type, answerable, qa_source) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (image_id, question_id, question.get('question_type'),
+                 question.get('answerable'), question.get('qa_source', question.get('source')))
+            )
+            connection.executemany(
+                "INSERT INTO question_tags (image_id, question_id, tag) VALUES (?, ?, ?)",
+                [(image_id, question_id, tag) for tag in question.get('tags', [])]
+            )
+
+    def delete(self, image_id):
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM labels WHERE image_id = ?", (image_id,))
+
+    def scan(self):
+        return dict(self._connection().execute("SELECT image_id, updated_at FROM labels"))
+
+    def iter_texts(self):
+        cursor = self._connection().execute("SELECT image_id, document FROM labels ORDER BY image_id")
+        for image_id, text in cursor:
+            yield image_id, text
+
+    def release(self):
+        """Close the calling thread's connection; other threads keep theirs"""
+        connection = getattr(self._local, 'connection', None)
+        self._local.connection = None
+        if connection is None:
+            return
+        with self._connections_lock:
+            if connection not in self._connections:
+                return
+            self._connections.discard(connection)
+        connection.close()
+
+    def close(self):
+        """Checkpoint the WAL into the database and close the connections of all threads
+
+        Call it once, on exit, after the threads using the store have finished;
+        worker threads call release() instead.
+        """
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections = set()
+        if connections:
+            try:
+                connections[0].execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning(f"Could not checkpoint {self.db_path}: {str(e)}")
+        for connection in connections:
+            connection.close()
+        self._local.connection = None
+
+
+def create_label_store(backend=DEFAULT_LABEL_BACKEND, label_folder="data/labels", db_path=DEFAULT_LABEL_DB):
+    """Create the label store for the given backend name"""
+    if backend == "json":
+        return JsonLabelStore(label_folder)
+    if backend == "sqlite":
+        return SqliteLabelStore(db_path)
+    raise ValueError(f"Unknown label backend '{backend}', expected one of {LABEL_BACKENDS}")
+
+
+def copy_labels(source, target):
+    """Copy every label from source to target unchanged
+
+    Used both to import per-file JSON labels into SQLite and to export them back,
+    so downstream tooling that reads data/labels keeps working.
+
+    Returns:
+        int: Number of labels copied
+    """
+    if isinstance(target, SqliteLabelStore):
+        return target.save_many(source.iter_texts())
+
+    count = 0
+    for image_id, text in source.iter_texts():
+        target.save_text(image_id, text)
+        count += 1
+    return count
@@ -0,0 +1,81 @@
+import atexit
+import gzip
+import logging
+import os
+import queue
+import shutil
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Folder and file name of the application log
+LOG_DIR = "logs"
+LOG_FILE = "app.log"
+
+# Rotate the log once it reaches this size, keeping this many compressed old logs
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Names accepted by the --log-level switch
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+
+def _gzip_namer(name):
+    """Name rotated logs app.log.1.gz, app.log.2.gz, ..."""
+    return name + ".gz"
+
+
+def _gzip_rotator(source, dest):
+    """Compress the log being rotated out into dest"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def create_file_handler(path, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT):
+    """Return a size-rotated file handler that gzips the logs it rotates out"""
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                  encoding='utf-8', delay=True)
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
+
+def setup_logging(level=logging.INFO, log_dir=LOG_DIR, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT):
+    """Route all logging through a queue to a background thread that writes the log
+
+    Calls on the GUI thread only put the record on a queue. The listener thread
+    writes it to the console and to a rotating, compressed file, so slow disks
+    never stall the UI. Records below level are dropped before they are queued,
+    but an f-string message is still built by the caller - guard costly debug
+    messages on hot paths with logger.isEnabledFor(logging.DEBUG).
+
+    Args:
+        level: Minimum level that is logged, e.g. logging.DEBUG for per-edit diagnostics
+        log_dir: Folder of the log file
+        max_bytes: Size at which the log file is rotated
+        backup_count: Number of compressed old logs kept
+
+    Returns:
+        QueueListener: The started listener; it is stopped, flushing the queue, at exit
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    file_handler = create_file_handler(os.path.join(log_dir, LOG_FILE), max_bytes, backup_count)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
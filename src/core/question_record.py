@@ -0,0 +1,181 @@
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+# Answer stored for questions that cannot be answered from the image
+UNANSWERABLE_TEXT = "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh"
+
+# Question types, as written to label files
+QUESTION_TYPES = [
+    "Existence Checking",
+    "Others"
+]
+
+# Old values that are read under their current name
+LEGACY_VALUES = {'self_collected': 'manually_collected'}
+
+# Sources used when a new question or label does not say otherwise
+DEFAULT_QA_SOURCE = 'manually_annotated'
+DEFAULT_IMAGE_SOURCE = 'manually_collected'
+
+# Image source of label files written before the field existed
+MISSING_IMAGE_SOURCE = 'image_crowdsourcing'
+
+# Key of a label document written by a tool and not yet confirmed by an annotator;
+# LabelRecord.to_dict never writes it, so saving from the form clears it
+DRAFT_KEY = 'draft'
+
+# Fields of a question that are compared by QuestionRecord.diff
+QUESTION_FIELDS = ('question', 'question_type', 'answerable', 'answers', 'tags', 'qa_source')
+
+
+def normalize_source(value, default):
+    """Return a QA or image source under its current name, or default if unset"""
+    if not value:
+        return default
+    return LEGACY_VALUES.get(value, value)
+
+
+def normalize_question_type(value):
+    """Map a stored question type ("existence_checking", "Existence Checking") to its QUESTION_TYPES name"""
+    if not value:
+        return QUESTION_TYPES[0]
+    key = str(value).strip().lower().replace('_', ' ')
+    for question_type in QUESTION_TYPES:
+        if question_type.lower() == key:
+            return question_type
+    return str(value)
+
+
+def _parse_answerable(value):
+    """Interpret the answerable field of old and new label files (0/1, bool or string)"""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes')
+    return bool(value)
+
+
+def _answer_texts(answers):
+    """Return the non-empty answer strings of a list of strings or answer_text objects"""
+    texts = []
+    for answer in answers or ():
+        if isinstance(answer, dict):
+            answer = answer.get('answer_text', '')
+        answer = str(answer).strip()
+        if answer:
+            texts.append(answer)
+    return tuple(texts)
+
+
+@dataclass(frozen=True)
+class QuestionRecord:
+    """One question of a label in its canonical form
+
+    Records are immutable and compare by value, so the loaded question can be
+    kept as the original without copying it. Text is stripped, legacy source
+    values are renamed and answers is always a tuple of strings: the answer
+    typed for an answerable question (empty if none yet), or UNANSWERABLE_TEXT.
+    """
+
+    question: str = ''
+    question_type: str = QUESTION_TYPES[0]
+    answerable: bool = False
+    answers: tuple = (UNANSWERABLE_TEXT,)
+    tags: tuple = ()
+    qa_source: str = DEFAULT_QA_SOURCE
+    question_id: int = 1
+
+    @classmethod
+    def create(cls, question='', question_type=None, answerable=False, answer='',
+               tags=(), qa_source=None, question_id=1):
+        """Build a record from form values, e.g. the widgets of the question editor"""
+        answer = answer.strip()
+        if not answerable:
+            answers = (UNANSWERABLE_TEXT,)
+        else:
+            answers = (answer,) if answer else ()
+        return cls(
+            question=question.strip(),
+            question_type=normalize_question_type(question_type),
+            answerable=bool(answerable),
+            answers=answers,
+            tags=tuple(tags),
+            qa_source=normalize_source(qa_source, DEFAULT_QA_SOURCE),
+            question_id=question_id,
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a question of a label file, in any of its historical formats"""
+        answerable = _parse_answerable(data.get('answerable', 0))
+        answers = _answer_texts(data.get('answers')) if answerable else (UNANSWERABLE_TEXT,)
+        return cls(
+            question=str(data.get('question', '')).strip(),
+            question_type=normalize_question_type(data.get('question_type')),
+            answerable=answerable,
+            answers=answers,
+            tags=tuple(data.get('tags', ())),
+            qa_source=normalize_source(data.get('qa_source', data.get('source')), DEFAULT_QA_SOURCE),
+            question_id=data.get('question_id', 1),
+        )
+
+    def to_dict(self):
+        """Return the question in label file format, with the fields in file order"""
+        return OrderedDict([
+            ('question_id', self.question_id),
+            ('question', self.question),
+            ('question_type', self.question_type),
+            ('answerable', 1 if self.answerable else 0),
+            ('answers', list(self.answers)),
+            ('tags', list(self.tags)),
+            ('qa_source', self.qa_source),
+        ])
+
+    @property
+    def answer(self):
+        """The first answer, or an empty string"""
+        return self.answers[0] if self.answers else ''
+
+    def diff(self, other, fields=QUESTION_FIELDS):
+        """Return the set of fields whose values differ from another record
+
+        Tags are compared as a set, since their order carries no meaning.
+        """
+        changed = set()
+        for name in fields:
+            mine = getattr(self, name)
+            theirs = getattr(other, name)
+            if name == 'tags':
+                if set(mine) != set(theirs):
+                    changed.add(name)
+            elif mine != theirs:
+                changed.add(name)
+        return changed
+
+    def replace(self, **changes):
+        """Return a copy of the record with some fields changed"""
+        return replace(self, **changes)
+
+
+@dataclass(frozen=True)
+class LabelRecord:
+    """The label of one image: its source and its questions"""
+
+    image_id: str
+    image_source: str = DEFAULT_IMAGE_SOURCE
+    questions: tuple = ()
+
+    @classmethod
+    def from_dict(cls, data, image_id=None):
+        """Build a record from a label file document"""
+        return cls(
+            image_id=image_id if image_id is not None else data.get('image_id'),
+            image_source=normalize_source(data.get('image_source'), MISSING_IMAGE_SOURCE),
+            questions=tuple(QuestionRecord.from_dict(question) for question in data.get('questions', ())),
+        )
+
+    def to_dict(self):
+        """Return the label in label file format, with the fields in file order"""
+        return OrderedDict([
+            ('image_id', self.image_id),
+            ('image_source', self.image_source),
+            ('questions', [question.to_dict() for question in self.questions]),
+        ])
@@ -0,0 +1,56 @@
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# Milestones of a launch, in the order they are reported
+STARTUP_MILESTONES = ('imports', 'window', 'first_image')
+
+# Time to first image above which the startup report is logged as a warning
+STARTUP_BUDGET_MS = int(os.environ.get("STARTUP_BUDGET_MS", "3000"))
+
+# Packages that must not be imported before the first image is shown - they load through src.ml.plugins
+HEAVY_MODULES = ('torch', 'transformers', 'sentencepiece')
+
+_started = time.perf_counter()
+_marks = {}  # milestone -> ms since start
+_reported = False
+
+
+def start(started=None):
+    """Set the moment the launch is measured from, e.g. a perf_counter() taken as the first statement"""
+    global _started
+    _started = started if started is not None else time.perf_counter()
+
+
+def mark(milestone):
+    """Record that a milestone was reached, once; report when all milestones are in
+
+    Returns:
+        float: Milliseconds since start at the first time the milestone was reached
+    """
+    if milestone not in _marks:
+        _marks[milestone] = (time.perf_counter() - _started) * 1000
+        if all(name in _marks for name in STARTUP_MILESTONES):
+            report()
+    return _marks[milestone]
+
+
+def report():
+    """Log the time to each milestone, warning when over budget or heavy modules were loaded"""
+    global _reported
+    if _reported:
+        return
+    _reported = True
+    parts = [f"{name} {_marks[name]:.0f} ms" for name in STARTUP_MILESTONES if name in _marks]
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+    total = max(_marks.values(), default=0)
+    message = f"Startup: {', '.join(parts)} (budget {STARTUP_BUDGET_MS} ms)"
+    if loaded:
+        logger.warning(f"{message}; loaded during startup: {', '.join(loaded)}")
+    elif total > STARTUP_BUDGET_MS:
+        logger.warning(f"{message} - over budget")
+    else:
+        logger.info(message)
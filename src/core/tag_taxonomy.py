@@ -0,0 +1,162 @@
+import heapq
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# File listing the allowed tags, one per line; lines starting with # are comments
+TAG_TAXONOMY_PATH = os.environ.get("TAG_TAXONOMY_PATH", "data/tags.txt")
+
+# Tags offered when there is no taxonomy file
+DEFAULT_TAGS = [
+    "WATER_BOTTLE",
+    "CUP",
+    "WALLET",
+    "REMOTE"
+]
+
+# Maximum number of suggestions returned for a query
+TAG_SUGGESTION_LIMIT = 20
+
+# Queries shorter than this only get prefix matches - fuzzy matching them matches everything
+FUZZY_MIN_QUERY_LENGTH = 3
+
+# Word separators inside a tag; every word start is indexed, so "bottle" finds WATER_BOTTLE
+TAG_WORD_SEPARATORS = ('_', ' ', '-')
+
+
+def load_tags(path=TAG_TAXONOMY_PATH):
+    """Read the tag list of a taxonomy file, or DEFAULT_TAGS if it does not exist"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            tags = [line.strip() for line in f]
+    except FileNotFoundError:
+        logger.info(f"No tag taxonomy at {path}, using the {len(DEFAULT_TAGS)} default tags")
+        return list(DEFAULT_TAGS)
+    tags = [tag for tag in tags if tag and not tag.startswith('#')]
+    logger.info(f"Loaded {len(tags)} tags from {path}")
+    return tags
+
+
+def fuzzy_distance(query_length):
+    """Return the number of typos tolerated in a query of this length"""
+    if query_length < FUZZY_MIN_QUERY_LENGTH:
+        return 0
+    return 1 if query_length < 7 else 2
+
+
+class _TrieNode:
+    __slots__ = ('children', 'tags')
+
+    def __init__(self):
+        self.children = {}  # character -> _TrieNode
+        self.tags = set()  # ids of the tags with a key passing through this node
+
+
+class TagTaxonomy:
+    """Suggestion index over a list of allowed tags
+
+    Tags are matched case-insensitively by prefix, both from the start of the
+    tag and from the start of each of its words, through a character trie whose
+    nodes know every tag below them. When a query has typos, the same trie is
+    walked with a Levenshtein row per node, pruning branches that are already
+    too far off, so near misses such as "botle" still find WATER_BOTTLE without
+    comparing against every tag. Suggestions are ranked by how often each tag
+    is used in existing labels.
+    """
+
+    def __init__(self, tags):
+        self._tags = []  # tag id -> tag
+        self._ids = {}  # lowercase tag -> tag id
+        self._frequencies = {}  # tag id -> number of labels using it
+        self._root = _TrieNode()
+        for tag in tags:
+            self.add(tag)
+
+    @classmethod
+    def load(cls, path=TAG_TAXONOMY_PATH):
+        """Build the taxonomy from a tag file"""
+        return cls(load_tags(path))
+
+    def add(self, tag):
+        """Add a tag to the index; adding a known tag does nothing"""
+        key = tag.lower()
+        if key in self._ids:
+            return
+        tag_id = len(self._tags)
+        self._tags.append(tag)
+        self._ids[key] = tag_id
+
+        starts = [0] + [i + 1 for i, c in enumerate(key) if c in TAG_WORD_SEPARATORS and i + 1 < len(key)]
+        for start in starts:
+            node = self._root
+            for c in key[start:]:
+                node = node.children.setdefault(c, _TrieNode())
+                node.tags.add(tag_id)
+
+    def set_frequencies(self, counts):
+        """Replace the usage counts used for ranking, e.g. from FacetIndex.counts('tags')"""
+        self._frequencies = {self._ids[tag.lower()]: count for tag, count in counts.items()
+                             if tag.lower() in self._ids}
+
+    def canonical(self, text):
+        """Return the tag matching text exactly (ignoring case), or None"""
+        tag_id = self._ids.get(text.strip().lower())
+        return self._tags[tag_id] if tag_id is not None else None
+
+    def suggest(self, text, exclude=(), limit=TAG_SUGGESTION_LIMIT):
+        """Return up to limit tags for typed text, best first
+
+        Prefix matches come first, ranked by usage; typo-tolerant matches fill up
+        the remaining places, ranked by distance and then usage.
+        """
+        query = text.strip().lower()
+        if not query:
+            return []
+        excluded = {self._ids[tag.lower()] for tag in exclude if tag.lower() in self._ids}
+        frequencies = self._frequencies
+
+        node = self._root
+        for c in query:
+            node = node.children.get(c)
+            if node is None:
+                break
+        prefix_ids = node.tags - excluded if node is not None else set()
+        ranked = heapq.nsmallest(limit, prefix_ids,
+                                 key=lambda tag_id: (-frequencies.get(tag_id, 0), self._tags[tag_id]))
+
+        max_distance = fuzzy_distance(len(query))
+        if len(ranked) < limit and max_distance:
+            distances = self._fuzzy_matches(query, max_distance)
+            fuzzy_ids = [tag_id for tag_id in distances if tag_id not in prefix_ids and tag_id not in excluded]
+            ranked += heapq.nsmallest(limit - len(ranked), fuzzy_ids,
+                                      key=lambda tag_id: (distances[tag_id], -frequencies.get(tag_id, 0),
+                                                          self._tags[tag_id]))
+        return [self._tags[tag_id] for tag_id in ranked]
+
+    def _fuzzy_matches(self, query, max_distance):
+        """Return {tag id: distance} of tags with a key prefix within max_distance edits of query"""
+        matches = {}
+        first_row = list(range(len(query) + 1))
+        stack = [(child, c, first_row) for c, child in self._root.children.items()]
+        while stack:
+            node, c, previous = stack.pop()
+            row = [previous[0] + 1]
+            for i, query_char in enumerate(query, 1):
+                row.append(min(row[i - 1] + 1, previous[i] + 1, previous[i - 1] + (query_char != c)))
+
+            distance = row[-1]
+            if distance <= max_distance:
+                # Every tag below this node continues a key prefix this close to the query
+                for tag_id in node.tags:
+                    if distance < matches.get(tag_id, max_distance + 1):
+                        matches[tag_id] = distance
+            if min(row) <= max_distance:
+                stack.extend((child, next_char, row) for next_char, child in node.children.items())
+        return matches
+
+    def __contains__(self, tag):
+        return tag.lower() in self._ids
+
+    def __len__(self):
+        return len(self._tags)
@@ -0,0 +1,229 @@
+import heapq
+import logging
+import math
+import re
+import time
+import unicodedata
+from bisect import bisect_left
+
+from src.core.question_record import UNANSWERABLE_TEXT
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of results returned by a search
+SEARCH_RESULT_LIMIT = 50
+
+# How many vocabulary words the last (possibly unfinished) query word may expand to
+PREFIX_EXPANSION_LIMIT = 50
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Score bonus per query word that also matches with its exact diacritics
+EXACT_MATCH_BONUS = 0.5
+
+# Above this many matches only the shortest matching labels are scored
+SCORE_ALL_LIMIT = 2000
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def fold_text(text):
+    """Lowercase text and strip Vietnamese diacritics, e.g. "Có cái ví" -> "co cai vi"
+
+    Decomposes to NFD so tone and vowel marks become separate combining
+    characters, drops them, and maps đ to d (which has no decomposition).
+    """
+    decomposed = unicodedata.normalize('NFD', text.lower())
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.replace('đ', 'd')
+
+
+def tokenize(text):
+    """Return the lowercase NFC words of text"""
+    return _TOKEN_RE.findall(unicodedata.normalize('NFC', text.lower()))
+
+
+def label_text(data):
+    """Return (questions, answers) text of a label document
+
+    The UNANSWERABLE_TEXT placeholder is left out: it is the same sentence in
+    every unanswerable label, so indexing it would make any query sharing one of
+    its words match all of them and skew those words' IDF.
+    """
+    questions = []
+    answers = []
+    for question in data.get('questions', []):
+        questions.append(question.get('question', ''))
+        answers.extend(str(answer) for answer in question.get('answers', []) if str(answer).strip() != UNANSWERABLE_TEXT)
+    return ' '.join(questions), ', '.join(answers)
+
+
+class TextSearchIndex:
+    """Diacritic-insensitive inverted index over label questions and answers
+
+    Words are indexed in their folded form, so "co cai vi" finds
+    "Trong ảnh có cái ví nào không?". Every query word has to match; results are
+    ranked by BM25, with a bonus for words that also match with the exact
+    diacritics typed. The last query word is treated as a prefix, so results
+    show up while typing.
+
+    Scoring is the expensive part, so when a query matches more than
+    SCORE_ALL_LIMIT labels (e.g. "khong") only the shortest matching labels are
+    scored. With equal term frequencies BM25 ranks shorter labels first, and
+    labels are short, so the top results are the same in practice.
+    """
+
+    def __init__(self):
+        self._postings = {}  # folded word -> {image id: term frequency}
+        self._vocabulary = []  # sorted folded words, for prefix expansion
+        self._documents = {}  # image id -> (folded words, exact words, question text, answer text, length)
+        self._length_buckets = {}  # length in words -> set of image ids
+        self._total_length = 0
+
+    def update(self, image_id, data):
+        """Index the label of an image, replacing what was indexed for it before"""
+        self.remove(image_id)
+        question, answers = label_text(data)
+        words = tokenize(f"{question} {answers}")
+        folded = [fold_text(word) for word in words]
+
+        frequencies = {}
+        for word in folded:
+            frequencies[word] = frequencies.get(word, 0) + 1
+        for word, frequency in frequencies.items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                self._vocabulary.insert(bisect_left(self._vocabulary, word), word)
+            postings[image_id] = frequency
+
+        self._documents[image_id] = (tuple(frequencies), frozenset(words), question, answers, len(folded))
+        self._length_buckets.setdefault(len(folded), set()).add(image_id)
+        self._total_length += len(folded)
+
+    def remove(self, image_id):
+        """Drop an image from the index"""
+        document = self._documents.pop(image_id, None)
+        if document is None:
+            return
+        self._total_length -= document[4]
+        bucket = self._length_buckets[document[4]]
+        bucket.discard(image_id)
+        if not bucket:
+            del self._length_buckets[document[4]]
+        for word in document[0]:
+            postings = self._postings[word]
+            del postings[image_id]
+            if not postings:
+                del self._postings[word]
+                del self._vocabulary[bisect_left(self._vocabulary, word)]
+
+    def _expand_prefix(self, prefix):
+        """Return the vocabulary words starting with prefix, up to PREFIX_EXPANSION_LIMIT"""
+        words = []
+        pos = bisect_left(self._vocabulary, prefix)
+        while pos < len(self._vocabulary) and len(words) < PREFIX_EXPANSION_LIMIT:
+            word = self._vocabulary[pos]
+            if not word.startswith(prefix):
+                break
+            words.append(word)
+            pos += 1
+        return words
+
+    def search(self, query, limit=SEARCH_RESULT_LIMIT):
+        """Return up to limit (image id, score) pairs, best first"""
+        started = time.perf_counter()
+        query_words = tokenize(query)
+        if not query_words or not self._documents:
+            return []
+
+        # Each query word becomes a group of index words; only the last one is a prefix
+        groups = [[fold_text(word)] for word in query_words]
+        if not query[-1:].isspace():
+            groups[-1] = self._expand_prefix(groups[-1][0])
+
+        group_postings = []
+        for group in groups:
+            postings = [self._postings[word] for word in group if word in self._postings]
+            if not postings:
+                return []
+            group_postings.append(postings)
+
+        documents = self._documents
+        candidates = self._candidates(group_postings)
+        if not candidates:
+            return []
+
+        document_count = len(documents)
+        average_length = self._total_length / document_count
+        weights = [
+            [(p, math.log(1 + (document_count - len(p) + 0.5) / (len(p) + 0.5))) for p in postings]
+            for postings in group_postings
+        ]
+        exact_words = set(query_words)
+        length_norms = {}
+
+        def score(image_id):
+            document = documents[image_id]
+            length_norm = length_norms.get(document[4])
+            if length_norm is None:
+                length_norm = length_norms[document[4]] = BM25_K1 * (1 - BM25_B + BM25_B * document[4] / average_length)
+            total = 0.0
+            for group in weights:
+                best = 0.0
+                for postings, idf in group:
+                    frequency = postings.get(image_id)
+                    if frequency:
+                        best = max(best, idf * frequency * (BM25_K1 + 1) / (frequency + length_norm))
+                total += best
+            return total + EXACT_MATCH_BONUS * len(exact_words & document[1])
+
+        results = heapq.nlargest(limit, ((score(image_id), image_id) for image_id in candidates))
+        logger.debug(f"Search '{query}': scored {len(candidates)} labels in "
+                     f"{(time.perf_counter() - started) * 1000:.1f} ms")
+        return [(image_id, result_score) for result_score, image_id in results]
+
+    @staticmethod
+    def _filter(ids, group_postings):
+        """Keep the ids found in every group (in any of the group's postings)"""
+        for postings in group_postings:
+            if len(postings) == 1:
+                single = postings[0]
+                ids = [image_id for image_id in ids if image_id in single]
+            else:
+                ids = [image_id for image_id in ids if any(image_id in p for p in postings)]
+            if not ids:
+                break
+        return ids
+
+    def _candidates(self, group_postings):
+        """Return the ids matching every group - at most SCORE_ALL_LIMIT, shortest labels first"""
+        group_postings = sorted(group_postings, key=lambda postings: sum(len(p) for p in postings))
+        rarest = group_postings[0]
+        documents = self._documents
+
+        if sum(len(p) for p in rarest) <= SCORE_ALL_LIMIT * 4:
+            # Few matches for the rarest word: check each against the other words
+            first = set().union(*rarest) if len(rarest) > 1 else rarest[0]
+            candidates = self._filter(list(first), group_postings[1:])
+            if len(candidates) > SCORE_ALL_LIMIT:
+                candidates = sorted(candidates, key=lambda image_id: documents[image_id][4])[:SCORE_ALL_LIMIT]
+            return candidates
+
+        # Every word is common: walk the labels from shortest to longest until there are enough
+        candidates = []
+        for length in sorted(self._length_buckets):
+            candidates.extend(self._filter(self._length_buckets[length], group_postings))
+            if len(candidates) >= SCORE_ALL_LIMIT:
+                break
+        return candidates[:SCORE_ALL_LIMIT]
+
+    def document(self, image_id):
+        """Return the (question, answers) text indexed for an image"""
+        document = self._documents.get(image_id)
+        return (document[2], document[3]) if document is not None else None
+
+    def __len__(self):
+        return len(self._documents)
@@ -0,0 +1,6 @@
+"""
+Imaging package for the Image Labelling Tool
+Contains image decoding, caching and prefetching helpers used by the image viewer
+"""
+# Empty __init__.py to make the directory a package
+# Each module should be imported directly to avoid circular imports
@@ -0,0 +1,70 @@
+import logging
+
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QImageIOHandler, QImageReader
+
+logger = logging.getLogger(__name__)
+
+
+def fit_size(source_size, max_width, max_height):
+    """Return source_size scaled down to fit max_width x max_height, keeping the aspect ratio
+
+    Images that already fit are returned unchanged - we never upscale at decode time.
+    """
+    if source_size.width() <= max_width and source_size.height() <= max_height:
+        return QSize(source_size)
+    return source_size.scaled(max_width, max_height, Qt.KeepAspectRatio)
+
+
+def decode_scaled(image_path, max_width, max_height):
+    """Decode an image directly at (at most) max_width x max_height
+
+    The scaled size is handed to QImageReader before reading, so the JPEG handler
+    downscales during DCT decoding instead of producing a full-size image that is
+    shrunk afterwards. EXIF orientation is applied after decoding.
+
+    Returns:
+        QImage: The decoded image, which is null if decoding failed
+    """
+    reader = QImageReader(image_path)
+    reader.setAutoTransform(True)
+
+    source_size = reader.size()
+    if source_size.isValid():
+        # The scaled size applies to the stored image, before the EXIF rotation,
+        # so a rotated photo has to fit the transposed box
+        if reader.transformation() & QImageIOHandler.TransformationRotate90:
+            target_size = fit_size(source_size, max_height, max_width)
+        else:
+            target_size = fit_size(source_size, max_width, max_height)
+
+        if target_size != source_size:
+            reader.setScaledSize(target_size)
+
+    image = reader.read()
+    if image.isNull():
+        logger.warning(f"Failed to decode {image_path}: {reader.errorString()}")
+    return image
+
+
+def load_scaled(image_path, max_width, max_height, preview_cache=None):
+    """Return the image at display size, from the preview cache when possible
+
+    Args:
+        image_path: Path of the source image
+        max_width: Maximum width of the returned image
+        max_height: Maximum height of the returned image
+        preview_cache: Optional PreviewCache consulted before decoding and filled after
+
+    Returns:
+        QImage: The image, which is null if decoding failed
+    """
+    if preview_cache is not None:
+        image = preview_cache.get(image_path, max_width, max_height)
+        if image is not None:
+            return image
+
+    image = decode_scaled(image_path, max_width, max_height)
+    if preview_cache is not None and not image.isNull():
+        preview_cache.put(image_path, max_width, max_height, image)
+    return image
@@ -0,0 +1,78 @@
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# Default memory budget of the pixmap cache in megabytes
+PIXMAP_CACHE_MAX_MB = 256
+
+
+class PixmapCache:
+    """In-process LRU cache of decoded pixmaps with a memory budget
+
+    Entries are keyed by image path and decode size. The budget is expressed in
+    megabytes of pixel data rather than a number of entries, so a few large
+    images cannot push memory use past the limit. Only used from the GUI thread,
+    since QPixmap cannot be touched from worker threads.
+    """
+
+    def __init__(self, max_mb=PIXMAP_CACHE_MAX_MB):
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._entries = OrderedDict()  # (path, width, height) -> (QPixmap, size in bytes)
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, image_path, width, height):
+        """Return the cached pixmap, or None on a miss - updates the hit/miss counters"""
+        key = (image_path, width, height)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def contains(self, image_path, width, height):
+        """Check for an entry without touching LRU order or the counters"""
+        return (image_path, width, height) in self._entries
+
+    def put(self, image_path, width, height, pixmap):
+        """Add a pixmap, evicting the least recently used ones to stay within budget"""
+        size = self._pixmap_bytes(pixmap)
+        if size > self.max_bytes:
+            logger.warning(f"Pixmap for {image_path} ({size} bytes) exceeds the cache budget, not caching")
+            return
+
+        key = (image_path, width, height)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._total_bytes -= old[1]
+        self._entries[key] = (pixmap, size)
+        self._total_bytes += size
+
+        while self._total_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_size
+
+    def clear(self):
+        """Drop all entries - the counters are kept"""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def stats(self):
+        """Return a dict with hit/miss counters and current memory use"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+        }
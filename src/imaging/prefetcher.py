@@ -0,0 +1,143 @@
+import logging
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+from src.imaging.decoder import load_scaled
+from src.imaging.pixmap_cache import PixmapCache
+
+logger = logging.getLogger(__name__)
+
+# Number of images decoded ahead of and behind the current image
+PREFETCH_RADIUS = 3
+
+# Number of worker threads used for decoding
+PREFETCH_WORKERS = 2
+
+# Default decode size - the viewer overrides it with its own display size
+DEFAULT_TARGET_SIZE = (600, 600)
+
+# Priorities passed to QThreadPool.start - the image the user is waiting for goes first
+_REQUEST_PRIORITY = 10
+_PREFETCH_PRIORITY = 0
+
+
+class _DecodeSignals(QObject):
+    """Signals for a decode task (QRunnable is not a QObject and cannot emit signals)"""
+
+    finished = pyqtSignal(str, int, int, QImage)
+    failed = pyqtSignal(str)
+
+
+class _DecodeTask(QRunnable):
+    """Decode a single image file into a QImage on a worker thread"""
+
+    def __init__(self, image_path, target_size, preview_cache=None):
+        super().__init__()
+        self.image_path = image_path
+        self.target_size = target_size
+        self.preview_cache = preview_cache
+        self.signals = _DecodeSignals()
+
+    def run(self):
+        """Decode the image - QImage is safe to create outside the GUI thread, QPixmap is not"""
+        image = load_scaled(self.image_path, *self.target_size, preview_cache=self.preview_cache)
+        if image.isNull():
+            self.signals.failed.emit(self.image_path)
+        else:
+            self.signals.finished.emit(self.image_path, *self.target_size, image)
+
+
+class ImagePrefetcher(QObject):
+    """Decode the images around the current one on a worker pool
+
+    Decoded images are converted to QPixmap on the GUI thread and stored in a
+    PixmapCache, so navigating to a neighbour - or back to an image seen a moment
+    ago - shows an image that is already decoded. When a PreviewCache is given,
+    workers read previews from it before decoding the original.
+    """
+
+    # Emitted with the image path once its pixmap is available through get()
+    image_ready = pyqtSignal(str)
+    # Emitted with the image path when it could not be decoded
+    image_failed = pyqtSignal(str)
+
+    def __init__(self, radius=PREFETCH_RADIUS, max_workers=PREFETCH_WORKERS, preview_cache=None,
+                 pixmap_cache=None, parent=None):
+        super().__init__(parent)
+        self.radius = radius
+        self.preview_cache = preview_cache
+        self.pixmap_cache = pixmap_cache if pixmap_cache is not None else PixmapCache()
+        self.target_size = DEFAULT_TARGET_SIZE
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_workers)
+        self._pending = {}  # image path -> _DecodeTask queued, running or with its result signal in flight
+        self._window = set()
+
+    def set_target_size(self, width, height):
+        """Set the size images are decoded at"""
+        self.target_size = (width, height)
+
+    def get(self, image_path):
+        """Return the decoded pixmap for image_path, or None if it is not ready yet"""
+        return self.pixmap_cache.get(image_path, *self.target_size)
+
+    def _is_cached(self, image_path):
+        return self.pixmap_cache.contains(image_path, *self.target_size)
+
+    def request(self, image_path):
+        """Decode image_path ahead of any queued prefetch work"""
+        if self._is_cached(image_path):
+            return
+        task = self._pending.get(image_path)
+        if task is not None:
+            # Already queued at prefetch priority - move it to the front if it has not started
+            if not self._pool.tryTake(task):
+                return
+            del self._pending[image_path]
+        self._window.add(image_path)
+        self._start(image_path, _REQUEST_PRIORITY)
+
+    def prefetch(self, image_paths):
+        """Make image_paths the prefetch window
+
+        Paths should be ordered nearest-first. Queued work outside the window is
+        dropped; memory is bounded by the pixmap cache budget.
+        """
+        self._window = set(image_paths)
+
+        for path, task in list(self._pending.items()):
+            if path not in self._window and self._pool.tryTake(task):
+                del self._pending[path]
+
+        for path in image_paths:
+            if not self._is_cached(path) and path not in self._pending:
+                self._start(path, _PREFETCH_PRIORITY)
+
+    def shutdown(self):
+        """Drop queued work and wait for running decodes to finish"""
+        self._pool.clear()
+        self._pool.waitForDone()
+        self._pending.clear()
+        logger.info(f"Pixmap cache stats at shutdown: {self.pixmap_cache.stats()}")
+
+    def _start(self, image_path, priority):
+        task = _DecodeTask(image_path, self.target_size, self.preview_cache)
+        # Owned by _pending, not the pool: the pool would delete it when run() returns, while the
+        # entry stays until the queued signal arrives and tryTake may still be called on it
+        task.setAutoDelete(False)
+        task.signals.finished.connect(self._on_decoded)
+        task.signals.failed.connect(self._on_failed)
+        self._pending[image_path] = task
+        self._pool.start(task, priority)
+
+    def _on_decoded(self, image_path, width, height, image):
+        """Convert a decoded image to a pixmap and cache it - runs on the GUI thread"""
+        self._pending.pop(image_path, None)
+        self.pixmap_cache.put(image_path, width, height, QPixmap.fromImage(image))
+        if (width, height) == self.target_size:
+            self.image_ready.emit(image_path)
+
+    def _on_failed(self, image_path):
+        self._pending.pop(image_path, None)
+        self.image_failed.emit(image_path)
@@ -0,0 +1,145 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from PyQt5.QtGui import QImage, QImageWriter
+
+logger = logging.getLogger(__name__)
+
+# Default location of the preview cache, relative to the working directory
+PREVIEW_CACHE_DIR = ".cache/previews"
+
+# Default size cap of the preview cache in megabytes
+PREVIEW_CACHE_MAX_MB = 512
+
+# Encoding quality of the stored previews (0-100)
+PREVIEW_QUALITY = 85
+
+
+class PreviewCache:
+    """Persistent on-disk cache of images downscaled to viewer resolution
+
+    Entries are keyed by a hash of the source path, its size and mtime and the
+    preview size, so a source file that is modified or replaced gets a new key and
+    its stale preview simply ages out. The cache is capped in bytes and evicts the
+    least recently used previews first; recency is kept in the files' mtimes so it
+    survives restarts.
+
+    get() and put() are safe to call from decode worker threads.
+    """
+
+    def __init__(self, cache_dir=PREVIEW_CACHE_DIR, max_mb=PREVIEW_CACHE_MAX_MB):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.image_format = self._pick_format()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # file name -> size in bytes, least recently used first
+        self._total_bytes = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_entries()
+        logger.info(f"Preview cache at {self.cache_dir}: {len(self._entries)} previews, "
+                    f"{self._total_bytes / (1024 * 1024):.1f} MB, format={self.image_format}")
+
+    @staticmethod
+    def _pick_format():
+        """Use WebP when the Qt imageformats plugin provides it, JPEG otherwise"""
+        supported = {bytes(fmt).decode('ascii').lower() for fmt in QImageWriter.supportedImageFormats()}
+        return "webp" if "webp" in supported else "jpg"
+
+    def _load_entries(self):
+        """Index the previews left by earlier sessions, oldest first"""
+        suffix = f".{self.image_format}"
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(suffix):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for _, name, size in sorted(entries):
+            self._entries[name] = size
+            self._total_bytes += size
+
+    def _file_name(self, image_path, width, height):
+        """Return the cache file name for a source image, or None if it cannot be stat'ed"""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        raw = f"{os.path.abspath(image_path)}|{stat.st_size}|{stat.st_mtime_ns}|{width}x{height}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest() + "." + self.image_format
+
+    def get(self, image_path, width, height):
+        """Return the cached preview of image_path as a QImage, or None on a miss"""
+        name = self._file_name(image_path, width, height)
+        if name is None:
+            return None
+
+        with self._lock:
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+
+        path = os.path.join(self.cache_dir, name)
+        image = QImage(path)
+        if image.isNull():
+            logger.warning(f"Dropping unreadable preview {path}")
+            self._remove(name)
+            return None
+
+        try:
+            # Record the access so LRU order survives a restart
+            os.utime(path)
+        except OSError:
+            pass
+        return image
+
+    def put(self, image_path, width, height, image):
+        """Store the preview of image_path and evict old previews if over the size cap"""
+        name = self._file_name(image_path, width, height)
+        if name is None or image.isNull():
+            return
+
+        path = os.path.join(self.cache_dir, name)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        if not image.save(tmp_path, self.image_format.upper(), PREVIEW_QUALITY):
+            logger.warning(f"Failed to write preview for {image_path}")
+            return
+
+        try:
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            logger.warning(f"Failed to store preview for {image_path}: {str(e)}")
+            return
+
+        with self._lock:
+            self._total_bytes += size - self._entries.pop(name, 0)
+            self._entries[name] = size
+            evicted = self._pop_over_budget()
+
+        for old_name in evicted:
+            try:
+                os.remove(os.path.join(self.cache_dir, old_name))
+            except OSError:
+                pass
+
+    def _pop_over_budget(self):
+        """Drop least recently used entries until under the cap - caller holds the lock"""
+        evicted = []
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(name)
+        return evicted
+
+    def _remove(self, name):
+        with self._lock:
+            self._total_bytes -= self._entries.pop(name, 0)
+        try:
+            os.remove(os.path.join(self.cache_dir, name))
+        except OSError:
+            pass
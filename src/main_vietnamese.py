@@ -1,33 +1,38 @@
+import time
+_started = time.perf_counter()
+
 import sys
 import os
+import argparse
 import logging
 from PyQt5.QtWidgets import QApplication
 
 # Add the src directory to the path to allow absolute imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core import startup_timing
+from src.core.logging_setup import setup_logging, LOG_LEVELS
 from src.ui.vietnam_main_window import VietnamMainWindow
+startup_timing.start(_started)
+startup_timing.mark('imports')
 
-def setup_logging():
-    """Setup application logging"""
-    log_dir = "logs"
-    os.makedirs(log_dir, exist_ok=True)
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(f"{log_dir}/app.log"),
-            logging.StreamHandler()
-        ]
-    )
+def parse_args():
+    """Parse command line arguments, leaving Qt's own options for QApplication"""
+    parser = argparse.ArgumentParser(description="Vietnamese Image Labeling Tool")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="INFO",
+                        help="Minimum level written to the console and logs/app.log")
+    parser.add_argument("-v", "--verbose", action="store_const", dest="log_level", const="DEBUG",
+                        help="Log per-edit diagnostics (same as --log-level DEBUG)")
+    return parser.parse_known_args()
 
 if __name__ == "__main__":
-    setup_logging()
+    args, qt_args = parse_args()
+    setup_logging(getattr(logging, args.log_level))
     logger = logging.getLogger(__name__)
     logger.info("Starting Vietnamese Image Labeling Tool")
     
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_args)
     window = VietnamMainWindow()
     window.showMaximized()
+    startup_timing.mark('window')
     
-    sys.exit(app.exec_()) 
\ No newline at end of file
+    sys.exit(app.exec_()) 
@@ -0,0 +1,57 @@
+import sys
+import os
+import argparse
+import logging
+
+# Add the src directory to the path to allow absolute imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.label_store import JsonLabelStore, SqliteLabelStore, copy_labels, DEFAULT_LABEL_DB
+
+logger = logging.getLogger(__name__)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Move labels between the per-file JSON folder and the SQLite label store"
+    )
+    parser.add_argument("direction", choices=["import", "export"],
+                        help="import: JSON folder -> SQLite, export: SQLite -> JSON folder")
+    parser.add_argument("--labels", default="data/labels", help="JSON label folder")
+    parser.add_argument("--db", default=DEFAULT_LABEL_DB, help="SQLite database path")
+    parser.add_argument("--no-verify", action="store_true",
+                        help="Skip the check that every label was copied byte for byte")
+    return parser.parse_args()
+
+def verify(source, target):
+    """Check that target holds exactly the same label text as source
+
+    Returns:
+        int: Number of labels that are missing or differ
+    """
+    mismatches = 0
+    for image_id, text in source.iter_texts():
+        if target.load_text(image_id) != text:
+            logger.error(f"Label {image_id} differs after migration")
+            mismatches += 1
+    return mismatches
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    args = parse_args()
+
+    json_store = JsonLabelStore(args.labels)
+    sqlite_store = SqliteLabelStore(args.db)
+    if args.direction == "import":
+        source, target = json_store, sqlite_store
+    else:
+        source, target = sqlite_store, json_store
+
+    count = copy_labels(source, target)
+    logger.info(f"Copied {count} labels ({args.direction})")
+
+    if not args.no_verify:
+        mismatches = verify(source, target)
+        if mismatches:
+            logger.error(f"{mismatches} labels did not round-trip")
+            sys.exit(1)
+        logger.info("All labels verified")
@@ -0,0 +1,6 @@
+"""
+ML package for the Image Labelling Tool
+Contains optional model backends (translation, AI assistance) loaded on first use
+"""
+# Empty __init__.py to make the directory a package
+# Backends import torch/transformers, so they are only loaded through src.ml.plugins
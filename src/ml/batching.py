@@ -0,0 +1,31 @@
+def length_sorted_batches(lengths, batch_size, max_tokens=None):
+    """Group item indices into batches of items with similar lengths
+
+    Sorting by length before batching keeps padding small: each batch is only
+    padded to its own longest item (dynamic padding) instead of the longest
+    item overall.
+
+    Args:
+        lengths: Length of each item, e.g. in characters or tokens
+        batch_size: Maximum number of items per batch
+        max_tokens: Optional cap on batch size times the longest item, so batches of long items shrink
+
+    Returns:
+        list: Batches as lists of indices into lengths, shortest items first
+    """
+    batches = []
+    batch = []
+    longest = 0
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        length = max(lengths[index], 1)
+        full = len(batch) >= batch_size
+        too_long = max_tokens is not None and max(longest, length) * (len(batch) + 1) > max_tokens
+        if batch and (full or too_long):
+            batches.append(batch)
+            batch = []
+            longest = 0
+        batch.append(index)
+        longest = max(longest, length)
+    if batch:
+        batches.append(batch)
+    return batches
@@ -0,0 +1,51 @@
+import math
+import re
+from collections import Counter
+
+# Longest n-grams counted by BLEU
+BLEU_MAX_ORDER = 4
+
+_TOKEN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+
+def tokenize(text):
+    """Split a sentence into lowercase words and punctuation marks (Vietnamese syllables are words)"""
+    return _TOKEN.findall(text.lower())
+
+
+def _ngrams(tokens, order):
+    return Counter(tuple(tokens[i:i + order]) for i in range(len(tokens) - order + 1))
+
+
+def corpus_bleu(hypotheses, references, max_order=BLEU_MAX_ORDER):
+    """Return the corpus BLEU score (0-100) of hypotheses against one reference each
+
+    Uses clipped n-gram precisions up to max_order, add-one smoothing for the
+    higher orders (short questions often have no matching 4-gram) and the
+    usual brevity penalty.
+    """
+    matches = [0] * max_order
+    totals = [0] * max_order
+    hypothesis_length = 0
+    reference_length = 0
+    for hypothesis, reference in zip(hypotheses, references):
+        hypothesis_tokens = tokenize(hypothesis)
+        reference_tokens = tokenize(reference)
+        hypothesis_length += len(hypothesis_tokens)
+        reference_length += len(reference_tokens)
+        for order in range(1, max_order + 1):
+            hypothesis_ngrams = _ngrams(hypothesis_tokens, order)
+            reference_ngrams = _ngrams(reference_tokens, order)
+            matches[order - 1] += sum((hypothesis_ngrams & reference_ngrams).values())
+            totals[order - 1] += max(len(hypothesis_tokens) - order + 1, 0)
+
+    if hypothesis_length == 0 or matches[0] == 0:
+        return 0.0
+    log_precision = 0.0
+    for order in range(max_order):
+        if order == 0:
+            log_precision += math.log(matches[0] / totals[0])
+        else:
+            log_precision += math.log((matches[order] + 1) / (totals[order] + 1))
+    brevity_penalty = min(1.0, math.exp(1 - reference_length / hypothesis_length))
+    return 100 * brevity_penalty * math.exp(log_precision / max_order)
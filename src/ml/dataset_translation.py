@@ -0,0 +1,149 @@
+import json
+import logging
+from collections import Counter
+
+from src.core.question_record import LabelRecord, QuestionRecord
+
+logger = logging.getLogger(__name__)
+
+# QA source of labels drafted from a translated dataset
+TRANSLATED_QA_SOURCE = 'translated_from_dataset'
+
+# Image source of images taken from a public dataset
+DATASET_IMAGE_SOURCE = 'filtered_dataset'
+
+# Spellings of the answerable field found in VQA datasets
+TRUE_STRINGS = ('1', 'true', 'yes', 'y')
+FALSE_STRINGS = ('0', 'false', 'no', 'n')
+
+
+def parse_answerable(value):
+    """Interpret an answerable value of a dataset (bool, 0/1 or a yes/no string)
+
+    Raises:
+        ValueError: If a string is neither a true nor a false spelling
+    """
+    if isinstance(value, str):
+        key = value.strip().lower()
+        if key in TRUE_STRINGS:
+            return True
+        if key in FALSE_STRINGS:
+            return False
+        raise ValueError(f"Unknown answerable value {value!r}")
+    return bool(value)
+
+
+class EnglishPair:
+    """One English question/answer pair of a VQA dataset"""
+
+    def __init__(self, image_id, question, answer, answerable, tags=(), question_type=None):
+        self.image_id = image_id
+        self.question = question
+        self.answer = answer
+        self.answerable = answerable
+        self.tags = tuple(tags)
+        self.question_type = question_type
+
+    @classmethod
+    def from_dict(cls, data):
+        """Read a pair, taking the most common answer when the dataset lists several
+
+        Raises:
+            KeyError: If image_id or question is missing
+            ValueError: If answerable has an unknown value
+        """
+        answer = data.get('answer')
+        if answer is None:
+            answers = [str(a.get('answer', '') if isinstance(a, dict) else a).strip() for a in data.get('answers', ())]
+            answers = [a for a in answers if a]
+            answer = Counter(answers).most_common(1)[0][0] if answers else ''
+        answer = str(answer).strip()
+        answerable = data.get('answerable')
+        answerable = bool(answer) if answerable is None else parse_answerable(answerable)
+        return cls(str(data['image_id']), str(data['question']).strip(), answer, answerable,
+                   data.get('tags', ()), data.get('question_type'))
+
+
+def read_pairs(path):
+    """Read English pairs from a JSON list or a JSON Lines file, keeping the first pair of each image
+
+    Malformed records are skipped with a warning, so one bad row does not abort a run.
+
+    Returns:
+        list: EnglishPair objects in file order
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    skipped = 0
+    if text.lstrip().startswith('['):
+        rows = json.loads(text)
+    else:
+        rows = []
+        for number, line in enumerate(text.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError as e:
+                logger.warning(f"Skipping line {number} of {path}: {e}")
+                skipped += 1
+
+    pairs = []
+    seen = set()
+    duplicates = 0
+    for number, row in enumerate(rows, 1):
+        try:
+            pair = EnglishPair.from_dict(row)
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Skipping record {number} of {path}: {e!r}")
+            skipped += 1
+            continue
+        if pair.image_id in seen:
+            duplicates += 1
+            continue
+        seen.add(pair.image_id)
+        pairs.append(pair)
+    if skipped:
+        logger.warning(f"Skipped {skipped} malformed records of {path}")
+    if duplicates:
+        logger.info(f"Keeping the first of several pairs for {duplicates} rows - labels hold one question")
+    return pairs
+
+
+def draft_label(pair, question, answer, image_source=DATASET_IMAGE_SOURCE, taxonomy=None):
+    """Return the draft label of a translated pair
+
+    Tags outside the taxonomy are dropped, so the annotator only picks valid ones.
+    """
+    tags = pair.tags
+    if taxonomy is not None:
+        tags = [taxonomy.canonical(tag) for tag in tags]
+        tags = [tag for tag in tags if tag]
+    record = QuestionRecord.create(
+        question=question,
+        question_type=pair.question_type,
+        answerable=pair.answerable,
+        answer=answer if pair.answerable else '',
+        tags=tags,
+        qa_source=TRANSLATED_QA_SOURCE,
+    )
+    return LabelRecord(image_id=pair.image_id, image_source=image_source, questions=(record,))
+
+
+def translate_pairs(pairs, translate):
+    """Translate the questions and answers of pairs in one call
+
+    Args:
+        pairs: EnglishPair objects
+        translate: Function translating a list of English sentences, in order
+
+    Returns:
+        list: (pair, question, answer) tuples; answer is '' for unanswerable pairs
+    """
+    texts = [pair.question for pair in pairs]
+    answer_pairs = [pair for pair in pairs if pair.answerable and pair.answer]
+    texts.extend(pair.answer for pair in answer_pairs)
+    translations = translate(texts) if texts else []
+
+    answers = dict(zip((pair.image_id for pair in answer_pairs), translations[len(pairs):]))
+    return [(pair, question, answers.get(pair.image_id, '')) for pair, question in zip(pairs, translations)]
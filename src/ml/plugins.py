@@ -0,0 +1,132 @@
+import importlib
+import importlib.util
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Plugins imported in the background once the first image is shown, comma separated; empty (the default)
+# disables pre-warming. Only list plugins the window uses, pre-warming can download model weights
+PREWARM_PLUGINS = [name for name in os.environ.get("ML_PREWARM_PLUGINS", "").split(',') if name.strip()]
+
+
+class PluginUnavailable(RuntimeError):
+    """Raised when a plugin's dependencies are not installed"""
+
+
+class PluginSpec:
+    """Where a plugin lives and what it needs, known without importing it"""
+
+    def __init__(self, name, module, factory, requires=()):
+        self.name = name
+        self.module = module  # dotted module path, imported on first use
+        self.factory = factory  # name of the function in module that builds the plugin
+        self.requires = tuple(requires)  # top-level packages that must be installed
+
+
+class PluginRegistry:
+    """Lazily loaded ML backends
+
+    Registering a plugin records only its module path, so nothing heavy is
+    imported at startup. The first get() imports the module and builds the
+    plugin; later calls return the same instance. create() builds a fresh
+    instance with arguments, for tools that configure their own. prewarm()
+    runs get() on a background thread so the first real use does not wait
+    for torch.
+    """
+
+    def __init__(self):
+        self._specs = {}  # name -> PluginSpec
+        self._plugins = {}  # name -> built plugin
+        self._lock = threading.Lock()
+        self._prewarm_thread = None
+
+    def register(self, name, module, factory, requires=()):
+        """Register a plugin by module path without importing it"""
+        self._specs[name] = PluginSpec(name, module, factory, requires)
+
+    def names(self):
+        """Return the names of all registered plugins"""
+        return list(self._specs)
+
+    def is_available(self, name):
+        """Check that a plugin's dependencies are installed, without importing them"""
+        spec = self._specs.get(name)
+        if spec is None:
+            return False
+        return all(importlib.util.find_spec(package) is not None for package in spec.requires)
+
+    def is_loaded(self, name):
+        """Check if a plugin was already built"""
+        return name in self._plugins
+
+    def create(self, name, *args, **kwargs):
+        """Import a plugin's module and build a new instance with the given arguments
+
+        Raises:
+            KeyError: If no plugin of that name is registered
+            PluginUnavailable: If its dependencies are not installed
+        """
+        spec = self._specs[name]
+        if not self.is_available(name):
+            raise PluginUnavailable(f"Plugin '{name}' needs {', '.join(spec.requires)}")
+        started = time.perf_counter()
+        module = importlib.import_module(spec.module)
+        imported = time.perf_counter()
+        plugin = getattr(module, spec.factory)(*args, **kwargs)
+        logger.info(f"Loaded plugin '{name}': import {(imported - started) * 1000:.0f} ms, "
+                    f"build {(time.perf_counter() - imported) * 1000:.0f} ms")
+        return plugin
+
+    def get(self, name):
+        """Return the shared instance of a plugin, building it with default arguments on first use
+
+        Raises:
+            KeyError: If no plugin of that name is registered
+            PluginUnavailable: If its dependencies are not installed
+        """
+        plugin = self._plugins.get(name)
+        if plugin is not None:
+            return plugin
+        # One lock for all plugins: a caller waiting on a pre-warm gets the pre-warmed instance
+        with self._lock:
+            plugin = self._plugins.get(name)
+            if plugin is None:
+                plugin = self.create(name)
+                self._plugins[name] = plugin
+            return plugin
+
+    def prewarm(self, names=None):
+        """Load plugins on a daemon thread, skipping those whose dependencies are missing
+
+        Args:
+            names: Plugins to load, PREWARM_PLUGINS by default
+        """
+        if self._prewarm_thread is not None:
+            return
+        names = [name.strip() for name in (names if names is not None else PREWARM_PLUGINS)]
+        names = [name for name in names if name in self._specs and not self.is_loaded(name)]
+        if not names:
+            return
+        self._prewarm_thread = threading.Thread(target=self._prewarm, args=(names,),
+                                                name="plugin-prewarm", daemon=True)
+        self._prewarm_thread.start()
+
+    def _prewarm(self, names):
+        for name in names:
+            if not self.is_available(name):
+                logger.info(f"Not pre-warming plugin '{name}', its dependencies are not installed")
+                continue
+            try:
+                self.get(name)
+            except Exception:
+                logger.exception(f"Pre-warming plugin '{name}' failed")
+
+
+# Plugins of the application
+registry = PluginRegistry()
+registry.register("translator", "src.ml.translator", "create_translator",
+                  requires=("torch", "transformers", "sentencepiece"))
+registry.register("stub_suggestions", "src.ml.suggestions", "StubBackend")
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+
+from src.core.question_record import QuestionRecord
+from src.core.tag_taxonomy import load_tags
+from src.ml.plugins import registry
+
+logger = logging.getLogger(__name__)
+
+# Plugin (see src.ml.plugins) building the SuggestionBackend of the AI prefill worker: "" disables prefill,
+# "stub_suggestions" is the built-in deterministic backend
+AI_PREFILL_BACKEND = os.environ.get("AI_PREFILL_BACKEND", "")
+
+# Suggestions kept across sessions, keyed by backend, image and image modification time
+SUGGESTION_CACHE_PATH = ".cache/ai_suggestions.sqlite3"
+
+# QA source of suggested questions
+AI_QA_SOURCE = 'generated_by_ai'
+
+# Vietnamese names of the objects of the default tags, used by the stub backend
+OBJECT_NAMES = {
+    'WATER_BOTTLE': "chai nước",
+    'CUP': "cái cốc",
+    'WALLET': "chiếc ví",
+    'REMOTE': "cái điều khiển",
+}
+
+
+class SuggestionBackend:
+    """Base class of the models that suggest a question for an image
+
+    Backends run in the prefill worker process, never on the GUI thread, so
+    they may import torch and take seconds per image. name identifies the
+    backend and its version in the suggestion cache; change it whenever the
+    suggestions would change.
+    """
+
+    name = None
+
+    def suggest(self, image_id, image_path):
+        """Return a QuestionRecord for the image, or None if there is nothing to suggest"""
+        raise NotImplementedError
+
+
+class StubBackend(SuggestionBackend):
+    """Deterministic backend for testing the prefill pipeline without model downloads
+
+    Asks whether one of the taxonomy objects is in the image, chosen and
+    answered from a hash of the image id, so the same image always gets the
+    same suggestion.
+    """
+
+    name = "stub-1"
+
+    def __init__(self, tags=None):
+        self.tags = sorted(tags if tags is not None else load_tags())
+
+    def suggest(self, image_id, image_path):
+        if not self.tags:
+            return None
+        digest = int(hashlib.sha1(image_id.encode('utf-8')).hexdigest(), 16)
+        tag = self.tags[digest % len(self.tags)]
+        object_name = OBJECT_NAMES.get(tag, tag.lower().replace('_', ' '))
+        answerable = bool((digest >> 8) & 1)
+        return QuestionRecord.create(
+            question=f"Có {object_name} nào trong ảnh không?",
+            answerable=answerable,
+            answer="Có" if answerable else '',
+            tags=[tag],
+            qa_source=AI_QA_SOURCE,
+        )
+
+
+class SuggestionCache:
+    """SQLite cache of the suggestions of one backend
+
+    Entries are keyed by image id and image modification time, so a replaced
+    image gets a fresh suggestion.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS suggestions (
+            backend TEXT NOT NULL,
+            image_id TEXT NOT NULL,
+            image_mtime REAL NOT NULL,
+            question TEXT NOT NULL,
+            PRIMARY KEY (backend, image_id)
+        );
+    """
+
+    def __init__(self, backend, path=SUGGESTION_CACHE_PATH):
+        self.backend = backend
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(self.SCHEMA)
+
+    def get(self, image_id, image_mtime):
+        """Return the cached question dict of the image, or None"""
+        row = self._connection.execute(
+            "SELECT question FROM suggestions WHERE backend = ? AND image_id = ? AND image_mtime = ?",
+            (self.backend, image_id, image_mtime)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, image_id, image_mtime, question):
+        """Cache the question dict suggested for the image"""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO suggestions (backend, image_id, image_mtime, question) VALUES (?, ?, ?, ?)",
+                (self.backend, image_id, image_mtime, json.dumps(question, ensure_ascii=False))
+            )
+
+    def close(self):
+        self._connection.close()
+
+
+def run_worker(backend_name, cache_path, requests, results):
+    """Serve suggestion requests until a None request arrives; the body of the prefill process
+
+    Args:
+        backend_name: Plugin building the SuggestionBackend
+        cache_path: Path of the SuggestionCache database
+        requests: Queue of (image_id, image_path) tuples
+        results: Queue receiving (image_id, question dict in label file format), or
+            (None, error message) if the backend could not be loaded, after which the worker exits
+    """
+    try:
+        backend = registry.get(backend_name)
+        cache = SuggestionCache(backend.name, cache_path)
+    except Exception as e:
+        # The spawned process has no log handlers, so the GUI reports the error
+        error = f"Unknown plugin '{backend_name}'" if isinstance(e, KeyError) else f"{type(e).__name__}: {e}"
+        results.put((None, error))
+        return
+    try:
+        while True:
+            request = requests.get()
+            if request is None:
+                return
+            image_id, image_path = request
+            try:
+                image_mtime = os.path.getmtime(image_path)
+            except OSError:
+                # Removed since it was requested
+                continue
+            try:
+                question = cache.get(image_id, image_mtime)
+                if question is None:
+                    record = backend.suggest(image_id, image_path)
+                    if record is None:
+                        continue
+                    question = dict(record.to_dict())
+                    cache.put(image_id, image_mtime, question)
+                results.put((image_id, question))
+            except Exception:
+                logger.exception(f"Could not suggest a question for {image_id}")
+    finally:
+        cache.close()
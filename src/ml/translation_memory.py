@@ -0,0 +1,218 @@
+import difflib
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Translations reused across runs, keyed by normalised source text and model
+TRANSLATION_MEMORY_PATH = os.environ.get("TRANSLATION_MEMORY_PATH", "data/translation_memory.sqlite3")
+
+# Similarity (difflib ratio of normalised texts) above which a stored translation is reused for a
+# near-identical source; 1.0 disables fuzzy matching. Only sources with the same content words are
+# compared, so a different object or a negation is never served from another sentence
+FUZZY_MATCH_CUTOFF = 0.85
+
+# Words that may differ between a source and the stored sentence whose translation it reuses
+FUZZY_IGNORED_WORDS = frozenset(('a', 'an', 'the'))
+
+# Stored sources compared per fuzzy lookup at most
+FUZZY_MAX_CANDIDATES = 32
+
+_WHITESPACE = re.compile(r"\s+")
+_WORD = re.compile(r"\w+")
+_SPACE_BEFORE_PUNCTUATION = re.compile(r"\s+([?.!,;:])")
+
+
+def normalize_text(text):
+    """Return the form under which a source sentence is remembered
+
+    Case, repeated whitespace and spaces before punctuation do not change a
+    translation, so "Is there a cup ?" and "is there a  cup?" share one entry.
+    """
+    text = _WHITESPACE.sub(' ', text.strip().lower())
+    return _SPACE_BEFORE_PUNCTUATION.sub(r"\1", text)
+
+
+def content_words(normalized):
+    """Return the words of a normalised source that a fuzzy match must share, e.g. "is there cup" """
+    return ' '.join(word for word in _WORD.findall(normalized) if word not in FUZZY_IGNORED_WORDS)
+
+
+def memory_key(model, normalized):
+    """Return the lookup key of a normalised source translated by a model"""
+    return hashlib.sha1(f"{model}\0{normalized}".encode('utf-8')).hexdigest()
+
+
+class TranslationStats:
+    """Hit counts and inference time saved by a TranslationMemory"""
+
+    def __init__(self):
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self.saved_ms = 0.0  # inference time the hits took when they were first translated
+        self.inference_ms = 0.0  # inference time spent on misses
+
+    @property
+    def lookups(self):
+        return self.exact_hits + self.fuzzy_hits + self.misses
+
+    @property
+    def hit_rate(self):
+        return (self.exact_hits + self.fuzzy_hits) / self.lookups if self.lookups else 0.0
+
+    def __str__(self):
+        return (f"{self.lookups} sentences: {self.exact_hits} exact and {self.fuzzy_hits} fuzzy hits "
+                f"({self.hit_rate:.0%}), {self.misses} translated in {self.inference_ms / 1000:.1f} s, "
+                f"saved about {self.saved_ms / 1000:.1f} s of inference")
+
+
+class TranslationMemory:
+    """SQLite store of earlier translations, consulted before running the model
+
+    Sentences are looked up by a hash of their normalised text and the model
+    id. A miss can still be served by a near-identical stored sentence of the
+    same model: one with the same content words (only articles and punctuation
+    may differ) and a difflib ratio >= fuzzy_cutoff. Only the remaining
+    sentences are translated, once each, and stored with the time their
+    inference took so later hits can report the time they saved.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS translations (
+            key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            source TEXT NOT NULL,
+            target TEXT NOT NULL,
+            inference_ms REAL NOT NULL,
+            created_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_translations_model ON translations(model);
+    """
+
+    def __init__(self, db_path=TRANSLATION_MEMORY_PATH, fuzzy_cutoff=FUZZY_MATCH_CUTOFF):
+        self.db_path = db_path
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.stats = TranslationStats()
+        self._local = threading.local()
+        self._sources = {}  # model -> {content words: [normalised sources]}, loaded on first fuzzy lookup
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(self.SCHEMA)
+
+    def _connection(self):
+        """Return this thread's connection, opening it on first use"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _lookup(self, model, normalized):
+        """Return (target, inference_ms) stored for a normalised source, or None"""
+        return self._connection().execute(
+            "SELECT target, inference_ms FROM translations WHERE key = ?", (memory_key(model, normalized),)
+        ).fetchone()
+
+    def _sources_by_content(self, model):
+        sources = self._sources.get(model)
+        if sources is None:
+            sources = {}
+            for (source,) in self._connection().execute("SELECT source FROM translations WHERE model = ?", (model,)):
+                sources.setdefault(content_words(source), []).append(source)
+            self._sources[model] = sources
+        return sources
+
+    def _fuzzy_lookup(self, model, normalized):
+        """Return (target, inference_ms) of the closest stored source with the same content words, or None"""
+        if self.fuzzy_cutoff >= 1.0:
+            return None
+        candidates = self._sources_by_content(model).get(content_words(normalized), ())
+        matches = difflib.get_close_matches(normalized, candidates[:FUZZY_MAX_CANDIDATES], n=1,
+                                            cutoff=self.fuzzy_cutoff)
+        return self._lookup(model, matches[0]) if matches else None
+
+    def _store(self, model, items):
+        """Store (normalised source, target, inference_ms) translations of a model"""
+        connection = self._connection()
+        created_at = time.time()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO translations (key, model, source, target, inference_ms, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(memory_key(model, source), model, source, target, inference_ms, created_at)
+                 for source, target, inference_ms in items]
+            )
+        sources = self._sources.get(model)
+        if sources is not None:
+            for source, _, _ in items:
+                sources.setdefault(content_words(source), []).append(source)
+
+    def translate(self, texts, translate, model):
+        """Translate texts, running translate only on sentences the memory cannot serve
+
+        Args:
+            texts: English sentences
+            translate: Function translating a list of sentences, in order
+            model: Id of the model behind translate; entries of other models are not reused
+
+        Returns:
+            list: Translations in the order of texts
+        """
+        normalized_texts = [normalize_text(text) for text in texts]
+        found = {}  # normalised source -> translation
+        costs = {}  # normalised source -> inference time of its translation
+        missing = {}  # normalised source -> original text sent to the model
+        for text, normalized in zip(texts, normalized_texts):
+            if normalized in found or normalized in missing:
+                continue
+            row = self._lookup(model, normalized)
+            if row is not None:
+                self.stats.exact_hits += 1
+            else:
+                row = self._fuzzy_lookup(model, normalized)
+                if row is not None:
+                    self.stats.fuzzy_hits += 1
+            if row is not None:
+                found[normalized], costs[normalized] = row
+                self.stats.saved_ms += row[1]
+            else:
+                missing[normalized] = text
+
+        if missing:
+            sources = list(missing)
+            started = time.perf_counter()
+            targets = translate([missing[source] for source in sources])
+            inference_ms = (time.perf_counter() - started) * 1000
+            self.stats.misses += len(sources)
+            self.stats.inference_ms += inference_ms
+            per_sentence_ms = inference_ms / len(sources)
+            self._store(model, [(source, target, per_sentence_ms) for source, target in zip(sources, targets)])
+            found.update(zip(sources, targets))
+            costs.update((source, per_sentence_ms) for source in sources)
+
+        # Repeats within a call are translated once and count as exact hits
+        seen = set()
+        for normalized in normalized_texts:
+            if normalized in seen:
+                self.stats.exact_hits += 1
+                self.stats.saved_ms += costs[normalized]
+            seen.add(normalized)
+        return [found[normalized] for normalized in normalized_texts]
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def close(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
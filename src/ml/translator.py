@@ -0,0 +1,92 @@
+import logging
+import os
+
+import torch
+from transformers import MarianMTModel, MarianTokenizer
+
+from src.ml.batching import length_sorted_batches
+
+logger = logging.getLogger(__name__)
+
+# Hugging Face model translating English questions and answers to Vietnamese
+TRANSLATION_MODEL = os.environ.get("TRANSLATION_MODEL", "Helsinki-NLP/opus-mt-en-vi")
+
+# Intra-op CPU threads used by torch; 0 keeps torch's default (one per core)
+TRANSLATION_THREADS = int(os.environ.get("TRANSLATION_THREADS", "0"))
+
+# Run the model with int8 dynamically quantised Linear layers on CPU ("1" to enable)
+TRANSLATION_QUANTIZE = os.environ.get("TRANSLATION_QUANTIZE", "0") == "1"
+
+# Sentences translated per forward pass
+TRANSLATION_BATCH_SIZE = 16
+
+# Cap on sentences x longest sentence (in characters) per batch, so batches of long sentences shrink
+TRANSLATION_MAX_BATCH_CHARS = 4096
+
+# Upper bound on the length of a translation, in tokens
+MAX_TRANSLATION_TOKENS = 256
+
+
+class Translator:
+    """English to Vietnamese translation with a MarianMT model
+
+    Sentences are grouped into batches of similar length and each batch is
+    padded only to its own longest sentence, so short questions do not pay for
+    the padding of long answers.
+
+    With quantize, the weights of every Linear layer are converted to int8 and
+    activations are quantised on the fly (torch dynamic quantisation). This
+    runs on CPU only and trades a little accuracy for speed and memory; use
+    src/benchmark_quantization.py to measure both on our labels.
+    """
+
+    def __init__(self, model_name=TRANSLATION_MODEL, device=None, num_threads=TRANSLATION_THREADS,
+                 quantize=TRANSLATION_QUANTIZE, batch_size=TRANSLATION_BATCH_SIZE):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.quantized = quantize
+        if quantize:
+            # Quantised kernels exist only for CPU
+            device = "cpu"
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        self.tokenizer = MarianTokenizer.from_pretrained(model_name)
+        model = MarianMTModel.from_pretrained(model_name)
+        model.eval()
+        if quantize:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.model = model.to(self.device)
+        logger.info(f"Translation model {self.model_id} ready on {self.device} with {torch.get_num_threads()} threads")
+
+    @property
+    def model_id(self):
+        """Name of the model including its precision, e.g. for keying remembered translations"""
+        return f"{self.model_name}+int8" if self.quantized else self.model_name
+
+    def translate(self, texts, batch_size=None, max_batch_chars=TRANSLATION_MAX_BATCH_CHARS):
+        """Translate a list of sentences, keeping their order
+
+        Args:
+            texts: English sentences
+            batch_size: Sentences per forward pass, self.batch_size by default
+            max_batch_chars: Cap on sentences x longest sentence per batch
+        """
+        translations = [None] * len(texts)
+        for batch in length_sorted_batches([len(text) for text in texts], batch_size or self.batch_size,
+                                           max_batch_chars):
+            inputs = self.tokenizer([texts[i] for i in batch], return_tensors="pt",
+                                    padding="longest", truncation=True).to(self.device)
+            with torch.inference_mode():
+                outputs = self.model.generate(**inputs, max_new_tokens=MAX_TRANSLATION_TOKENS)
+            for i, translation in zip(batch, self.tokenizer.batch_decode(outputs, skip_special_tokens=True)):
+                translations[i] = translation
+        return translations
+
+
+def create_translator(model_name=None, device=None, num_threads=None, quantize=None, batch_size=None):
+    """Plugin factory used by src.ml.plugins; None arguments take the TRANSLATION_* defaults"""
+    return Translator(model_name or TRANSLATION_MODEL, device,
+                      num_threads if num_threads is not None else TRANSLATION_THREADS,
+                      quantize if quantize is not None else TRANSLATION_QUANTIZE,
+                      batch_size or TRANSLATION_BATCH_SIZE)
@@ -0,0 +1,119 @@
+import sys
+import os
+import argparse
+import logging
+import time
+
+# Add the src directory to the path to allow absolute imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.image_list import is_image_file
+from src.core.label_store import create_label_store, DEFAULT_LABEL_BACKEND, DEFAULT_LABEL_DB, LABEL_BACKENDS
+from src.core.question_record import DRAFT_KEY
+from src.core.tag_taxonomy import TagTaxonomy
+from src.ml import plugins
+from src.ml.dataset_translation import read_pairs, draft_label, translate_pairs, DATASET_IMAGE_SOURCE
+from src.ml.translation_memory import TranslationMemory, TRANSLATION_MEMORY_PATH, FUZZY_MATCH_CUTOFF
+
+logger = logging.getLogger(__name__)
+
+# Pairs translated and written per step; an interrupted run loses at most one chunk
+TRANSLATION_CHUNK_SIZE = 256
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Translate English VQA pairs into draft Vietnamese labels for annotators to verify"
+    )
+    parser.add_argument("pairs", help="JSON or JSON Lines file of {image_id, question, answer(s), answerable, tags, question_type}")
+    parser.add_argument("--images", default="data/image", help="Image folder; pairs of missing images are skipped")
+    parser.add_argument("--labels", default="data/labels", help="JSON label folder")
+    parser.add_argument("--backend", choices=LABEL_BACKENDS, default=DEFAULT_LABEL_BACKEND, help="Label store backend")
+    parser.add_argument("--db", default=DEFAULT_LABEL_DB, help="SQLite database path")
+    parser.add_argument("--image-source", default=DATASET_IMAGE_SOURCE, help="image_source of the drafted labels")
+    parser.add_argument("--model", default=None, help="Translation model (default TRANSLATION_MODEL)")
+    parser.add_argument("--threads", type=int, default=None, help="CPU threads used by torch (default TRANSLATION_THREADS)")
+    parser.add_argument("--quantize", action="store_true", default=None,
+                        help="Run the model with int8 dynamic quantisation on CPU (default TRANSLATION_QUANTIZE)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Sentences per forward pass (default TRANSLATION_BATCH_SIZE)")
+    parser.add_argument("--chunk-size", type=int, default=TRANSLATION_CHUNK_SIZE, help="Pairs written per step")
+    parser.add_argument("--memory", default=TRANSLATION_MEMORY_PATH, help="Translation memory database")
+    parser.add_argument("--no-memory", action="store_true", help="Translate every sentence with the model")
+    parser.add_argument("--fuzzy-cutoff", type=float, default=FUZZY_MATCH_CUTOFF,
+                        help="Similarity needed to reuse the translation of a sentence with the same content words (1 disables)")
+    return parser.parse_args()
+
+def pending_pairs(pairs, label_store, image_ids):
+    """Return the pairs still to translate: images that exist and have no label yet
+
+    Labels are never overwritten, so a rerun after an interruption resumes
+    where the previous run stopped.
+    """
+    labeled = label_store.scan()
+    pending = [pair for pair in pairs if pair.image_id not in labeled and pair.image_id in image_ids]
+    missing = sum(1 for pair in pairs if pair.image_id not in image_ids)
+    if missing:
+        logger.warning(f"Skipping {missing} pairs whose image is not in the image folder")
+    logger.info(f"{len(pairs) - len(pending) - missing} pairs already labeled, {len(pending)} to translate")
+    return pending
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    args = parse_args()
+
+    label_store = create_label_store(args.backend, args.labels, args.db)
+    image_ids = {name.rsplit('.', 1)[0] for name in os.listdir(args.images) if is_image_file(name)}
+    pairs = pending_pairs(read_pairs(args.pairs), label_store, image_ids)
+    if not pairs:
+        label_store.close()
+        sys.exit(0)
+
+    # Loaded only now, so --help and a finished run never import torch
+    try:
+        translator = plugins.registry.create("translator", model_name=args.model, num_threads=args.threads,
+                                             quantize=args.quantize, batch_size=args.batch_size)
+    except plugins.PluginUnavailable as e:
+        logger.error(str(e))
+        label_store.close()
+        sys.exit(1)
+    taxonomy = TagTaxonomy.load()
+
+    # Sentences seen in earlier runs (or earlier in this one) are served from the memory
+    memory = None
+    if not args.no_memory:
+        memory = TranslationMemory(args.memory, args.fuzzy_cutoff)
+        logger.info(f"Translation memory {args.memory} holds {len(memory)} translations")
+
+    def translate(texts):
+        """Translate with the model, through the memory unless it is disabled"""
+        if memory is None:
+            return translator.translate(texts)
+        return memory.translate(texts, translator.translate, translator.model_id)
+
+    started = time.perf_counter()
+    written = 0
+    try:
+        for start in range(0, len(pairs), args.chunk_size):
+            chunk = pairs[start:start + args.chunk_size]
+            for pair, question, answer in translate_pairs(chunk, translate):
+                label = draft_label(pair, question, answer, args.image_source, taxonomy)
+                # Checked again right before writing, in case an annotator labelled the image meanwhile
+                if label_store.load_text(pair.image_id) is not None:
+                    logger.info(f"Not overwriting the label of {pair.image_id}")
+                    continue
+                # Marked as a draft until an annotator confirms it, for the "Cần duyệt" filter
+                data = label.to_dict()
+                data[DRAFT_KEY] = True
+                label_store.save(pair.image_id, data)
+                written += 1
+            elapsed = time.perf_counter() - started
+            done = min(start + args.chunk_size, len(pairs))
+            logger.info(f"Translated {done}/{len(pairs)} pairs ({done / elapsed:.1f} pairs/s)")
+    except KeyboardInterrupt:
+        logger.warning("Interrupted - run the same command again to resume")
+    finally:
+        label_store.close()
+        if memory is not None:
+            memory.close()
+    logger.info(f"Wrote {written} draft labels")
+    if memory is not None:
+        logger.info(f"Translation memory: {memory.stats}")
@@ -0,0 +1,107 @@
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QComboBox, QPushButton
+from PyQt5.QtCore import pyqtSignal
+
+# Filterable fields and their labels, in display order
+FILTER_FIELDS = [
+    ('tags', "Tag"),
+    ('question_type', "Loại câu hỏi"),
+    ('answerable', "Trả lời được"),
+    ('qa_source', "Nguồn QA"),
+    ('image_source', "Nguồn ảnh"),
+    ('needs_review', "Cần duyệt"),
+]
+
+# Display names of stored values
+VALUE_NAMES = {
+    'answerable': {1: "Có", 0: "Không"},
+    'needs_review': {1: "Có", 0: "Không"},
+    'qa_source': {
+        'manually_annotated': "Manually Annotated",
+        'translated_from_dataset': "Dataset Translation",
+        'generated_by_ai': "AI Generation",
+        'others': "Others",
+    },
+    'image_source': {
+        'manually_collected': "Manual Collected",
+        'image_crowdsourcing': "Image Crowdsourcing",
+        'filtered_dataset': "Filtered Dataset",
+        'others': "Others",
+    },
+}
+
+
+class FilterBar(QWidget):
+    """Row of filters that restrict Next/Back to images whose label matches"""
+
+    # dict of field -> value, empty when no filter is set
+    filters_changed = pyqtSignal(dict)
+
+    def __init__(self):
+        super().__init__()
+        self.combos = {}
+        self.init_ui()
+
+    def init_ui(self):
+        """Initialize the filter bar UI"""
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        layout.addWidget(QLabel("Lọc:"))
+        for field, label in FILTER_FIELDS:
+            combo = QComboBox()
+            combo.setToolTip(label)
+            combo.addItem(f"{label}: Tất cả", None)
+            combo.currentIndexChanged.connect(self._emit_filters)
+            self.combos[field] = combo
+            layout.addWidget(combo)
+
+        self.clear_button = QPushButton("Xóa lọc")
+        self.clear_button.clicked.connect(self.clear)
+        layout.addWidget(self.clear_button)
+
+        self.match_label = QLabel("Đang tạo chỉ mục...")
+        layout.addWidget(self.match_label)
+        layout.addStretch()
+
+        self.setLayout(layout)
+        self.setEnabled(False)
+
+    def set_values(self, facet_index):
+        """Fill the filters with the values found in the labels, keeping the current selection"""
+        for field, label in FILTER_FIELDS:
+            combo = self.combos[field]
+            selected = combo.currentData()
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem(f"{label}: Tất cả", None)
+            names = VALUE_NAMES.get(field, {})
+            for value, count in facet_index.values(field):
+                combo.addItem(f"{label}: {names.get(value, value)} ({count})", value)
+            index = combo.findData(selected) if selected is not None else 0
+            combo.setCurrentIndex(max(index, 0))
+            combo.blockSignals(False)
+        self.setEnabled(True)
+
+    def filters(self):
+        """Return the selected filters as a dict of field -> value"""
+        return {
+            field: combo.currentData()
+            for field, combo in self.combos.items()
+            if combo.currentData() is not None
+        }
+
+    def set_match_count(self, count):
+        """Show how many images match the filters, or None when no filter is set"""
+        self.match_label.setText("" if count is None else f"{count} ảnh phù hợp")
+
+    def clear(self):
+        """Reset every filter"""
+        for combo in self.combos.values():
+            combo.blockSignals(True)
+            combo.setCurrentIndex(0)
+            combo.blockSignals(False)
+        self._emit_filters()
+
+    def _emit_filters(self):
+        self.filters_changed.emit(self.filters())
@@ -1,16 +1,37 @@
 from PyQt5.QtWidgets import QLabel
 from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
+
+from src.imaging.decoder import load_scaled
+
+# Width and height of the (square) display area in pixels
+VIEWER_SIZE = 600
 
 class ImageViewer(QLabel):
-    def __init__(self):
+    # Path of an image that is now on screen
+    image_shown = pyqtSignal(str)
+
+    def __init__(self, prefetcher=None, preview_cache=None):
         super().__init__()
+        # Optional ImagePrefetcher - when set, images are decoded off the GUI thread
+        self.prefetcher = prefetcher
+        # Optional PreviewCache checked before decoding when there is no prefetcher
+        self.preview_cache = preview_cache
+        self._pending_path = None
         self.init_ui()
 
+        if self.prefetcher is not None:
+            # Decode straight to the display size instead of full resolution
+            self.prefetcher.set_target_size(VIEWER_SIZE, VIEWER_SIZE)
+            self.prefetcher.image_ready.connect(self._on_image_ready)
+            self.prefetcher.image_failed.connect(self._on_image_failed)
+
     def init_ui(self):
         """Initialize the image viewer UI"""
-        self.setFixedSize(600, 600)
-        self.setScaledContents(True)
+        self.setFixedSize(VIEWER_SIZE, VIEWER_SIZE)
+        # Images are decoded at display size, so they are shown as-is and centered
+        # (scaled contents would stretch them and ignore the aspect ratio)
+        self.setScaledContents(False)
         self.setAlignment(Qt.AlignCenter)
         self.setStyleSheet("""
             QLabel {
@@ -23,10 +44,48 @@ class ImageViewer(QLabel):
     def load_image(self, image_path):
         """Load and display an image"""
         if image_path and image_path.strip():
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                self.setPixmap(pixmap)
+            if self.prefetcher is not None:
+                pixmap = self.prefetcher.get(image_path)
+                if pixmap is None:
+                    # Not decoded yet - show a placeholder until the worker pool delivers it
+                    self._pending_path = image_path
+                    self.setText("Loading image...")
+                    self.prefetcher.request(image_path)
+                    return
             else:
-                self.setText("Error loading image")
+                pixmap = self._decode(image_path)
+
+            self._pending_path = None
+            self._show_pixmap(pixmap, image_path)
         else:
-            self.setText("No image available") 
\ No newline at end of file
+            self._pending_path = None
+            self.setText("No image available")
+
+    def _decode(self, image_path):
+        """Decode an image at display size on the GUI thread"""
+        preview_cache = self.prefetcher.preview_cache if self.prefetcher is not None else self.preview_cache
+        return QPixmap.fromImage(load_scaled(image_path, VIEWER_SIZE, VIEWER_SIZE, preview_cache))
+
+    def _show_pixmap(self, pixmap, image_path):
+        """Display a pixmap, or an error message if it is empty"""
+        if not pixmap.isNull():
+            self.setPixmap(pixmap)
+            self.image_shown.emit(image_path)
+        else:
+            self.setText("Error loading image")
+
+    def _on_image_ready(self, image_path):
+        """Show a prefetched image if it is the one currently waited for"""
+        if image_path == self._pending_path:
+            self._pending_path = None
+            pixmap = self.prefetcher.get(image_path)
+            if pixmap is None:
+                # The pixmap cache refused it (larger than its byte budget) - decode it again here
+                pixmap = self._decode(image_path)
+            self._show_pixmap(pixmap, image_path)
+
+    def _on_image_failed(self, image_path):
+        """Report a decode failure for the image currently waited for"""
+        if image_path == self._pending_path:
+            self._pending_path = None
+            self.setText("Error loading image")
@@ -4,6 +4,8 @@ from PyQt5.QtCore import pyqtSignal
 class NavigationButtons(QWidget):
     next_clicked = pyqtSignal()
     back_clicked = pyqtSignal()
+    next_unlabeled_clicked = pyqtSignal()
+    prev_unlabeled_clicked = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -16,16 +18,24 @@ class NavigationButtons(QWidget):
         layout.setSpacing(10)
 
         # Create buttons
+        self.prev_unlabeled_button = QPushButton("<< Unlabeled")
         self.back_button = QPushButton("Back")
         self.next_button = QPushButton("Next")
+        self.next_unlabeled_button = QPushButton("Unlabeled >>")
+        self.prev_unlabeled_button.setToolTip("Jump to the previous unlabeled image")
+        self.next_unlabeled_button.setToolTip("Jump to the next unlabeled image")
 
         # Connect signals
         self.back_button.clicked.connect(self.back_clicked.emit)
         self.next_button.clicked.connect(self.next_clicked.emit)
+        self.prev_unlabeled_button.clicked.connect(self.prev_unlabeled_clicked.emit)
+        self.next_unlabeled_button.clicked.connect(self.next_unlabeled_clicked.emit)
 
         # Add buttons to layout
+        layout.addWidget(self.prev_unlabeled_button)
         layout.addWidget(self.back_button)
         layout.addWidget(self.next_button)
+        layout.addWidget(self.next_unlabeled_button)
 
         self.setLayout(layout)
         self.apply_styles()
@@ -51,6 +61,8 @@ class NavigationButtons(QWidget):
         """
         self.back_button.setStyleSheet(button_style)
         self.next_button.setStyleSheet(button_style)
+        self.prev_unlabeled_button.setStyleSheet(button_style)
+        self.next_unlabeled_button.setStyleSheet(button_style)
 
     def set_back_enabled(self, enabled):
         """Enable/disable the back button"""
@@ -58,4 +70,9 @@ class NavigationButtons(QWidget):
 
     def set_next_enabled(self, enabled):
         """Enable/disable the next button"""
-        self.next_button.setEnabled(enabled) 
\ No newline at end of file
+        self.next_button.setEnabled(enabled)
+
+    def set_unlabeled_jumps_enabled(self, prev_enabled, next_enabled):
+        """Enable/disable the jump to previous/next unlabeled buttons"""
+        self.prev_unlabeled_button.setEnabled(prev_enabled)
+        self.next_unlabeled_button.setEnabled(next_enabled) 
\ No newline at end of file
@@ -0,0 +1,99 @@
+import logging
+import time
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+# Pause in typing before the search runs
+SEARCH_DEBOUNCE_MS = 150
+
+
+class SearchPanel(QWidget):
+    """Search box over label questions and answers, with ranked results"""
+
+    # Image id of the result the user opened
+    image_selected = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.search_index = None
+        self.init_ui()
+
+    def init_ui(self):
+        """Initialize the search panel UI"""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(5)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Tìm câu hỏi / câu trả lời (không cần dấu)...")
+        self.search_input.setClearButtonEnabled(True)
+        layout.addWidget(self.search_input)
+
+        self.status_label = QLabel("Đang tạo chỉ mục...")
+        self.status_label.setStyleSheet("color: #7f8c8d;")
+        layout.addWidget(self.status_label)
+
+        self.results_list = QListWidget()
+        self.results_list.setMaximumHeight(180)
+        self.results_list.hide()
+        layout.addWidget(self.results_list)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.run_search)
+
+        self.search_input.textChanged.connect(self._schedule_search)
+        self.search_input.returnPressed.connect(self._open_first_result)
+        self.results_list.itemClicked.connect(self._open_item)
+
+        self.setLayout(layout)
+        self.setEnabled(False)
+
+    def set_index(self, search_index):
+        """Start searching the given index"""
+        self.search_index = search_index
+        self.status_label.setText(f"{len(search_index)} nhãn có thể tìm kiếm")
+        self.setEnabled(True)
+        if self.search_input.text():
+            self.run_search()
+
+    def run_search(self):
+        """Search for the current text and show the ranked results"""
+        self._search_timer.stop()
+        query = self.search_input.text()
+        self.results_list.clear()
+        if self.search_index is None or not query.strip():
+            self.results_list.hide()
+            if self.search_index is not None:
+                self.status_label.setText(f"{len(self.search_index)} nhãn có thể tìm kiếm")
+            return
+
+        started = time.perf_counter()
+        results = self.search_index.search(query)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"Search '{query}' returned {len(results)} results in {elapsed_ms:.1f} ms")
+
+        for image_id, _ in results:
+            question, answers = self.search_index.document(image_id)
+            item = QListWidgetItem(f"{image_id}: {question} → {answers}")
+            item.setToolTip(f"{question}\n{answers}")
+            item.setData(Qt.UserRole, image_id)
+            self.results_list.addItem(item)
+
+        self.status_label.setText(f"{len(results)} kết quả ({elapsed_ms:.0f} ms)")
+        self.results_list.setVisible(bool(results))
+
+    def _schedule_search(self, _text):
+        self._search_timer.start()
+
+    def _open_first_result(self):
+        self.run_search()
+        if self.results_list.count():
+            self._open_item(self.results_list.item(0))
+
+    def _open_item(self, item):
+        self.image_selected.emit(item.data(Qt.UserRole))
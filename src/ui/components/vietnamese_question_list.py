@@ -1,92 +1,108 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                           QTextEdit, QPushButton, QListWidget, QListWidgetItem,
+                           QTextEdit, QPushButton, QListWidget, QListWidgetItem, QListView,
                            QComboBox, QCheckBox, QLineEdit, QInputDialog, QMessageBox,
                            QFrame, QGroupBox, QGridLayout)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QStringListModel
 from PyQt5.QtGui import QKeyEvent
 
 import logging
 
+from src.core.question_record import (QuestionRecord, QUESTION_FIELDS, QUESTION_TYPES, UNANSWERABLE_TEXT,
+                                      DEFAULT_IMAGE_SOURCE)
+from src.core.label_session import validate_question
+from src.core.tag_taxonomy import TagTaxonomy
+from src.ui.styles import set_state
+
 logger = logging.getLogger(__name__)
 
 # Maximum number of questions allowed per image
 MAX_QUESTIONS = 1  # Giới hạn chỉ 1 câu hỏi
 
-# Question type configuration - easy to modify later
-QUESTION_TYPES = [
-    "Existence Checking",
-    "Others"
-]
+# Editable fields tracked for changes against the loaded question
+TRACKED_FIELDS = QUESTION_FIELDS + ('image_source',)
 
-# Predefined tags for tag suggestions
-PREDEFINED_TAGS = [
-    "WATER_BOTTLE",
-    "CUP",
-    "WALLET",
-    "REMOTE"
-]
+# Delay before a burst of edits is evaluated for the Confirm/Revert buttons
+STATE_UPDATE_DELAY_MS = 50
 
 class TagButton(QPushButton):
-    """Custom button for displaying a selected tag with a remove option"""
+    """Custom button for displaying a selected tag with a remove option
+
+    Buttons are pooled by the question list and rebound with set_tag, so their
+    look comes from the QPushButton#tagButton rule of APP_STYLESHEET instead of
+    a stylesheet each.
+    """
     
     removed = pyqtSignal(str)
     
-    def __init__(self, tag_text):
+    def __init__(self, tag_text=""):
         super().__init__()
-        self.tag = tag_text
-        self.setText(f"{tag_text} ✕")
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border-radius: 12px;
-                padding: 4px 8px;
-                margin: 2px;
-                font-size: 12px;
-                max-height: 24px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        self.setObjectName("tagButton")
+        self.tag = None
+        self.set_tag(tag_text)
         self.clicked.connect(self._on_remove)
+
+    def set_tag(self, tag_text):
+        """Show another tag on this button"""
+        if tag_text != self.tag:
+            self.tag = tag_text
+            self.setText(f"{tag_text} ✕")
         
     def _on_remove(self):
         """Emit signal when tag is removed"""
         self.removed.emit(self.tag)
 
-class TagSuggestionList(QListWidget):
-    """List widget for displaying tag suggestions"""
+class TagSuggestionList(QListView):
+    """Popup list of tag suggestions, backed by a string list model
+
+    Each query replaces the model's list in one reset instead of deleting and
+    creating an item per suggestion.
+    """
     
     tag_selected = pyqtSignal(str)
     
     def __init__(self):
         super().__init__()
         self.setWindowFlags(Qt.Popup)
+        self.setEditTriggers(QListView.NoEditTriggers)
+        self.setUniformItemSizes(True)
+        self._model = QStringListModel(self)
+        self.setModel(self._model)
         self.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 1px solid #bdc3c7;
                 border-radius: 5px;
                 background-color: white;
                 font-size: 13px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 5px;
                 border-bottom: 1px solid #ecf0f1;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #3498db;
                 color: white;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #ecf0f1;
             }
         """)
-        self.itemClicked.connect(self._on_item_clicked)
+        self.clicked.connect(self._on_item_clicked)
+
+    def set_tags(self, tags):
+        """Show a new list of suggestions"""
+        self._model.setStringList(tags)
+
+    def count(self):
+        """Return the number of suggestions shown"""
+        return self._model.rowCount()
+
+    def first_tag(self):
+        """Return the best suggestion, or None"""
+        return self._model.index(0).data() if self.count() else None
         
-    def _on_item_clicked(self, item):
+    def _on_item_clicked(self, index):
         """Emit signal when tag is selected"""
-        self.tag_selected.emit(item.text())
+        self.tag_selected.emit(index.data())
         self.hide()
 
 class VietnameseQuestionList(QWidget):
@@ -96,13 +112,33 @@ class VietnameseQuestionList(QWidget):
     content_changed = pyqtSignal()
     # Signal emitted when a question is confirmed and should be saved
     question_confirmed = pyqtSignal()
+    # Signal emitted on every edit, including typing in the text fields
+    edited = pyqtSignal()
     
     def __init__(self):
         super().__init__()
         self.questions = []
         self.modified = False
         self.image_source = "manually_collected"  # Default to "Manually Collected"
+        self._original_state = None
+        self._original_image_source = None
+        # AI suggestion shown on an unlabeled image; edits are compared against it instead of the defaults
+        self._suggested_state = None
+
+        # Edited fields waiting to be compared, and fields that differ from the original.
+        # Widgets only mark their field; the comparison runs once per burst of edits.
+        self._dirty_fields = set()
+        self._changed_fields = set()
+        self._state_timer = QTimer(self)
+        self._state_timer.setSingleShot(True)
+        self._state_timer.setInterval(STATE_UPDATE_DELAY_MS)
+        self._state_timer.timeout.connect(self._flush_dirty_fields)
+
+        # Allowed tags, ranked by usage once the label index is built
+        self.tag_taxonomy = TagTaxonomy.load()
+
         self.init_ui()
+        self.content_changed.connect(self.edited)
         
         # Set default state after initialization
         QTimer.singleShot(100, self._setup_initial_state)
@@ -114,11 +150,8 @@ class VietnameseQuestionList(QWidget):
         main_layout.setContentsMargins(10, 10, 10, 10)  # Revert to original margins
         main_layout.setSpacing(10)  # Revert to original spacing
         
-        # Set background color for the entire widget
-        self.setStyleSheet("""
-            background-color: #ebeef2;
-            font-family: 'Segoe UI', 'Arial', sans-serif;
-        """)
+        # Background and font of the entire widget come from APP_STYLESHEET
+        self.setObjectName("questionList")
         
         # Image source section - at the top
         self._create_image_source_section(main_layout)
@@ -336,7 +369,7 @@ class VietnameseQuestionList(QWidget):
             font-size: 13px;
         """)
         self.question_text.setMinimumHeight(32)  # Increased height for better usability
-        self.question_text.textChanged.connect(self._on_content_changed)
+        self.question_text.textChanged.connect(self._on_question_text_changed)
         
         # Connect Enter key press to confirm question
         self.question_text.returnPressed.connect(self._confirm_question)
@@ -352,14 +385,14 @@ class VietnameseQuestionList(QWidget):
         type_layout.addWidget(type_label)
         
         self.question_type_combo = QComboBox()
-        self.question_type_combo.addItem("Existence Checking", "Existence Checking")
-        self.question_type_combo.addItem("Others", "Others")
+        for question_type in QUESTION_TYPES:
+            self.question_type_combo.addItem(question_type, question_type)
         
         # Log the available question types for debugging
         for i in range(self.question_type_combo.count()):
             data_value = self.question_type_combo.itemData(i)
             display_text = self.question_type_combo.itemText(i)
-            logger.info(f"Question type combo option {i}: text='{display_text}', value='{data_value}' (type: {type(data_value).__name__})")
+            logger.debug(f"Question type combo option {i}: text='{display_text}', value='{data_value}' (type: {type(data_value).__name__})")
         
         self.question_type_combo.setMinimumWidth(150)
         self.question_type_combo.setStyleSheet("""
@@ -444,17 +477,6 @@ class VietnameseQuestionList(QWidget):
                 background: transparent;
                 color: #2c3e50;
             }
-            QLineEdit {
-                border: 1px solid #bdc3c7;
-                padding: 3px;
-                background-color: white;
-                min-height: 25px;
-                border-radius: 5px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #3498db;
-            }
             QCheckBox {
                 color: #2c3e50;
             }
@@ -489,15 +511,9 @@ class VietnameseQuestionList(QWidget):
         # Replace QTextEdit with QLineEdit for single line answer input
         self.answer_text = QLineEdit()
         self.answer_text.setPlaceholderText("Nhập câu trả lời tại đây...")
-        self.answer_text.setStyleSheet("""
-            background-color: white;
-            border: 1px solid #bdc3c7;
-            border-radius: 5px;
-            padding: 8px;
-            font-size: 13px;
-        """)
+        self.answer_text.setObjectName("answerText")  # styled by APP_STYLESHEET
         self.answer_text.setMinimumHeight(32)  # Increased height for better usability
-        self.answer_text.textChanged.connect(self._on_content_changed)
+        self.answer_text.textChanged.connect(self._on_answer_text_changed)
         answer_layout.addWidget(self.answer_text)
         
         # Add to parent layout
@@ -556,11 +572,7 @@ class VietnameseQuestionList(QWidget):
         
         # Create a container for the tag search and display area
         tags_container = QWidget()
-        tags_container.setStyleSheet("""
-            background-color: white;
-            border: 1px solid #bdc3c7;
-            border-radius: 5px;
-        """)
+        tags_container.setObjectName("tagsContainer")  # styled by APP_STYLESHEET
         tags_container_layout = QVBoxLayout(tags_container)
         tags_container_layout.setContentsMargins(5, 5, 5, 5)
         tags_container_layout.setSpacing(3)
@@ -573,6 +585,9 @@ class VietnameseQuestionList(QWidget):
         self.tags_display_layout.setSpacing(3)
         self.tags_display_layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         
+        # Tag buttons created so far, in layout order; the first len(selected_tags) are shown
+        self._tag_buttons = []
+        
         # Make the tags section wider by setting a minimum width
         tags_container.setMinimumWidth(270)
         
@@ -772,17 +787,11 @@ class VietnameseQuestionList(QWidget):
         parent_layout.addLayout(buttons_layout)
         
         # Connect signals for all UI elements that trigger modified state
-        # Question text changes
-        self.question_text.textChanged.connect(self._on_content_changed)
-        
+        # (question and answer text are connected where they are created)
         # Question type changes
         self.question_type_combo.currentIndexChanged.connect(self._on_question_type_changed)
         
-        # Answerable checkbox changes 
-        self.can_answer_check.stateChanged.connect(self._on_can_answer_changed)
-        
-        # Tag search field 
-        self.tags_search.textChanged.connect(self._on_content_changed)
+        # The answerable checkbox is connected where it is created
         
         # QA source changes
         self.source_combo.currentIndexChanged.connect(self._on_source_changed)
@@ -792,20 +801,7 @@ class VietnameseQuestionList(QWidget):
     
     def _create_default_question(self, answerable=0):
         """Tạo câu hỏi mặc định với ID = 1"""
-        self.questions = [{
-            'question_id': 1,
-            'question': '',
-            'question_type': 'existence_checking',  # Default to existence checking
-            'answerable': answerable,  # Use the passed in answerable flag (default 0 - not answerable)
-            'source': 'manually_annotated',  # Default to "Manually Annotated"
-            'answers': [{
-                'answer_id': 1,
-                'answer_text': 'Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh' if answerable == 0 else '',
-                'is_correct': False
-            }],
-            'tags': [],
-            'is_confirmed': False
-        }]
+        self.questions = [self._working_question(QuestionRecord.create(answerable=answerable == 1))]
         
         # Ensure image source is "Manual Collected" by default
         if not self.image_source:
@@ -817,218 +813,116 @@ class VietnameseQuestionList(QWidget):
         self._on_content_changed()
     
     def _update_ui_state(self):
-        """Update UI state based on current form values"""
-        try:
-            logger.info("_update_ui_state called - Updating UI state")
+        """Update button states from the current form values
 
+        Change detection is not done here: self.modified is kept up to date by
+        _flush_dirty_fields, so this only reads a few widget values.
+        """
+        try:
             # Basic field values - these are the ONLY required fields for unlabeled images
             has_text = bool(self.question_text.text().strip())
             has_tags = bool(self.selected_tags)
             is_answerable = self.can_answer_check.isChecked()
             has_answer = bool(self.answer_text.text().strip())
-            
-            # Log field states for debugging
-            logger.info(f"Fields: has_text={has_text}, has_tags={has_tags}, is_answerable={is_answerable}, has_answer={has_answer}")
 
-            # Detect whether this is a new question (no original state)
-            has_original_data = hasattr(self, '_original_state') and self._original_state is not None
-            
-            # SIMPLIFIED LOGIC for NEW questions
-            if not has_original_data:
-                # For new questions - require text, tags, and answer if answerable is checked
-                logger.info("No original state - new unlabeled image")
-                
-                # Basic validation, similar to existing questions:
-                # - Question text and tags are required
-                # - If answerable is checked, answer is required
-                can_confirm = has_text and has_tags and (not is_answerable or (is_answerable and has_answer))
-                
-                logger.info(f"New image validation: text={has_text}, tags={has_tags}, answerable={is_answerable}, answer={has_answer}, can_confirm={can_confirm}")
-                
-                # Update model with current question text 
-                if self.questions and len(self.questions) > 0:
-                    self.questions[0]['question'] = self.question_text.text().strip()
-                
-                # DIRECTLY enable/disable confirm button based on required fields
-                if hasattr(self, 'confirm_question_btn') and self.confirm_question_btn:
-                    self.confirm_question_btn.setEnabled(can_confirm)
-                    logger.info(f"DIRECT confirm button update: enabled={can_confirm}")
-                
-                # Enable cancel button if anything has been filled
-                has_any_content = has_text or has_tags or (is_answerable and has_answer)
-                if hasattr(self, 'cancel_question_btn') and self.cancel_question_btn:
-                    self.cancel_question_btn.setEnabled(has_any_content)
-                
-                # Enable/disable answer field based on can_answer checkbox
-                if hasattr(self, 'answer_text'):
-                    self.answer_text.setReadOnly(not is_answerable)
-                    self.answer_text.setEnabled(True)
-                
-                return  # Skip the rest of the method
-            
-            # Log current state
-            logger.info("_update_ui_state called - Updating UI state")
-            
-            # Kiểm tra xem câu hỏi có nội dung không
-            question_has_text = bool(self.question_text.text().strip())
-            
-            # Check if all required fields are filled
-            has_text = bool(self.question_text.text().strip())
-            has_tags = bool(self.selected_tags)
-            is_answerable = self.can_answer_check.isChecked()
-            has_answer = bool(self.answer_text.text().strip())
-            
-            # Basic validation for form completion
-            basic_validation = has_text and has_tags and (not is_answerable or (is_answerable and has_answer))
-            logger.info(f"Basic validation: {basic_validation} (has_text={has_text}, has_tags={has_tags}, is_answerable={is_answerable}, has_answer={has_answer})")
-            
-            # Check if there are any changes from the original state (for modification mode)
-            has_changes = True  # Default to True for new questions
-            has_original_data = hasattr(self, '_original_state') and self._original_state is not None
-            
-            # For new unlabeled images, we should always be able to confirm if basic validation passes
-            if not has_original_data:
-                logger.info("No original state - new unlabeled image")
-                has_changes = True  # For new questions, we always want to allow confirmation
-            elif has_original_data:
-                # Get current question
-                question = self.questions[0] if self.questions else None
-                if not question:
-                    return
-                    
-                # Get current values for comparison
-                question_text = self.question_text.text().strip()
-                current_question_type = str(self.question_type_combo.currentData()).lower()
-                current_answer = self.answer_text.text().strip()
-                if not is_answerable:
-                    current_answer = "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh"
-                current_tags = set(self.selected_tags)
-                current_source = self.source_combo.currentData()
-                current_image_source = self.image_source
-                
-                # Log current state for debugging
-                logger.info(f"Current state: question='{question_text}', type='{current_question_type}', answerable={is_answerable}, answer='{current_answer}', tags={current_tags}, source='{current_source}'")
-                
-                # Get original values
-                orig_question = self._original_state.get('question', '').strip()
-                orig_question_type = str(self._original_state.get('question_type', '')).lower()
-                orig_answerable = self._original_state.get('answerable', 0) == 1
-                
-                # Log original state for debugging
-                logger.info(f"Original state: question='{orig_question}', type='{orig_question_type}', answerable={orig_answerable}")
-                
-                # Get original answer
-                orig_answer = ""
-                if 'answers' in self._original_state and self._original_state['answers']:
-                    if isinstance(self._original_state['answers'][0], str):
-                        orig_answer = self._original_state['answers'][0].strip()
-                    else:
-                        orig_answer = self._original_state['answers'][0].get('answer_text', '').strip()
-                
-                # Log original answer for debugging
-                logger.info(f"Original answer: '{orig_answer}'")
-                
-                # Get original tags
-                orig_tags = set(self._original_state.get('tags', []))
-                
-                # Get original source
-                orig_source = self._original_state.get('qa_source', self._original_state.get('source', ''))
-                
-                # Get original image source
-                orig_image_source = getattr(self, '_original_image_source', None)
-                
-                # Check if any values have changed using a single comparison for clarity
-                is_different = (
-                    question_text != orig_question or
-                    current_question_type != orig_question_type or
-                    is_answerable != orig_answerable or
-                    current_answer != orig_answer or
-                    current_tags != orig_tags or
-                    current_source != orig_source or
-                    (orig_image_source is not None and current_image_source != orig_image_source)
-                )
-                
-                # Log detailed comparison results for debugging
-                logger.info(f"Is different? {is_different}")
-                if is_different:
-                    logger.info(f"Differences detected in _update_ui_state:")
-                    if question_text != orig_question:
-                        logger.info(f"  - Question text differs: '{question_text}' vs '{orig_question}'")
-                    if current_question_type != orig_question_type:
-                        logger.info(f"  - Question type differs: '{current_question_type}' vs '{orig_question_type}'")
-                    if is_answerable != orig_answerable:
-                        logger.info(f"  - Answerable state differs: {is_answerable} vs {orig_answerable}")
-                    if current_answer != orig_answer:
-                        logger.info(f"  - Answer differs: '{current_answer}' vs '{orig_answer}'")
-                    if current_tags != orig_tags:
-                        logger.info(f"  - Tags differ: {current_tags} vs {orig_tags}")
-                    if current_source != orig_source:
-                        logger.info(f"  - Source differs: '{current_source}' vs '{orig_source}'")
-                    if orig_image_source is not None and current_image_source != orig_image_source:
-                        logger.info(f"  - Image source differs: '{current_image_source}' vs '{orig_image_source}'")
-                
-                # Only allow confirmation if there are actual changes
-                has_changes = is_different
-                
-                # Update revert button based on changes
-                if hasattr(self, 'revert_original_btn') and self.revert_original_btn:
-                    self.revert_original_btn.setVisible(bool(has_original_data))
-                    self.revert_original_btn.setEnabled(bool(has_original_data) and is_different)
-                    logger.info(f"Revert button: visible={bool(has_original_data)}, enabled={bool(has_original_data) and is_different}")
-                
-                # Update modified flag based on changes
-                self.modified = is_different
-            
-            # Logic for enabling the confirm button:
-            # 1. For new questions (no original data): Enable if basic validation passes
-            # 2. For existing questions: Enable if basic validation passes AND there are changes
-            
-            # For unlabeled images (no original data), we should enable confirm if validation passes
-            if not has_original_data:
-                can_confirm = basic_validation
-            else:
-                # For labeled images, only enable if there are changes AND validation passes
-                can_confirm = basic_validation and has_changes
-            
-            # Log the confirm button state decision for debugging
-            logger.info(f"Confirm button enabled decision: {can_confirm} (basic_validation={basic_validation}, has_changes={has_changes}, has_original_data={has_original_data})")
-            
-            if hasattr(self, 'confirm_question_btn') and self.confirm_question_btn:
-                self.confirm_question_btn.setEnabled(can_confirm)
-                logger.info(f"Confirm button enabled: {can_confirm}")
-            
-            # Cancel button luôn được bật nếu có bất kỳ nội dung nào 
-            has_any_content = bool(self.question_text.text().strip()) or bool(self.selected_tags) or (is_answerable and bool(self.answer_text.text().strip()))
-            if hasattr(self, 'cancel_question_btn') and self.cancel_question_btn:
-                self.cancel_question_btn.setEnabled(has_any_content)
-                logger.info(f"Cancel button enabled: {has_any_content}")
-            
-            # Make sure can_answer_check is always enabled from the start
-            if hasattr(self, 'can_answer_check') and self.can_answer_check:
-                self.can_answer_check.setEnabled(True)
+            # Question text and tags are required; if answerable is checked, so is the answer
+            basic_validation = has_text and has_tags and (not is_answerable or has_answer)
+
+            # New questions can be confirmed once valid; labeled ones also need a change
+            has_original_data = self._original_state is not None
+            can_confirm = basic_validation and (not has_original_data or self.modified)
+            self.confirm_question_btn.setEnabled(can_confirm)
+
+            # Cancel button luôn được bật nếu có bất kỳ nội dung nào
+            has_any_content = has_text or has_tags or (is_answerable and has_answer)
+            self.cancel_question_btn.setEnabled(has_any_content)
+
+            self.revert_original_btn.setVisible(has_original_data)
+            self.revert_original_btn.setEnabled(has_original_data and self.modified)
 
-            # Always enable question type combo box
-            if hasattr(self, 'question_type_combo') and self.question_type_combo:
-                self.question_type_combo.setEnabled(True)
-            
-            # Always enable tags field from the start
-            if hasattr(self, 'tags_search') and self.tags_search:
-                self.tags_search.setEnabled(True)
-                
-            # Always enable source combo from the start
-            if hasattr(self, 'source_combo') and self.source_combo:
-                self.source_combo.setEnabled(True)
-            
             # Set answer text area state based only on can_answer_check state, not on confirmation
-            if hasattr(self, 'can_answer_check') and hasattr(self, 'answer_text'):
-                can_answer = self.can_answer_check.isChecked()
-                # Set read-only state based on can_answer
-                self.answer_text.setReadOnly(not can_answer)
-                # Always enable the answer field, regardless of confirmation status
-                self.answer_text.setEnabled(True)
-        except RuntimeError:
-            # Bỏ qua lỗi khi các đối tượng đã bị xóa
+            self.answer_text.setReadOnly(not is_answerable)
+            self.answer_text.setEnabled(True)
+
+            # Runs after every burst of typing - only build the message when it is logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"UI state: valid={basic_validation}, modified={self.modified}, "
+                             f"changed={sorted(self._changed_fields)}, can_confirm={can_confirm}")
+        except (RuntimeError, AttributeError):
+            # Bỏ qua lỗi khi các đối tượng đã bị xóa hoặc chưa được tạo
             pass
+
+    def current_record(self):
+        """Return the question as currently entered in the form"""
+        return QuestionRecord.create(
+            question=self.question_text.text(),
+            question_type=self.question_type_combo.currentData(),
+            answerable=self.can_answer_check.isChecked(),
+            answer=self.answer_text.text(),
+            tags=self.selected_tags,
+            qa_source=self.source_combo.currentData(),
+        )
+
+    @staticmethod
+    def _working_question(record, is_confirmed=False):
+        """Return the editable question dict kept in self.questions for a record"""
+        question = dict(record.to_dict())
+        question['is_confirmed'] = is_confirmed
+        return question
+
+    def _mark_dirty(self, *fields):
+        """Record edited fields; they are compared once the burst of edits is over
+
+        Every edit path goes through here. edited fires for each call, while
+        content_changed fires only from _flush_dirty_fields, when the modified
+        state flips.
+        """
+        self.edited.emit()
+        self._dirty_fields.update(fields)
+        if not self._state_timer.isActive():
+            self._state_timer.start()
+
+    def _flush_dirty_fields(self):
+        """Compare the edited fields against the original and refresh the buttons"""
+        self._state_timer.stop()
+        dirty = self._dirty_fields
+        self._dirty_fields = set()
+        if 'answerable' in dirty:
+            # The effective answer depends on the answerable flag
+            dirty.add('answers')
+
+        was_modified = self.modified
+        question_fields = dirty.difference(('image_source',))
+        if question_fields:
+            # A new question is compared against its suggestion or the form defaults
+            original = self._original_state or self._suggested_state or QuestionRecord()
+            self._changed_fields -= question_fields
+            self._changed_fields |= self.current_record().diff(original, question_fields)
+        if 'image_source' in dirty:
+            if self.image_source != (self._original_image_source or DEFAULT_IMAGE_SOURCE):
+                self._changed_fields.add('image_source')
+            else:
+                self._changed_fields.discard('image_source')
+        self.modified = bool(self._changed_fields)
+        self._update_ui_state()
+
+        if self.modified != was_modified:
+            logger.debug(f"Modified: {self.modified}, changed fields: {sorted(self._changed_fields)}")
+            self.content_changed.emit()
+
+    def _reset_change_tracking(self):
+        """Forget pending and detected edits - the form matches its original again"""
+        self._state_timer.stop()
+        self._dirty_fields = set()
+        self._changed_fields = set()
+        self.modified = False
+
+    def mark_saved(self):
+        """Make the current form values the original after they were saved"""
+        self._original_state = self.current_record()
+        self._original_image_source = self.image_source
+        self._reset_change_tracking()
+        self._update_ui_state()
     
     def _confirm_question(self):
         """Confirm the current question after typing"""
@@ -1047,19 +941,21 @@ class VietnameseQuestionList(QWidget):
         question_type_value = self.question_type_combo.currentData()
         
         # Log values for debugging
-        logger.info(f"Confirmation dialog - Current question type: value={question_type_value}, text={question_type_text}")
+        logger.debug(f"Confirmation dialog - Current question type: value={question_type_value}")
         
         is_answerable = self.can_answer_check.isChecked()
         answer_text = self.answer_text.text().strip()
         if not is_answerable:
-            answer_text = "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh"
+            answer_text = UNANSWERABLE_TEXT
         
         tags_text = ", ".join(self.selected_tags)
         qa_source_text = self.source_combo.currentText()
         image_source_text = self.image_source_input.currentText()
         
         # Check if this is a modification of an existing labeled data
-        is_modification = hasattr(self, '_original_state') and self._original_state
+        original = self._original_state
+        is_modification = original is not None
+        changed = self.current_record().diff(original) if is_modification else set()
         
         # Create confirmation message with clear separation between sections and styling for labels/values
         confirmation_message = f"""<h3>Xác nhận thông tin</h3>"""
@@ -1071,7 +967,7 @@ class VietnameseQuestionList(QWidget):
 <b>Nguồn ảnh:</b> <i style="font-weight: normal;">{image_source_text}</i>"""
 
         # Show original value if it's different
-        if is_modification and hasattr(self, '_original_image_source') and self._original_image_source != self.image_source:
+        if is_modification and self._original_image_source != self.image_source:
             # Find the display text for the original image source
             original_image_source_text = ""
             for i in range(self.image_source_input.count()):
@@ -1092,68 +988,15 @@ class VietnameseQuestionList(QWidget):
 <b>Câu hỏi:</b> <i style="font-weight: normal;">{question_text}</i>"""
 
         # Show original question if it's different
-        if is_modification and 'question' in self._original_state and self._original_state['question'] != question_text:
-            confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Câu hỏi ban đầu: {self._original_state.get('question', '')}</span>"""
+        if 'question' in changed:
+            confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Câu hỏi ban đầu: {original.question}</span>"""
         
         confirmation_message += f"""<br>
 <b>Loại câu hỏi:</b> <i style="font-weight: normal;">{question_type_text}</i>"""
 
-        # Show original question type if it's different - highlight changed value
-        original_question_type_text = ""
-        if is_modification and 'question_type' in self._original_state:
-            # Log question type comparison values for debugging
-            logger.info(f"Confirmation dialog - Original question type value: {self._original_state['question_type']} (type: {type(self._original_state['question_type']).__name__})")
-            logger.info(f"Confirmation dialog - Current question type value: {question_type_value} (type: {type(question_type_value).__name__})")
-            
-            # Convert both values to lowercase strings for case-insensitive comparison
-            original_value_str = str(self._original_state['question_type']).lower()
-            current_value_str = str(question_type_value).lower()
-            
-            # Check if the values are different (ignoring case)
-            is_different = original_value_str != current_value_str
-            
-            logger.info(f"Case-insensitive comparison result: {is_different} ('{original_value_str}' vs '{current_value_str}')")
-            
-            # Only continue if the values are actually different
-            if is_different:
-                # Log original question type value for debugging
-                logger.info(f"Detected different question type: Original={self._original_state['question_type']} vs Current={question_type_value}")
-                
-                # Find the display text for the original question type by looking up the value in the combo box
-                for i in range(self.question_type_combo.count()):
-                    item_data = str(self.question_type_combo.itemData(i)).lower()
-                    logger.info(f"Checking combo item {i}: data={item_data}, comparing with: {original_value_str}")
-                    
-                    # Case-insensitive comparison using lowercase strings
-                    if item_data == original_value_str:
-                        original_question_type_text = self.question_type_combo.itemText(i)
-                        logger.info(f"Found match: {original_question_type_text}")
-                        break
-                
-                # If we still can't find it, try direct mapping of known values
-                if not original_question_type_text:
-                    logger.info(f"No match found using data value, trying direct text matching...")
-                    # Try finding the text directly based on known values
-                    if original_value_str == "existence_checking" or original_value_str == "existence checking":
-                        original_question_type_text = "Existence Checking"
-                    elif original_value_str == "others" or original_value_str == "other":
-                        original_question_type_text = "Others"
-                    logger.info(f"Direct mapping result: {original_question_type_text}")
-                
-                # Log the found display text
-                logger.info(f"Confirmation dialog - Original question type text: {original_question_type_text}")
-                
-                # Only add the highlight if we found a valid display text and it's different
-                if original_question_type_text and original_question_type_text != question_type_text:
-                    logger.info(f"Adding red highlight for original question type: {original_question_type_text}")
-                    confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Loại câu hỏi ban đầu: {original_question_type_text}</span>"""
-                elif original_value_str != current_value_str:
-                    # If we couldn't find the text but values are different, show the value as fallback
-                    original_display = self._original_state['question_type']
-                    logger.info(f"Using original value directly: {original_display}")
-                    confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Loại câu hỏi ban đầu: {original_display}</span>"""
-            else:
-                logger.info("Question types are the same, not highlighting")
+        # Show original question type if it's different - record types are the combo texts
+        if 'question_type' in changed:
+            confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Loại câu hỏi ban đầu: {original.question_type}</span>"""
         
         confirmation_message += """</div>"""
         
@@ -1164,25 +1007,15 @@ class VietnameseQuestionList(QWidget):
 <b>Có thể trả lời:</b> <i style="font-weight: normal;">{'Có' if is_answerable else 'Không'}</i>"""
 
         # Show original answerable state if it's different
-        original_answerable = self._original_state.get('answerable', 0) == 1 if is_modification else False
-        if is_modification and original_answerable != is_answerable:
-            confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Có thể trả lời ban đầu: {'Có' if original_answerable else 'Không'}</span>"""
+        if 'answerable' in changed:
+            confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Có thể trả lời ban đầu: {'Có' if original.answerable else 'Không'}</span>"""
             
         confirmation_message += f"""<br>
 <b>Câu trả lời:</b> <i style="font-weight: normal;">{answer_text}</i>"""
 
         # Show original answer if it's different
-        original_answer = ""
-        if is_modification and 'answers' in self._original_state and self._original_state['answers']:
-            if isinstance(self._original_state['answers'][0], str):
-                original_answer = self._original_state['answers'][0]
-            elif isinstance(self._original_state['answers'][0], dict):
-                original_answer = self._original_state['answers'][0].get('answer_text', '')
-                
-            # Only show if different
-            current_answer_for_comparison = answer_text
-            if original_answer != current_answer_for_comparison:
-                confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Câu trả lời ban đầu: {original_answer}</span>"""
+        if 'answers' in changed and original.answer:
+            confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Câu trả lời ban đầu: {original.answer}</span>"""
                 
         confirmation_message += """</div>"""
         
@@ -1193,28 +1026,21 @@ class VietnameseQuestionList(QWidget):
 <b>Tags:</b> <i style="font-weight: normal;">{tags_text}</i>"""
 
         # Show original tags if they are different
-        original_tags = self._original_state.get('tags', []) if is_modification else []
-        original_tags_text = ", ".join(original_tags)
-        if is_modification and set(original_tags) != set(self.selected_tags):
-            confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Tags ban đầu: {original_tags_text}</span>"""
+        if 'tags' in changed:
+            confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Tags ban đầu: {", ".join(original.tags)}</span>"""
             
         confirmation_message += f"""<br>
 <b>Nguồn QA:</b> <i style="font-weight: normal;">{qa_source_text}</i>"""
 
         # Show original QA source if it's different
-        original_qa_source = ""
-        if is_modification:
-            # Check both source and qa_source fields
-            original_qa_source_value = self._original_state.get('qa_source', self._original_state.get('source', ''))
-            
+        if 'qa_source' in changed:
             # Find the display text for the original QA source
+            original_qa_source = original.qa_source
             for i in range(self.source_combo.count()):
-                if self.source_combo.itemData(i) == original_qa_source_value:
+                if self.source_combo.itemData(i) == original.qa_source:
                     original_qa_source = self.source_combo.itemText(i)
                     break
-                    
-            if original_qa_source and original_qa_source != qa_source_text:
-                confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Nguồn QA ban đầu: {original_qa_source}</span>"""
+            confirmation_message += f"""<br><span style="color: #e74c3c; font-style: italic;">Nguồn QA ban đầu: {original_qa_source}</span>"""
                 
         confirmation_message += """</div>
 
@@ -1350,36 +1176,11 @@ class VietnameseQuestionList(QWidget):
         
         # Continue with confirmation process as before if Yes was clicked
         # Lưu trữ nội dung gốc để khôi phục khi cần
+        record = self.current_record()
+        is_answerable = record.answerable
+        self.questions[0] = self._working_question(record, is_confirmed=True)
         self.questions[0]['original_text'] = question_text
-        
-        # Mark question as confirmed
-        self.questions[0]['is_confirmed'] = True
-        self.questions[0]['question'] = question_text
-        
-        # IMPORTANT: Explicitly update the answerable state in the model
-        is_answerable = self.can_answer_check.isChecked()
-        self.questions[0]['answerable'] = 1 if is_answerable else 0
-        logger.info(f"Confirmation completed - Explicitly set answerable flag in model to: {self.questions[0]['answerable']}")
-        
-        # Update the answer text in the model
-        answer_text = self.answer_text.text().strip()
-        if not is_answerable:
-            answer_text = "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh"
-            
-        if 'answers' in self.questions[0] and self.questions[0]['answers']:
-            self.questions[0]['answers'][0]['answer_text'] = answer_text
-            logger.info(f"Updated answer text in model to: '{answer_text}'")
-        else:
-            self.questions[0]['answers'] = [{
-                'answer_id': 1,
-                'answer_text': answer_text,
-                'is_correct': False
-            }]
-            logger.info(f"Created new answer in model with text: '{answer_text}'")
-        
-        # Also update question type and source
-        self.questions[0]['question_type'] = self.question_type_combo.currentData()
-        self.questions[0]['source'] = self.source_combo.currentData()
+        logger.debug(f"Confirmation completed - question {record.question_id}, changed fields: {sorted(changed)}")
         
         # All input fields are already enabled from the start, so no need to enable them here
         # Just preserve the state of the answer field based on can_answer_check
@@ -1396,146 +1197,26 @@ class VietnameseQuestionList(QWidget):
         self._update_ui_state()
         
         # Finally, ensure model and UI are fully synchronized (this will fix any remaining checkbox state issues)
-        logger.info("Explicitly calling _on_content_changed to ensure model and UI are properly synchronized")
+        logger.debug("Explicitly calling _on_content_changed to ensure model and UI are properly synchronized")
         self._on_content_changed()
     
     def _revert_to_original(self):
         """Revert all changes back to the original values"""
-        if not hasattr(self, '_original_state') or not self._original_state:
-            logger.info("No original state to revert to")
+        original = self._original_state
+        if original is None:
+            logger.debug("No original state to revert to")
             return
             
-        logger.info("Reverting to original state")
+        logger.debug(f"Reverting fields to original state: {sorted(self._changed_fields | self._dirty_fields)}")
             
         # Restore the original state of the question
-        if hasattr(self, 'questions') and self.questions:
-            # Keep the original structure but update the content
-            question = self.questions[0]
-            
-            # Restore question text
-            if 'question' in self._original_state:
-                question['question'] = self._original_state['question']
-                self.question_text.setText(self._original_state['question'])
-                
-            # Restore question type
-            if 'question_type' in self._original_state:
-                # Store the original question type and log it
-                original_question_type = self._original_state['question_type']
-                logger.info(f"Restoring question type to original value: {original_question_type}")
-                
-                # First update the model with the original value
-                question['question_type'] = original_question_type
-                
-                # Find the matching index using case-insensitive comparison
-                found_index = -1
-                for i in range(self.question_type_combo.count()):
-                    item_data = self.question_type_combo.itemData(i)
-                    logger.info(f"Comparing combo item {i}: {item_data} with original: {original_question_type}")
-                    
-                    # Use case-insensitive string comparison
-                    if str(item_data).lower() == str(original_question_type).lower():
-                        found_index = i
-                        logger.info(f"Found matching question type at index {i}")
-                        break
-                        
-                # Set the combo box to the found index, or default to first item
-                if found_index >= 0:
-                    self.question_type_combo.setCurrentIndex(found_index)
-                else:
-                    # Default to first option
-                    self.question_type_combo.setCurrentIndex(0)
-                    logger.warning(f"Could not find original question type '{original_question_type}' in combo box, defaulting to index 0")
-                    
-            # Restore answerable state
-            original_answerable = self._original_state.get('answerable', 0) == 1
-            logger.info(f"Restoring answerable state to: {original_answerable}")
-            question['answerable'] = 1 if original_answerable else 0
-            
-            # Important: Get original answer text first, before updating UI
-            original_answer = ""
-            if 'answers' in self._original_state and self._original_state['answers']:
-                # Handle both formats
-                if isinstance(self._original_state['answers'][0], str):
-                    original_answer = self._original_state['answers'][0]
-                else:
-                    original_answer = self._original_state['answers'][0].get('answer_text', '')
-                logger.info(f"Original answer text: '{original_answer}'")
-            
-            # Block signals when setting the checkbox to prevent _on_can_answer_changed from being triggered
-            old_block_state = self.can_answer_check.blockSignals(True)
-            self.can_answer_check.setChecked(original_answerable)
-            self.can_answer_check.blockSignals(old_block_state)
-            logger.info(f"Set answerable checkbox to: {original_answerable} with signals blocked")
-            
-            # Set the appropriate answer text based on answerable state
-            if original_answerable:
-                # For answerable questions, restore the original answer
-                self.answer_text.setText(original_answer)
-                self.answer_text.setReadOnly(False)
-                self.answer_text.setStyleSheet("""
-                    background-color: white;
-                    border: 1px solid #bdc3c7;
-                    border-radius: 5px;
-                    padding: 8px;
-                    font-size: 13px;
-                """)
-                self.answer_text.setPlaceholderText("Nhập câu trả lời tại đây...")
-                logger.info(f"Restored answerable question with answer: '{original_answer}'")
-                
-                # Update the model with the original answer
-                if 'answers' not in question or not question['answers']:
-                    question['answers'] = [{
-                        'answer_id': 1,
-                        'answer_text': original_answer,
-                        'is_correct': False
-                    }]
-                else:
-                    question['answers'][0]['answer_text'] = original_answer
-            else:
-                # For unanswerable questions, set the default text
-                self.answer_text.setText("Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh")
-                self.answer_text.setReadOnly(True)
-                self.answer_text.setStyleSheet("""
-                    background-color: #f0f2f5;
-                    border: 1px solid #bdc3c7;
-                    border-radius: 5px;
-                    padding: 8px;
-                    font-size: 13px;
-                    color: #7f8c8d;
-                    font-style: italic;
-                """)
-                logger.info("Restored unanswerable question with default text")
-                
-                # Update the model with the default unanswerable text
-                if 'answers' not in question or not question['answers']:
-                    question['answers'] = [{
-                        'answer_id': 1,
-                        'answer_text': "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh",
-                        'is_correct': False
-                    }]
-                else:
-                    question['answers'][0]['answer_text'] = "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh"
-            
-            # Restore tags
-            if 'tags' in self._original_state:
-                question['tags'] = self._original_state['tags'].copy()
-                # Clear current tags and add original ones
-                self._clear_tags()
-                for tag in self._original_state['tags']:
-                    self._add_tag(tag)
-            
-            # Restore QA source
-            source_key = 'qa_source' if 'qa_source' in self._original_state else 'source'
-            if source_key in self._original_state:
-                question[source_key] = self._original_state[source_key]
-                # Find the matching index
-                for i in range(self.source_combo.count()):
-                    if self.source_combo.itemData(i) == self._original_state[source_key]:
-                        self.source_combo.setCurrentIndex(i)
-                        break
+        if self.questions:
+            is_confirmed = self.questions[0].get('is_confirmed', False)
+            self.questions[0] = self._working_question(original, is_confirmed)
+            self._show_record(original)
             
             # Restore image source if it was stored
-            if hasattr(self, '_original_image_source') and self._original_image_source:
+            if self._original_image_source:
                 self.image_source = self._original_image_source
                 # Find the matching index
                 for i in range(self.image_source_input.count()):
@@ -1543,17 +1224,14 @@ class VietnameseQuestionList(QWidget):
                         self.image_source_input.setCurrentIndex(i)
                         break
         
-        # Reset the modified flag
-        self.modified = False
-        logger.info("Reset modified flag to False after reverting to original")
+        # Sync the question text into the model, then drop the edits the reversion triggered
+        self._on_content_changed()
+        self._reset_change_tracking()
+        logger.debug("Reset modified flag to False after reverting to original")
         
         # Update UI state to reflect the reversion - this will disable buttons as needed
         self._update_ui_state()
-        
-        # After reverting, explicitly call _on_content_changed to ensure UI and model are synchronized
-        # This will also prepare for detecting future changes
-        logger.info("Calling _on_content_changed after revert to sync UI and model")
-        self._on_content_changed()
+        self.content_changed.emit()
         
         # Show a confirmation message
         QMessageBox.information(
@@ -1597,19 +1275,8 @@ class VietnameseQuestionList(QWidget):
         self.tags_search.clear()
         self.source_combo.setCurrentIndex(0)  # Default to "Manually Annotated"
         
-        # Reset trạng thái câu hỏi
-        question = self.questions[0]
-        question['question'] = ''
-        question['question_type'] = 'existence_checking'
-        question['answerable'] = 0  # Default to NOT answerable
-        question['tags'] = []
-        question['source'] = 'manually_annotated'  # Default to "Manually Annotated"
-        question['is_confirmed'] = False
-        
-        # Giữ lại mảng answers trống để tương thích với mã hiện có
-        if 'answers' in question and question['answers']:
-            question['answers'][0]['answer_text'] = 'Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh'
-            question['answers'][0]['is_correct'] = False
+        # Reset trạng thái câu hỏi - not answerable, "Manually Annotated"
+        self.questions[0] = self._working_question(QuestionRecord())
             
         # Thông báo cho người dùng
         QMessageBox.information(
@@ -1618,29 +1285,23 @@ class VietnameseQuestionList(QWidget):
             "Tất cả thông tin đã được xóa và không được lưu trữ."
         )
         
+        # Reset modified flag
+        self._reset_change_tracking()
+
         # Cập nhật UI
         self._update_ui_state()
-        
-        # Reset modified flag
-        self.modified = False
+        self.content_changed.emit()
     
     def set_questions(self, questions, image_source=""):
         """Set questions data from loaded file
         
         Args:
-            questions: List of question dictionaries
+            questions: Sequence of QuestionRecord, as read by LabelRecord.from_dict
             image_source: The source of the image (optional)
         """
-        logger.info(f"Setting questions: {questions}")
-        
-        # Track whether this is loading an existing question vs creating a new one
-        loading_existing_question = questions and len(questions) > 0 and bool(questions[0].get('question', '').strip())
-        logger.info(f"Loading existing question: {loading_existing_question}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Setting questions: {questions}")
         
-        # Transform image_source if it's still using the old value
-        if image_source == "self_collected":
-            image_source = "manually_collected"
-            
         # Set image source if provided, otherwise keep default "Manual Collected"
         if image_source:
             self.image_source = image_source
@@ -1664,136 +1325,43 @@ class VietnameseQuestionList(QWidget):
             self.image_source_input.setCurrentIndex(0)
         
         # Only take the first question or create new if none
-        if questions and len(questions) > 0:
-            # Get the first question and ensure ID = 1
-            self.questions = [questions[0]]
-            self.questions[0]['question_id'] = 1
-            
-            # Check if 'answerable' field is present and log it
-            if 'answerable' in self.questions[0]:
-                answerable_value = self.questions[0]['answerable']
-                logger.info(f"Question has answerable field with value: {answerable_value} (type: {type(answerable_value).__name__})")
-                
-                # Ensure answerable is an integer 0 or 1, not a boolean or string
-                if isinstance(answerable_value, bool):
-                    self.questions[0]['answerable'] = 1 if answerable_value else 0
-                    logger.info(f"Converted boolean answerable to int: {self.questions[0]['answerable']}")
-                elif isinstance(answerable_value, str):
-                    self.questions[0]['answerable'] = 1 if answerable_value.lower() in ('1', 'true', 'yes') else 0
-                    logger.info(f"Converted string answerable to int: {self.questions[0]['answerable']}")
-                    
-                # Ensure answerable is either 0 or 1
-                if answerable_value not in (0, 1):
-                    self.questions[0]['answerable'] = 1 if answerable_value else 0
-                    logger.info(f"Normalized answerable value to: {self.questions[0]['answerable']}")
-            else:
-                logger.info("Question does not have 'answerable' field, defaulting to 0")
-                self.questions[0]['answerable'] = 0
-                
-            # Check if 'answers' field is present and log it    
-            if 'answers' in self.questions[0] and self.questions[0]['answers']:
-                if isinstance(self.questions[0]['answers'][0], str):
-                    logger.info(f"Question has answers as string array: {self.questions[0]['answers']}")
-                else:
-                    logger.info(f"Question has answers as object array: {self.questions[0]['answers']}")
-            else:
-                logger.info("Question does not have 'answers' field or it's empty")
-            
-            # Transform source field if it's still using the old value
-            if 'source' in self.questions[0] and self.questions[0]['source'] == "self_collected":
-                self.questions[0]['source'] = "manually_collected"
-                
-            # Transform qa_source field if it's still using the old value
-            if 'qa_source' in self.questions[0] and self.questions[0]['qa_source'] == "self_collected":
-                self.questions[0]['qa_source'] = "manually_collected"
-            
-            # Convert 'answers' field from array of strings to expected format if needed
-            if 'answers' in self.questions[0] and self.questions[0]['answers']:
-                if isinstance(self.questions[0]['answers'][0], str):
-                    # Convert string array to object array
-                    original_answers = self.questions[0]['answers']
-                    self.questions[0]['answers'] = []
-                    for i, answer_text in enumerate(original_answers):
-                        self.questions[0]['answers'].append({
-                            'answer_id': i + 1,
-                            'answer_text': answer_text,
-                            'is_correct': i == 0  # First answer is correct by default
-                        })
-                    logger.info(f"Converted string answers to object array: {self.questions[0]['answers']}")
-            
-            # Set confirmed status if not already set
-            if 'is_confirmed' not in self.questions[0]:
-                self.questions[0]['is_confirmed'] = bool(self.questions[0].get('question', '').strip())
-        else:
-            # Create default question if none exists
-            logger.info("No questions provided, creating default question")
-            self._create_default_question()
-        
-        # Store the original state to track modifications
-        if hasattr(self, 'questions') and self.questions:
-            # Make a deep copy to track against
-            import copy
-            self._original_state = copy.deepcopy(self.questions[0])
-            
-            # Ensure the question type is properly normalized to lowercase string
-            if 'question_type' in self._original_state:
-                # Fix: Normalize the question type to ensure consistent comparison
-                if isinstance(self._original_state['question_type'], str):
-                    # Convert to lowercase string to match combo box data values
-                    self._original_state['question_type'] = self._original_state['question_type'].lower()
-                    
-            # Log the stored original state for debugging
-            logger.info(f"Original state: {self._original_state}")
-            if 'question_type' in self._original_state:
-                logger.info(f"Original state - stored question type: {self._original_state['question_type']} (type: {type(self._original_state['question_type']).__name__})")
-                
-            self._original_image_source = self.image_source
+        record = questions[0] if questions else QuestionRecord()
+        if not questions:
+            logger.debug("No questions provided, creating default question")
+        if record.question_id != 1:
+            record = record.replace(question_id=1)
+        self.questions = [self._working_question(record, is_confirmed=bool(record.question))]
+        
+        # Records are immutable, so the loaded one is kept as the original without copying
+        self._original_state = record
+        self._suggested_state = None
+        self._original_image_source = self.image_source
+        self._show_record(record)
+        
+        # Final reset of modified flag - filling in the widgets above is not an edit
+        self._reset_change_tracking()
         
-        # Explicitly set modified flag to False since we just loaded data
-        self.modified = False
-        
-        # Display question content
-        question = self.questions[0]
-        self.question_text.setText(question.get('question', ''))
-        
-        # Set question type
-        question_type = question.get('question_type', 'existence_checking')
-        index = 0  # Default to first option (Existence Checking)
-        
-        # Log the loaded question type value
-        logger.info(f"Loading question with type value: {question_type}")
-        
-        # Find the matching index by data value
-        for i in range(self.question_type_combo.count()):
-            if self.question_type_combo.itemData(i) == question_type:
-                index = i
-                break
-                
-        # Log the selected index and text
-        logger.info(f"Setting question type combo to index {index}: value={self.question_type_combo.itemData(index)}, text={self.question_type_combo.itemText(index)}")
+        # Update UI state
+        self._update_ui_state()
+
+    def _show_record(self, record):
+        """Fill the question widgets from a record"""
+        self.question_text.setText(record.question)
         
-        self.question_type_combo.setCurrentIndex(index)
+        # Set question type - find the matching index by data value
+        index = self.question_type_combo.findData(record.question_type)
+        self.question_type_combo.setCurrentIndex(max(index, 0))
         
         # IMPORTANT: First determine if the question is answerable
-        is_answerable = question.get('answerable', 0) == 1  # Default to 0 (not answerable)
-        logger.info(f"Question answerable state from data: {is_answerable}")
-        
-        # Get answer text BEFORE setting any UI state
-        answer_text = ""
-        if 'answers' in question and question['answers']:
-            # Handle both string array and object array formats
-            if isinstance(question['answers'][0], str):
-                answer_text = question['answers'][0]
-            else:
-                answer_text = question['answers'][0].get('answer_text', '')
-            logger.info(f"Raw answer text from loaded data: '{answer_text}'")
+        is_answerable = record.answerable
+        answer_text = record.answer
         
         # CRITICAL FIX: Block signals properly when setting checked state
         old_block_state = self.can_answer_check.blockSignals(True)
         
         # Set the checkbox state
         self.can_answer_check.setChecked(is_answerable)
-        logger.info(f"Set can_answer_check to checked={is_answerable} with signals blocked")
+        logger.debug(f"Set can_answer_check to checked={is_answerable} with signals blocked")
         
         # Restore signal blocking state
         self.can_answer_check.blockSignals(old_block_state)
@@ -1801,76 +1369,111 @@ class VietnameseQuestionList(QWidget):
         # Now set the UI state based on answerable flag
         if is_answerable:
             # For answerable questions, set the answer text from data and make editable
-            logger.info(f"Setting answerable question with answer text: '{answer_text}'")
+            logger.debug(f"Setting answerable question with answer text: '{answer_text}'")
             self.answer_text.setText(answer_text)
             self.answer_text.setReadOnly(False)
-            self.answer_text.setStyleSheet("""
-                background-color: white;
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-            """)
+            set_state(self.answer_text, 'state', None)
             self.answer_text.setPlaceholderText("Nhập câu trả lời tại đây...")
         else:
             # For unanswerable questions, set the default text and make read-only
-            logger.info("Setting unanswerable question with default text")
-            self.answer_text.setText("Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh")
+            logger.debug("Setting unanswerable question with default text")
+            self.answer_text.setText(UNANSWERABLE_TEXT)
             self.answer_text.setReadOnly(True)
-            self.answer_text.setStyleSheet("""
-                background-color: #f0f2f5;
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-                color: #7f8c8d;
-                font-style: italic;
-            """)
+            set_state(self.answer_text, 'state', 'readonly')
             
         # Manually trigger the state update to ensure all internal states are correct
-        logger.info(f"Manually triggering _on_can_answer_changed with state={Qt.Checked if is_answerable else Qt.Unchecked}")
+        logger.debug(f"Manually triggering _on_can_answer_changed with state={Qt.Checked if is_answerable else Qt.Unchecked}")
         self._on_can_answer_changed(Qt.Checked if is_answerable else Qt.Unchecked)
         
         # Load tags
-        self._clear_tags()  # Clear existing tags first
-        tags_list = question.get('tags', [])
-        for tag in tags_list:
-            self._add_tag(tag)
+        self._set_tags(record.tags)
         
-        # Display QA source - find by data value
-        # First check if we have qa_source field (new format)
-        source = question.get('qa_source', question.get('source', 'manually_annotated'))
+        # Display QA source - find by data value, default to first option if not found
+        source_index = self.source_combo.findData(record.qa_source)
+        self.source_combo.setCurrentIndex(max(source_index, 0))
+    
+    def get_questions(self):
+        """Get the current questions data"""
+        return self.questions
+
+    def get_draft(self):
+        """Get a snapshot of the editable fields, used for the crash-recovery journal"""
+        is_answerable = self.can_answer_check.isChecked()
+        return {
+            'question': self.question_text.text(),
+            'question_type': self.question_type_combo.currentData(),
+            'answerable': 1 if is_answerable else 0,
+            'answer': self.answer_text.text() if is_answerable else '',
+            'tags': list(self.selected_tags),
+            'qa_source': self.source_combo.currentData(),
+            'image_source': self.image_source,
+        }
+
+    def apply_draft(self, draft):
+        """Restore unsaved edits from get_draft on top of the loaded question
+
+        The original state loaded by set_questions is kept, so change detection
+        and the revert button still compare against the saved label.
         
-        # Transform source if it's still using the old value
-        if source == "self_collected":
-            source = "manually_collected"
-            
-        source_index = -1
+        Args:
+            draft: Dictionary produced by get_draft
+        """
+        logger.debug(f"Applying draft of fields: {sorted(draft)}")
+
+        for i in range(self.image_source_input.count()):
+            if self.image_source_input.itemData(i) == draft.get('image_source'):
+                self.image_source_input.setCurrentIndex(i)
+                break
+
+        self.question_text.setText(draft.get('question', ''))
+
+        for i in range(self.question_type_combo.count()):
+            if self.question_type_combo.itemData(i) == draft.get('question_type'):
+                self.question_type_combo.setCurrentIndex(i)
+                break
+
+        # Toggling the checkbox runs _on_can_answer_changed, which sets up the answer field
+        is_answerable = draft.get('answerable', 0) == 1
+        if self.can_answer_check.isChecked() != is_answerable:
+            self.can_answer_check.setChecked(is_answerable)
+        if is_answerable:
+            self.answer_text.setText(draft.get('answer', ''))
+
+        self._set_tags(draft.get('tags', []))
+
         for i in range(self.source_combo.count()):
-            if self.source_combo.itemData(i) == source:
-                source_index = i
+            if self.source_combo.itemData(i) == draft.get('qa_source'):
+                self.source_combo.setCurrentIndex(i)
                 break
+
+        # Compare every field right away, so is_modified() reflects the draft
+        self._mark_dirty(*TRACKED_FIELDS)
+        self._flush_dirty_fields()
+        self.content_changed.emit()
+    
+    def apply_suggestion(self, record):
+        """Fill the form with a suggested question, e.g. from the AI prefill worker
         
-        if source_index >= 0:
-            self.source_combo.setCurrentIndex(source_index)
-        else:
-            # Default to first option if not found
-            self.source_combo.setCurrentIndex(0)
-        
-        # Final reset of modified flag to ensure UI state is fresh
-        self.modified = False
-        
-        # Verify the final state of the UI
-        logger.info(f"Final answerable state in UI: {self.can_answer_check.isChecked()}")
-        logger.info(f"Final answer text in UI: '{self.answer_text.text()}'")
+        The suggestion becomes the baseline of the unlabeled form rather than
+        an edit: no content_changed/edited signals fire, is_modified() stays
+        False and nothing is journaled until the annotator changes a field.
+        It can still be confirmed as is, and the image source is kept.
         
-        # Update UI state
+        Args:
+            record: QuestionRecord to show, normally with qa_source 'generated_by_ai'
+        """
+        draft = dict(record.to_dict())
+        draft['answer'] = record.answer if record.answerable else ''
+        draft['image_source'] = self.image_source
+        blocked = self.blockSignals(True)
+        try:
+            self.apply_draft(draft)
+        finally:
+            self.blockSignals(blocked)
+        self._suggested_state = self.current_record()
+        self._reset_change_tracking()
         self._update_ui_state()
     
-    def get_questions(self):
-        """Get the current questions data"""
-        return self.questions
-    
     def get_image_source(self):
         """Get the current image source"""
         return self.image_source
@@ -1893,99 +1496,39 @@ class VietnameseQuestionList(QWidget):
     
     def is_modified(self):
         """Check if content has been modified from its original state"""
-        
-        # If the modified flag is False, return immediately
-        if not self.modified:
-            return False
-            
-        # If there's no _original_state to compare against,
-        # rely on the stored modified flag
-        if not hasattr(self, '_original_state') or self._original_state is None:
-            return self.modified
-            
-        # Get current values for comparison with original state
-        current_question = self.question_text.text().strip()
-        current_question_type = str(self.question_type_combo.currentData()).lower()
-        is_answerable = self.can_answer_check.isChecked()
-        current_answer = self.answer_text.text().strip()
-        if not is_answerable:
-            current_answer = "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh"
-        current_tags = set(self.selected_tags)
-        current_source = self.source_combo.currentData()
-        current_image_source = self.image_source
-        
-        # Get original values
-        orig_question = self._original_state.get('question', '').strip()
-        orig_question_type = str(self._original_state.get('question_type', '')).lower()
-        orig_answerable = self._original_state.get('answerable', 0) == 1
-        
-        # Get original answer
-        orig_answer = ""
-        if 'answers' in self._original_state and self._original_state['answers']:
-            if isinstance(self._original_state['answers'][0], str):
-                orig_answer = self._original_state['answers'][0].strip()
-            else:
-                orig_answer = self._original_state['answers'][0].get('answer_text', '').strip()
-        
-        # Get original tags
-        orig_tags = set(self._original_state.get('tags', []))
-        
-        # Get original source
-        orig_source = self._original_state.get('qa_source', self._original_state.get('source', ''))
-        
-        # Get original image source
-        orig_image_source = getattr(self, '_original_image_source', None)
-        
-        # Check if any values have changed
-        is_different = (
-            current_question != orig_question or
-            current_question_type != orig_question_type or
-            is_answerable != orig_answerable or
-            current_answer != orig_answer or
-            current_tags != orig_tags or
-            current_source != orig_source or
-            (orig_image_source is not None and current_image_source != orig_image_source)
-        )
-        
-        logger.info(f"Detailed modification check: is_different={is_different}")
-        if is_different:
-            logger.info(f"Changes detected: question: '{current_question}' vs '{orig_question}', "
-                      f"type: '{current_question_type}' vs '{orig_question_type}', "
-                      f"answerable: {is_answerable} vs {orig_answerable}, "
-                      f"answer: '{current_answer}' vs '{orig_answer}', "
-                      f"tags: {current_tags} vs {orig_tags}, "
-                      f"source: '{current_source}' vs '{orig_source}'")
-        
-        # Return true only if there are actual differences
-        return is_different
+        # Compare edits still waiting for the timer
+        if self._dirty_fields:
+            self._flush_dirty_fields()
+        return self.modified
     
     def clear(self):
         """Clear all questions and reset image source"""
         try:
-            logger.info("Executing clear() method to reset all data for new image")
+            logger.debug("Executing clear() method to reset all data for new image")
             
             # For unlabeled images, we always want to start with answerable=0
             # This ensures that the checkbox is unchecked for new unlabeled images
             current_answerable = 0
-            logger.info(f"Setting answerable=0 for new unlabeled image")
+            logger.debug(f"Setting answerable=0 for new unlabeled image")
             
             # Reset the original state to None to ensure the revert functionality works correctly for new images
-            if hasattr(self, '_original_state'):
+            if self._original_state is not None:
                 self._original_state = None
-                logger.info("Original state (_original_state) reset to None in clear() method")
+                logger.debug("Original state (_original_state) reset to None in clear() method")
                 
-            if hasattr(self, '_original_image_source'):
+            if self._original_image_source is not None:
                 self._original_image_source = None
-                logger.info("Original image source (_original_image_source) reset to None")
+                logger.debug("Original image source (_original_image_source) reset to None")
+            self._suggested_state = None
             
             # Clear the questions array completely before creating a new default question
             if hasattr(self, 'questions'):
                 self.questions = []
-                logger.info("Questions array cleared")
+                logger.debug("Questions array cleared")
                 
             # Create a new default question with answerable=0
             self._create_default_question(answerable=current_answerable)
-            logger.info(f"Created new default question with answerable=0")
+            logger.debug(f"Created new default question with answerable=0")
             
             # Reset all UI elements
             self.question_text.clear()
@@ -1995,48 +1538,40 @@ class VietnameseQuestionList(QWidget):
             old_block_state = self.can_answer_check.blockSignals(True)
             self.can_answer_check.setChecked(False)
             self.can_answer_check.blockSignals(old_block_state)
-            logger.info("Set answerable checkbox to: False (unchecked)")
+            logger.debug("Set answerable checkbox to: False (unchecked)")
             
             # Update UI for unanswerable questions
             # For unanswerable questions, set the default text
-            self.answer_text.setText("Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh")
+            self.answer_text.setText(UNANSWERABLE_TEXT)
             self.answer_text.setReadOnly(True)
-            self.answer_text.setStyleSheet("""
-                background-color: #f0f2f5;
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-                color: #7f8c8d;
-                font-style: italic;
-            """)
-            logger.info("Set unanswerable UI state with default text")
+            set_state(self.answer_text, 'state', 'readonly')
+            logger.debug("Set unanswerable UI state with default text")
             
             self._clear_tags()
             self.tags_search.clear()
             self.source_combo.setCurrentIndex(0)  # Reset to "Manually Annotated"
-            logger.info("All UI elements reset to default state")
+            logger.debug("All UI elements reset to default state")
             
             # Default to "Manual Collected" instead of clearing
             self.image_source = "manually_collected"
             
             if hasattr(self, 'image_source_input') and self.image_source_input:
                 self.image_source_input.setCurrentIndex(0)  # Đặt lại nguồn ảnh mặc định là "Manual Collected"
-                logger.info("Image source input reset to default 'Manual Collected'")
+                logger.debug("Image source input reset to default 'Manual Collected'")
                
             # Ensure revert button is hidden since we have no original state
             if hasattr(self, 'revert_original_btn') and self.revert_original_btn:
                 self.revert_original_btn.setVisible(False)
                 self.revert_original_btn.setEnabled(False)
-                logger.info("Revert button hidden and disabled")
+                logger.debug("Revert button hidden and disabled")
                  
             # Reset the modified flag
-            self.modified = False
-            logger.info("Modified flag reset to False")
+            self._reset_change_tracking()
+            logger.debug("Modified flag reset to False")
             
             # Update UI state
             self._update_ui_state()
-            logger.info("UI state updated after clearing all data")
+            logger.debug("UI state updated after clearing all data")
         except RuntimeError as e:
             # Log the error when objects have been deleted
             logger.error(f"RuntimeError in clear() method: {str(e)}")
@@ -2082,27 +1617,9 @@ class VietnameseQuestionList(QWidget):
 
     def _on_image_source_changed(self):
         """Handle changes to the image source input field"""
-        # Update the stored image source
-        selected_source = self.image_source_input.currentData()
-        
-        # Check if this is an actual change from the original
-        is_different = True
-        if hasattr(self, '_original_image_source') and self._original_image_source is not None:
-            is_different = selected_source != self._original_image_source
-            
         # Update the image source property
-        self.image_source = selected_source
-        
-        # Set modified flag only if there's a real change
-        if is_different:
-            self.modified = True
-            logger.info(f"Image source changed from original, setting modified flag to True")
-        
-        # Update UI state - this will reflect the changed state in the UI
-        self._update_ui_state()
-        
-        # Emit content changed signal to notify parent components
-        self.content_changed.emit()
+        self.image_source = self.image_source_input.currentData()
+        self._mark_dirty('image_source')
     
     def _update_actions(self):
         """Update the state of action buttons based on current selection and state"""
@@ -2118,47 +1635,24 @@ class VietnameseQuestionList(QWidget):
             has_any_content = bool(self.question_text.text().strip()) or bool(self.selected_tags) or bool(self.answer_text.text().strip())
             self.cancel_question_btn.setEnabled(has_any_content)
 
-    def _update_question_counter(self):
-        """Update the question counter label with current counts"""
-        try:
-            if not hasattr(self, 'question_counter') or not self.question_counter:
-                return
-                
-            total_questions = len(self.questions)
-            self.question_counter.setText(f"{total_questions}/{MAX_QUESTIONS} câu hỏi")
-            
-            # Change color based on number of questions
-            if total_questions == MAX_QUESTIONS:
-                # At maximum, show in red
-                self.question_counter.setStyleSheet("color: #f44336; font-weight: bold;")
-            elif total_questions > MAX_QUESTIONS * 0.7:
-                # Getting close to maximum, show in orange
-                self.question_counter.setStyleSheet("color: #FF9800; font-weight: bold;")
-            else:
-                # Normal display
-                self.question_counter.setStyleSheet("color: #000000;")
-        except RuntimeError:
-            # Bỏ qua lỗi khi các đối tượng đã bị xóa
-            pass
-
     def _on_can_answer_changed(self, state):
         """Handle changes when the can_answer checkbox state changes"""
         can_answer = state == Qt.Checked
-        logger.info(f"Can answer checkbox changed to: {can_answer} (state parameter: {state}, Qt.Checked={Qt.Checked})")
+        logger.debug(f"Can answer checkbox changed to: {can_answer} (state parameter: {state}, Qt.Checked={Qt.Checked})")
         
         # Store the current answer text to preserve it when toggling between states
         current_answer = self.answer_text.text().strip()
         stored_answer = current_answer
         
         # Don't store the default unanswerable text
-        if current_answer == "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh":
+        if current_answer == UNANSWERABLE_TEXT:
             stored_answer = ""
         
-        logger.info(f"Stored answer text: '{stored_answer}'")
+        logger.debug(f"Stored answer text: '{stored_answer}'")
         
         # Get the model question
         if not self.questions or len(self.questions) == 0:
-            logger.info("No questions available in model, returning early")
+            logger.debug("No questions available in model, returning early")
             return
             
         question = self.questions[0]
@@ -2166,44 +1660,32 @@ class VietnameseQuestionList(QWidget):
         # Set answerable flag in the model
         old_answerable = question.get('answerable', 0)
         question['answerable'] = 1 if can_answer else 0
-        logger.info(f"Updated answerable flag in model: {old_answerable} -> {question['answerable']}")
+        logger.debug(f"Updated answerable flag in model: {old_answerable} -> {question['answerable']}")
         
         # Check if we have an existing answer to preserve
         has_existing_answer = False
         existing_answer = ""
         
-        if 'answers' in question and question['answers']:
-            if isinstance(question['answers'][0], str):
-                existing_answer = question['answers'][0]
-            else:
-                existing_answer = question['answers'][0].get('answer_text', '')
-                
+        if question.get('answers'):
+            existing_answer = question['answers'][0]
             has_existing_answer = (
                 existing_answer and 
-                existing_answer != "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh"
+                existing_answer != UNANSWERABLE_TEXT
             )
-            logger.info(f"Existing answer found: '{existing_answer}', has_existing_answer={has_existing_answer}")
+            logger.debug(f"Existing answer found: '{existing_answer}', has_existing_answer={has_existing_answer}")
         
         # Update UI based on answerable state
         if not can_answer:
             # For unanswerable questions, set the default text
-            if stored_answer and stored_answer != "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh":
+            if stored_answer and stored_answer != UNANSWERABLE_TEXT:
                 # Store the entered answer for later
-                logger.info(f"Saving answer text '{stored_answer}' to temp_answer")
+                logger.debug(f"Saving answer text '{stored_answer}' to temp_answer")
                 question['temp_answer'] = stored_answer
             
-            self.answer_text.setText("Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh")
+            self.answer_text.setText(UNANSWERABLE_TEXT)
             self.answer_text.setReadOnly(True)
-            self.answer_text.setStyleSheet("""
-                background-color: #f0f2f5;
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-                color: #7f8c8d;
-                font-style: italic;
-            """)
-            logger.info("Set unanswerable UI state with default text")
+            set_state(self.answer_text, 'state', 'readonly')
+            logger.debug("Set unanswerable UI state with default text")
         else:
             # For answerable questions, restore previous answer if available
             restore_text = ""
@@ -2211,89 +1693,32 @@ class VietnameseQuestionList(QWidget):
             # First check if we have a previously stored answer from toggling
             if 'temp_answer' in question and question['temp_answer']:
                 restore_text = question['temp_answer']
-                logger.info(f"Restoring previously stored answer: '{restore_text}'")
+                logger.debug(f"Restoring previously stored answer: '{restore_text}'")
                 # Clear the temporary answer after using it
                 del question['temp_answer']
             # If there's no temp_answer but we have an existing answer in the model, use that
             elif has_existing_answer:
                 restore_text = existing_answer
-                logger.info(f"Using existing answer from model: '{restore_text}'")
+                logger.debug(f"Using existing answer from model: '{restore_text}'")
             
             # If we have answer text to restore, use it
             if restore_text:
                 self.answer_text.setText(restore_text)
-                logger.info(f"Restored answer text: '{restore_text}'")
+                logger.debug(f"Restored answer text: '{restore_text}'")
             else:
                 self.answer_text.clear()
-                logger.info("No answer text to restore, cleared the field")
+                logger.debug("No answer text to restore, cleared the field")
                 
             self.answer_text.setReadOnly(False)
-            self.answer_text.setStyleSheet("""
-                background-color: white;
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-            """)
+            set_state(self.answer_text, 'state', None)
             self.answer_text.setPlaceholderText("Nhập câu trả lời tại đây...")
-            logger.info(f"Set answerable UI state")
+            logger.debug(f"Set answerable UI state")
         
-        # Update the answers array in the model
-        if 'answers' not in question:
-            question['answers'] = []
-            
+        # Update the answers in the model - answers are always a list of strings
         answer_text = self.answer_text.text().strip()
+        question['answers'] = [answer_text] if answer_text else []
         
-        if not question['answers']:
-            # Create a new answer entry
-            logger.info(f"Creating new answer entry with text: '{answer_text}'")
-            question['answers'].append({
-                'answer_id': 1,
-                'answer_text': answer_text,
-                'is_correct': False
-            })
-        else:
-            # Update existing answer
-            logger.info(f"Updating existing answer to: '{answer_text}'")
-            question['answers'][0]['answer_text'] = answer_text
-            question['answers'][0]['is_correct'] = False
-        
-        # Check if this is actually a change from the original state
-        is_different = True
-        if hasattr(self, '_original_state') and self._original_state is not None:
-            orig_answerable = self._original_state.get('answerable', 0) == 1
-            is_different = orig_answerable != can_answer
-            logger.info(f"Comparing with original state - orig_answerable={orig_answerable}, current={can_answer}, different={is_different}")
-            
-            # If answerable state changed, also check the answer text
-            if not is_different and 'answers' in self._original_state and self._original_state['answers']:
-                orig_answer = ""
-                if isinstance(self._original_state['answers'][0], str):
-                    orig_answer = self._original_state['answers'][0].strip()
-                else:
-                    orig_answer = self._original_state['answers'][0].get('answer_text', '').strip()
-                
-                # For comparison, use the default text for unanswerable questions
-                current_answer_for_comparison = answer_text
-                if not can_answer:
-                    current_answer_for_comparison = "Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh"
-                
-                is_different = orig_answer != current_answer_for_comparison
-                logger.info(f"Answer text comparison: original='{orig_answer}', current='{current_answer_for_comparison}', different={is_different}")
-        
-        # Set modified flag only if there's a real change
-        if is_different:
-            old_modified = self.modified
-            self.modified = True
-            logger.info(f"Answerable state or answer text changed from original, setting modified flag: {old_modified} -> {self.modified}")
-        
-        # Update UI state - this will update button states based on changes
-        logger.info("Calling _update_ui_state() after answerable state change")
-        self._update_ui_state()
-        
-        # Notify about content change
-        logger.info("Emitting content_changed signal")
-        self.content_changed.emit()
+        self._mark_dirty('answerable')
 
     def _setup_initial_state(self):
         """Setup the initial state with can_answer_check matching the answerable flag in the model,
@@ -2306,7 +1731,7 @@ class VietnameseQuestionList(QWidget):
             is_answerable = False
             if hasattr(self, 'questions') and self.questions and len(self.questions) > 0:
                 is_answerable = self.questions[0].get('answerable', 0) == 1
-                logger.info(f"Setting initial answerable state from model: {is_answerable}")
+                logger.debug(f"Setting initial answerable state from model: {is_answerable}")
             
             # Set the checkbox based on the model data
             self.can_answer_check.setChecked(is_answerable)
@@ -2331,20 +1756,15 @@ class VietnameseQuestionList(QWidget):
             self.tag_suggestions.hide()
             return
             
-        # Filter predefined tags based on input
-        filtered_tags = [tag for tag in PREDEFINED_TAGS if text.lower() in tag.lower()]
-        
-        # Also filter out already selected tags
-        filtered_tags = [tag for tag in filtered_tags if tag not in self.selected_tags]
+        # Prefix and typo-tolerant matches from the taxonomy, without the tags already selected
+        filtered_tags = self.tag_taxonomy.suggest(text, exclude=self.selected_tags)
         
         if not filtered_tags:
             self.tag_suggestions.hide()
             return
             
         # Show suggestions
-        self.tag_suggestions.clear()
-        for tag in filtered_tags:
-            self.tag_suggestions.addItem(tag)
+        self.tag_suggestions.set_tags(filtered_tags)
             
         # Position suggestions below the search field
         pos = self.tags_search.mapToGlobal(self.tags_search.rect().bottomLeft())
@@ -2363,15 +1783,15 @@ class VietnameseQuestionList(QWidget):
         # If suggestions are visible and have items, select the first one
         if self.tag_suggestions.isVisible() and self.tag_suggestions.count() > 0:
             # Get the first suggestion
-            first_tag = self.tag_suggestions.item(0).text()
+            first_tag = self.tag_suggestions.first_tag()
             if first_tag not in self.selected_tags:
                 self._add_tag(first_tag)
                 self.tags_search.clear()
                 self.tag_suggestions.hide()
                 return
                 
-        # If we get here, check for exact match with a predefined tag
-        exact_match = next((tag for tag in PREDEFINED_TAGS if tag.lower() == text.lower()), None)
+        # If we get here, check for exact match with a taxonomy tag
+        exact_match = self.tag_taxonomy.canonical(text)
         
         if exact_match and exact_match not in self.selected_tags:
             # If there's an exact match with a predefined tag, add it
@@ -2403,92 +1823,76 @@ class VietnameseQuestionList(QWidget):
         if tag in self.selected_tags:
             return
             
-        # Add to the in-memory list
+        # Add to the in-memory list and show it on the next free button
         self.selected_tags.append(tag)
-        
-        # Create a visual tag button
-        tag_button = TagButton(tag)
-        tag_button.removed.connect(self._remove_tag)
-        self.tags_display_layout.addWidget(tag_button)
+        self._sync_tag_buttons(len(self.selected_tags) - 1)
         
         # Update the question model
         if self.questions and len(self.questions) > 0:
             self.questions[0]['tags'] = self.selected_tags.copy()
             
-            # ALWAYS update UI for new questions (no original state)
-            has_original_data = hasattr(self, '_original_state') and self._original_state is not None
-            
-            # Force modified to true for new questions with tags
-            if not has_original_data:
-                self.modified = True
-                logger.info(f"Tag added to new question: {tag}, forcing UI update")
-                # Always update the UI state for new questions when tags are added
-                self._update_ui_state()
-                # Emit content changed signal
-                self.content_changed.emit()
-                return
-                
-            # For existing questions, check if this is a change
-            if has_original_data:
-                orig_tags = set(self._original_state.get('tags', []))
-                current_tags = set(self.selected_tags)
-                is_different = current_tags != orig_tags
-                
-                if is_different:
-                    self.modified = True
-                    logger.info(f"Tag added: {tag}, setting modified flag to True")
-                    
-                    # Update UI state to reflect changes
-                    self._update_ui_state()
-                    
-                    # Emit content changed signal
-                    self.content_changed.emit()
+            self._mark_dirty('tags')
 
     def _remove_tag(self, tag):
         """Remove a tag from the selected tags"""
         if tag in self.selected_tags:
-            self.selected_tags.remove(tag)
+            index = self.selected_tags.index(tag)
+            del self.selected_tags[index]
             
-            # Remove the visual button
-            for i in range(self.tags_display_layout.count()):
-                widget = self.tags_display_layout.itemAt(i).widget()
-                if isinstance(widget, TagButton) and widget.tag == tag:
-                    widget.setParent(None)
-                    widget.deleteLater()
-                    break
+            # The buttons after the removed tag move up by one tag
+            self._sync_tag_buttons(index)
                     
             # Update the question model
             if self.questions and len(self.questions) > 0:
                 self.questions[0]['tags'] = self.selected_tags.copy()
                 
-                # Check if this is a change from original state
-                has_original_data = hasattr(self, '_original_state') and self._original_state is not None
-                if has_original_data:
-                    orig_tags = set(self._original_state.get('tags', []))
-                    current_tags = set(self.selected_tags)
-                    is_different = current_tags != orig_tags
-                    
-                    if is_different:
-                        self.modified = True
-                        logger.info(f"Tag removed: {tag}, setting modified flag to True")
-                        
-                        # Update UI state to reflect changes
-                        self._update_ui_state()
-                        
-                        # Emit content changed signal
-                        self.content_changed.emit()
+                self._mark_dirty('tags')
 
     def _clear_tags(self):
         """Clear all selected tags"""
         # Clear the in-memory list
         self.selected_tags = []
         
-        # Clear the visual display
-        for i in reversed(range(self.tags_display_layout.count())):
-            widget = self.tags_display_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-                widget.deleteLater() 
+        # Hide the buttons - they are reused for the next tags
+        self._sync_tag_buttons(0)
+
+    def _set_tags(self, tags):
+        """Replace the selected tags, rebinding the buttons in one pass"""
+        self.selected_tags = list(dict.fromkeys(tags))
+        self._sync_tag_buttons(0)
+        
+        if self.questions and len(self.questions) > 0:
+            self.questions[0]['tags'] = self.selected_tags.copy()
+            
+            self._mark_dirty('tags')
+
+    def _sync_tag_buttons(self, start):
+        """Show selected_tags[start:] on the pooled buttons and hide the unused ones
+        
+        Buttons are only created when more tags are shown than ever before, so
+        moving between images rebinds texts instead of creating widgets.
+        """
+        while len(self._tag_buttons) < len(self.selected_tags):
+            tag_button = TagButton()
+            tag_button.removed.connect(self._remove_tag)
+            self.tags_display_layout.addWidget(tag_button)
+            self._tag_buttons.append(tag_button)
+        
+        for index in range(start, len(self._tag_buttons)):
+            tag_button = self._tag_buttons[index]
+            if index < len(self.selected_tags):
+                tag_button.set_tag(self.selected_tags[index])
+                tag_button.show()
+            else:
+                tag_button.hide()
+
+    def set_tag_frequencies(self, counts):
+        """Rank tag suggestions by how many labels use each tag
+        
+        Args:
+            counts: Dictionary of tag -> number of labels, e.g. FacetIndex.counts('tags')
+        """
+        self.tag_taxonomy.set_frequencies(counts)
 
     def has_questions(self):
         """Check if there are any confirmed questions with content.
@@ -2509,69 +1913,40 @@ class VietnameseQuestionList(QWidget):
         # Check if this is called for navigation or for confirmation
         # If is_confirmed is True, this is being checked during confirmation process
         if question.get('is_confirmed', False):
-            # For confirmed questions, apply strict validation
-            # A question is valid if it has text content and has tags
-            has_text = bool(question.get('question', '').strip())
-            has_tags = bool(question.get('tags', []))
-            
-            # If answerable, it must have an answer
-            is_answerable = question.get('answerable', 0) == 1
-            has_answer = False
-            
-            if is_answerable and 'answers' in question and question['answers']:
-                has_answer = bool(question['answers'][0].get('answer_text', '').strip())
-            
-            # For an answerable question, it must have an answer
-            # For a non-answerable question, we don't require an answer
-            is_valid = has_text and has_tags and (not is_answerable or (is_answerable and has_answer))
-            
-            return is_valid
+            # For confirmed questions, apply strict validation: text, tags and,
+            # for an answerable question, an answer
+            missing = validate_question(QuestionRecord.from_dict(question))
+            if missing and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Question is missing required fields: {missing}")
+            return not missing
         else:
             # For navigation between images, consider default values as valid
             # This allows users to move between images with default values
             return True
 
     def _on_content_changed(self):
-        """Handle changes to question properties"""
+        """Sync the question text into the model and schedule a change check"""
         if not self.questions:
             return
-            
+
         question = self.questions[0]  # Luôn sử dụng câu hỏi đầu tiên
-        current_text = self.question_text.text()
-        question_text = current_text.strip()
-        
-        # Debug log to track method calls
-        logger.info(f"_on_content_changed called with text: '{question_text}'")
-        
-        # IMPORTANT: Always update the question model with current text
-        question['question'] = question_text
-        
-        # Check if this is a new question (no original state)
-        has_original_data = hasattr(self, '_original_state') and self._original_state is not None
-        
-        # For new unlabeled images, always update UI if text is entered
-        if not has_original_data:
-            # Get basic validation status
-            has_text = bool(question_text)
-            has_tags = bool(self.selected_tags)
-            
-            # If we have both text and tags for a new question, force UI update
-            if has_text and has_tags:
-                logger.info(f"Text and tags present for new question, forcing UI update")
-                # Force update UI state for new questions
-                self._update_ui_state()
-                return
         
         # Store original content if this is first edit and no original_text exists
         if question.get('is_confirmed', False) and 'original_text' not in question:
             question['original_text'] = question.get('question', '')
         
-        # Continue with the rest of the method as before...
-        # Get current values for validation and comparison
-        has_text = bool(question_text)
-        has_tags = bool(self.selected_tags)
-        is_answerable = self.can_answer_check.isChecked()
-        question_answerable = question.get('answerable', 0) == 1
+        question['question'] = self.question_text.text().strip()
+        self._mark_dirty('question')
+
+    def _on_question_text_changed(self, _text):
+        """Handle typing in the question field - runs per keystroke, so only marks it dirty"""
+        self._on_content_changed()
+
+    def _on_answer_text_changed(self, _text):
+        """Handle typing in the answer field - runs per keystroke, so only marks it dirty"""
+        if not self.questions:
+            return
+        self._mark_dirty('answers')
     
     def _on_question_type_changed(self, index):
         """Handle changes to the question type"""
@@ -2591,28 +1966,12 @@ class VietnameseQuestionList(QWidget):
         new_value = self.question_type_combo.currentData()
         new_text = self.question_type_combo.currentText()
         
-        logger.info(f"Question type changed: Old={old_value} ({old_text}) -> New={new_value} ({new_text})")
+        logger.debug(f"Question type changed: Old={old_value} ({old_text}) -> New={new_value} ({new_text})")
             
         # Update the question type in the model
         self.questions[0]['question_type'] = new_value
         
-        # Check if this is actually a change from the original value
-        is_different = True
-        if hasattr(self, '_original_state') and self._original_state is not None:
-            orig_type = str(self._original_state.get('question_type', '')).lower()
-            current_type = str(new_value).lower()
-            is_different = orig_type != current_type
-            
-        # Set modified flag only if there's a real change from original
-        if is_different:
-            self.modified = True
-            logger.info(f"Question type changed from original, setting modified flag to True")
-        
-        # Update UI state - this will reflect the changed state in the UI
-        self._update_ui_state()
-        
-        # Emit content changed signal to notify parent components
-        self.content_changed.emit()
+        self._mark_dirty('question_type')
         
     def _on_source_changed(self, index):
         """Handle changes to the QA source"""
@@ -2623,21 +1982,6 @@ class VietnameseQuestionList(QWidget):
         new_source = self.source_combo.currentData()
         
         # Update the source in the model
-        self.questions[0]['source'] = new_source
-        
-        # Check if this is actually a change from the original value
-        is_different = True
-        if hasattr(self, '_original_state') and self._original_state is not None:
-            orig_source = self._original_state.get('qa_source', self._original_state.get('source', ''))
-            is_different = orig_source != new_source
-            
-        # Set modified flag only if there's a real change from original
-        if is_different:
-            self.modified = True
-            logger.info(f"Source changed from original, setting modified flag to True")
-        
-        # Update UI state - this will reflect the changed state in the UI
-        self._update_ui_state()
+        self.questions[0]['qa_source'] = new_source
         
-        # Emit content changed signal to notify parent components
-        self.content_changed.emit()
\ No newline at end of file
+        self._mark_dirty('qa_source')
\ No newline at end of file
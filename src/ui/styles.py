@@ -0,0 +1,160 @@
+"""Stylesheet of the labelling UI
+
+Widgets that are restyled at run time (the answer field) or created in
+numbers (tag buttons) are styled from the application stylesheet by object
+name, with their alternative looks selected by a dynamic property. Switching
+looks with set_state only re-polishes the widget; no stylesheet is parsed
+again while moving between images.
+"""
+
+# Application-wide stylesheet, applied once by the main window
+APP_STYLESHEET = """
+    QWidget {
+        background-color: #f0f0f0;
+        font-family: Arial, sans-serif;
+    }
+    QLabel {
+        font-size: 14px;
+    }
+    QPushButton {
+        padding: 6px 12px;
+        background-color: #4a90e2;
+        color: white;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #357ab7;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+    QTextEdit, QLineEdit {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 6px;
+        background-color: white;
+    }
+    QListWidget {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        background-color: white;
+    }
+    
+    /* Style standard message box buttons */
+    QMessageBox {
+        background-color: #f5f6fa;
+    }
+    QMessageBox QPushButton {
+        min-width: 120px;
+        min-height: 40px;
+        font-weight: bold;
+        font-size: 16px;
+        border-radius: 5px;
+        padding: 8px 16px;
+        color: black;
+        border: none;
+    }
+    /* Yes button - Green */
+    QMessageBox QPushButton[text="Yes"], 
+    QMessageBox QPushButton[text="&Yes"],
+    QMessageBox QPushButton[text="Có"] {
+        background-color: #00C853;
+    }
+    QMessageBox QPushButton[text="Yes"]:hover, 
+    QMessageBox QPushButton[text="&Yes"]:hover,
+    QMessageBox QPushButton[text="Có"]:hover {
+        background-color: #00E676;
+    }
+    /* No button - Red */
+    QMessageBox QPushButton[text="No"], 
+    QMessageBox QPushButton[text="&No"],
+    QMessageBox QPushButton[text="Không"] {
+        background-color: #D50000;
+    }
+    QMessageBox QPushButton[text="No"]:hover, 
+    QMessageBox QPushButton[text="&No"]:hover,
+    QMessageBox QPushButton[text="Không"]:hover {
+        background-color: #FF1744;
+    }
+    /* Cancel button - Gray */
+    QMessageBox QPushButton[text="Cancel"], 
+    QMessageBox QPushButton[text="&Cancel"],
+    QMessageBox QPushButton[text="Hủy"] {
+        background-color: #424242;
+    }
+    QMessageBox QPushButton[text="Cancel"]:hover, 
+    QMessageBox QPushButton[text="&Cancel"]:hover,
+    QMessageBox QPushButton[text="Hủy"]:hover {
+        background-color: #616161;
+    }
+    /* OK button - Blue */
+    QMessageBox QPushButton[text="OK"], 
+    QMessageBox QPushButton[text="&OK"] {
+        background-color: #2962FF;
+    }
+    QMessageBox QPushButton[text="OK"]:hover, 
+    QMessageBox QPushButton[text="&OK"]:hover {
+        background-color: #448AFF;
+    }
+
+    /* Question form. Rules of ancestors' own stylesheets would override these, so
+       the form's base look is here too, and the more specific rules come after it */
+    #questionList, #questionList QWidget {
+        background-color: #ebeef2;
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+    }
+
+    /* Strip of selected tags and the tag search field */
+    #tagsContainer, #tagsContainer QWidget {
+        background-color: white;
+        border: 1px solid #bdc3c7;
+        border-radius: 5px;
+    }
+
+    /* Answer field; set_state(answer_text, 'state', 'readonly') shows the unanswerable look */
+    QLineEdit#answerText {
+        background-color: white;
+        border: 1px solid #bdc3c7;
+        border-radius: 5px;
+        padding: 8px;
+        min-height: 25px;
+        font-size: 13px;
+    }
+    QLineEdit#answerText[state="readonly"] {
+        background-color: #f0f2f5;
+        color: #7f8c8d;
+        font-style: italic;
+    }
+
+    /* Selected-tag buttons, matched by object name instead of a stylesheet per button */
+    QPushButton#tagButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 4px 8px;
+        margin: 2px;
+        font-size: 12px;
+        max-height: 24px;
+    }
+    QPushButton#tagButton:hover {
+        background-color: #2980b9;
+    }
+"""
+
+
+def set_state(widget, name, value):
+    """Set a dynamic style property and re-polish the widget if it changed
+
+    Args:
+        widget: Widget styled by a [name="value"] selector
+        name: Name of the property, e.g. 'state'
+        value: New value; None removes the property and so selects the default look
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
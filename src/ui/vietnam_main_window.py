@@ -1,11 +1,11 @@
 import os
 import sys
-import json
 import logging
+from bisect import bisect_left
 import uuid
 from datetime import datetime
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QMessageBox, QPushButton, QLabel, QComboBox
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QWidget, QHBoxLayout, QVBoxLayout, QMessageBox, QPushButton, QLabel, QComboBox
+from PyQt5.QtCore import Qt, QTimer
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +13,34 @@ logger = logging.getLogger(__name__)
 from src.ui.components.image_viewer import ImageViewer
 from src.ui.components.navigation import NavigationButtons
 from src.ui.components.title_display import TitleDisplay
+from src.ui.components.filter_bar import FilterBar
+from src.ui.components.search_panel import SearchPanel
 from src.ui.components.vietnamese_question_list import VietnameseQuestionList
+from src.ui.styles import APP_STYLESHEET
+from src.imaging.prefetcher import ImagePrefetcher
+from src.imaging.preview_cache import PreviewCache, PREVIEW_CACHE_DIR, PREVIEW_CACHE_MAX_MB
+from src.imaging.pixmap_cache import PixmapCache, PIXMAP_CACHE_MAX_MB
+from src.core.label_index import LabelIndex
+from src.core.label_session import LabelSession
+from src.core.label_store import create_label_store, DEFAULT_LABEL_BACKEND, DEFAULT_LABEL_DB
+from src.core.draft_journal import DraftJournal, DRAFT_JOURNAL_PATH
+from src.core.image_list import (ImageListCache, IMAGE_LIST_CACHE_PATH, folder_mtime_ns, is_image_file,
+                                  next_name_after, previous_name_before)
+from src.core import folder_watcher, startup_timing
+from src.core.question_record import QuestionRecord
+from src.ml import plugins
+from src.ml.suggestions import AI_PREFILL_BACKEND
+from src.ui.workers.label_writer import LabelWriter
+from src.ui.workers.prefill_worker import PrefillWorker
+from src.ui.workers.image_scan_worker import ImageScanWorker
+from src.ui.workers.folder_monitor import FolderMonitor
+from src.ui.workers.label_index_worker import LabelIndexWorker
+
+# Quiet period after the last edit before the draft is written to the journal
+DRAFT_DEBOUNCE_MS = 500
+
+# Unlabeled images ahead of the current one that the AI prefill worker works on
+PREFILL_LOOKAHEAD = 5
 
 class VietnamMainWindow(QWidget):
     """Main window for Vietnamese-only mode"""
@@ -24,34 +51,325 @@ class VietnamMainWindow(QWidget):
         self.load_image_files()
         self.init_ui()
         self.connect_signals()
+        if self._image_list_complete:
+            self._offer_draft_recovery()
         self.load_current_image()
 
     def setup_data_paths(self):
         """Setup data directory paths"""
         self.image_folder = "data/image"
         self.label_folder = "data/labels"
+
+        # Sorted image list of image_folder, persisted so large folders are not rescanned on every start
+        self.image_list_cache_path = IMAGE_LIST_CACHE_PATH
+
+        # Label storage backend - "json" (one file per image in label_folder) or "sqlite"
+        self.label_backend = DEFAULT_LABEL_BACKEND
+        self.label_db_path = DEFAULT_LABEL_DB
+
+        # Downscaled previews of data/image, reused across sessions
+        self.preview_cache_dir = PREVIEW_CACHE_DIR
+        self.preview_cache_max_mb = PREVIEW_CACHE_MAX_MB
+
+        # Memory budget for decoded images kept for back-and-forth navigation
+        self.pixmap_cache_max_mb = PIXMAP_CACHE_MAX_MB
         
         # Create directories if they don't exist
         os.makedirs(self.image_folder, exist_ok=True)
         os.makedirs(self.label_folder, exist_ok=True)
 
+        self.label_store = create_label_store(self.label_backend, self.label_folder, self.label_db_path)
+        logger.info(f"Using '{self.label_backend}' label store")
+
+        # Labeled status of every image, built once instead of stat'ing label files on each event
+        self.label_index = LabelIndex(self.label_store)
+        self.label_index.build()
+
+        # Label field values -> images for filtered navigation, and question/answer words -> images
+        # for search; both are built in the background
+        self.facet_index = None
+        self.search_index = None
+        self._pending_index_updates = {}  # image id -> label (None if removed) saved while the indexes build
+        self.active_filters = {}
+        self._filter_matches = []  # sorted file names of the images matching active_filters
+
+        # Labels are written on a background thread so saving never blocks the UI
+        self.label_writer = LabelWriter(self.label_store, parent=self)
+        self._labeled_before_save = {}  # image id -> labeled status before a queued save
+
+        # Image list, current image and save pipeline; the window is a view over the session
+        self.session = LabelSession(self.label_store, self.label_index, save_label=self.label_writer.submit)
+
+        # Unsaved edits are journaled so they can be recovered after a crash
+        self.draft_journal_path = DRAFT_JOURNAL_PATH
+        self.draft_journal = DraftJournal(self.draft_journal_path)
+        self._restored_drafts = {}  # image id -> draft to apply when the image is loaded
+
+        # Suggestions for upcoming unlabeled images, computed in a separate process once the
+        # first image is shown; None when AI_PREFILL_BACKEND is not set
+        self.prefill_worker = None
+
+    @property
+    def image_files(self):
+        """Sorted image file names of the session"""
+        return self.session.image_files
+
+    @property
+    def current_index(self):
+        """Position of the current image in image_files"""
+        return self.session.current_index
+
+    @current_index.setter
+    def current_index(self, index):
+        self.session.current_index = index
+
+    @property
+    def unlabeled_index(self):
+        """Sorted unlabeled images of the session"""
+        return self.session.unlabeled_index
+
     def load_image_files(self):
-        """Load and validate image files"""
-        self.image_files = sorted([
-            f for f in os.listdir(self.image_folder)
-            if f.lower().endswith(('.png', '.jpg', '.jpeg'))
-        ])
-        self.current_index = 0
+        """Load the image list, scanning the folder in the background when needed
+
+        The list saved by the previous session is used right away. If the folder
+        changed since then (or there is no saved list), a background scan streams
+        in the image names and the list is completed incrementally.
+        """
+        self._unconfirmed_image_files = set()  # cached names the background scan has yet to confirm
+        self._image_list_complete = False
+        self.image_scan_worker = None
+        self.image_list_cache = ImageListCache(self.image_list_cache_path)
+
+        cached = self.image_list_cache.load(self.image_folder)
+        if cached is not None:
+            names, mtime_ns = cached
+            self.session.set_images(names)
+            if mtime_ns == folder_mtime_ns(self.image_folder):
+                logger.info(f"Image list cache is up to date: {len(names)} images, skipping folder scan")
+                self._image_list_complete = True
+                if not self.image_files:
+                    QMessageBox.critical(self, "Error", "No images found in the 'data/image' folder!")
+                    sys.exit()
+                return
+            logger.info(f"Image folder changed since the list was cached, rescanning in the background")
+            self._unconfirmed_image_files = set(names)
+
+        # Started in connect_signals once the UI exists
+        self.image_scan_worker = ImageScanWorker(self.image_folder, parent=self)
+
+    def _merge_image_files(self, names):
+        """Merge a sorted batch of image names into the list, keeping the current image selected"""
+        self.session.merge_images(names)
+
+    def _remove_image_files(self, names):
+        """Drop image names from the list, keeping the current image selected if it still exists"""
+        current_name = self.session.current_name
+        gone = self.session.remove_images(names)
+        if not gone:
+            return
+        self._filter_matches = [name for name in self._filter_matches if name not in gone]
+        if current_name in gone:
+            logger.info(f"Current image {current_name} no longer exists")
+            self.load_current_image()
+
+    def _on_image_batch_found(self, names):
+        """Add images found by the background scan, showing the first one right away"""
+        was_empty = not self.image_files
+        self._merge_image_files(names)
+        logger.debug(f"Image scan: {len(names)} found, {len(self.image_files)} listed")
+        if was_empty and self.image_files:
+            self.load_current_image()
+        else:
+            self.navigation.set_back_enabled(self.current_index > 0)
+
+    def _on_image_scan_finished(self, names, mtime_ns):
+        """Drop images that disappeared since the cached list was saved and persist the fresh list"""
+        # Only cached names can be stale - images added by the folder monitor meanwhile are kept
+        self._remove_image_files(self._unconfirmed_image_files.difference(names))
+        self._unconfirmed_image_files = set()
+        self._image_list_complete = True
+        try:
+            self.image_list_cache.save(self.image_folder, self.image_files, mtime_ns)
+        except OSError as e:
+            logger.warning(f"Could not save image list cache: {str(e)}")
 
         if not self.image_files:
             QMessageBox.critical(self, "Error", "No images found in the 'data/image' folder!")
-            sys.exit()
+            QApplication.quit()
+            return
+
+        if self._offer_draft_recovery():
+            self.load_current_image()
+
+    def _create_folder_monitor(self):
+        """Watch the image folder (and label folder with the JSON backend) for changes by other tools"""
+        if not folder_watcher.is_supported():
+            logger.warning("inotify is not available, new images and labels will be picked up on restart")
+            return None
+        folders = [self.image_folder]
+        if self.label_backend == "json":
+            folders.append(self.label_folder)
+        try:
+            return FolderMonitor(folders, parent=self)
+        except OSError as e:
+            logger.warning(f"Could not watch data folders, new images and labels will be picked up on restart: {str(e)}")
+            return None
+
+    def _on_folder_files_changed(self, folder, added, removed):
+        """Apply a batch of file changes reported by the folder monitor"""
+        if folder == self.image_folder:
+            was_empty = not self.image_files
+            self._merge_image_files([name for name in added if is_image_file(name)])
+            self._remove_image_files([name for name in removed if is_image_file(name)])
+            if was_empty and self.image_files:
+                self.load_current_image()
+            elif self.image_files:
+                self.navigation.set_back_enabled(self.current_index > 0)
+        elif folder == self.label_folder:
+            self._apply_label_changes(added, removed)
+
+    def _apply_label_changes(self, added, removed):
+        """Update the label index for label files written or deleted outside this window"""
+        changed_ids = set()
+        for name in added:
+            if name.startswith('.') or not name.endswith('.json'):
+                continue
+            image_id = name[:-len('.json')]
+            try:
+                self._mark_labeled(image_id, os.path.getmtime(os.path.join(self.label_folder, name)))
+            except FileNotFoundError:
+                self._mark_unlabeled(image_id)
+            changed_ids.add(image_id)
+        for name in removed:
+            if name.startswith('.') or not name.endswith('.json'):
+                continue
+            image_id = name[:-len('.json')]
+            self._mark_unlabeled(image_id)
+            changed_ids.add(image_id)
+
+        for image_id in changed_ids:
+            try:
+                self._index_label(image_id, self.label_store.load(image_id))
+            except ValueError as e:
+                logger.error(f"Could not index changed label {image_id}: {str(e)}")
+
+        if self.image_files and self._current_image_id() in changed_ids and not self.question_list.is_modified():
+            self._show_label_status()
+
+    def _mark_labeled(self, image_id, mtime=None):
+        """Record that the image has a saved label"""
+        self.session.mark_labeled(image_id, mtime)
+        self._update_unlabeled_jumps()
+
+    def _mark_unlabeled(self, image_id):
+        """Record that the image has no label"""
+        self.session.mark_unlabeled(image_id)
+        self._update_unlabeled_jumps()
+
+    def _update_unlabeled_jumps(self):
+        """Enable the jump buttons only when there is an unlabeled image in that direction"""
+        if not self.image_files:
+            self.navigation.set_unlabeled_jumps_enabled(False, False)
+            return
+        current_name = self.image_files[self.current_index]
+        self.navigation.set_unlabeled_jumps_enabled(
+            self.unlabeled_index.previous_before(current_name) is not None,
+            self.unlabeled_index.next_after(current_name) is not None
+        )
+
+    def _on_label_indexes_built(self, facet_index, search_index):
+        """Take over the indexes built in the background and apply saves made meanwhile"""
+        self.facet_index = facet_index
+        self.search_index = search_index
+        for image_id, data in self._pending_index_updates.items():
+            self._index_label(image_id, data)
+        self._pending_index_updates = {}
+        self.filter_bar.set_values(self.facet_index)
+        self._refresh_filter_matches()
+        self.search_panel.set_index(self.search_index)
+        self.question_list.set_tag_frequencies(self.facet_index.counts('tags'))
+
+    def _on_label_indexes_failed(self, message):
+        """Leave filtering disabled if the labels could not be indexed"""
+        self.filter_bar.match_label.setText("Không thể tạo chỉ mục")
+        self.search_panel.status_label.setText("Không thể tạo chỉ mục")
+        logger.error(f"Label indexes unavailable: {message}")
+
+    def _index_label(self, image_id, data):
+        """Re-index the label of an image after it was saved or removed (data is None)"""
+        if self.facet_index is None:
+            self._pending_index_updates[image_id] = data
+            return
+        if data is None:
+            self.facet_index.remove(image_id)
+            self.search_index.remove(image_id)
+        else:
+            self.facet_index.update(image_id, data)
+            self.search_index.update(image_id, data)
+        self.filter_bar.set_values(self.facet_index)
+        self.question_list.set_tag_frequencies(self.facet_index.counts('tags'))
+
+        if not self.active_filters:
+            return
+        name = self.unlabeled_index.name_for(image_id)
+        if name is None:
+            return
+        pos = bisect_left(self._filter_matches, name)
+        present = pos < len(self._filter_matches) and self._filter_matches[pos] == name
+        matches = self.facet_index.matches(image_id, self.active_filters)
+        if matches and not present:
+            self._filter_matches.insert(pos, name)
+        elif present and not matches:
+            del self._filter_matches[pos]
+        self.filter_bar.set_match_count(len(self._filter_matches))
+
+    def _on_filters_changed(self, filters):
+        """Restrict Next/Back to the images matching the selected filters"""
+        logger.info(f"Navigation filters changed: {filters}")
+        self.active_filters = filters
+        self._refresh_filter_matches()
+
+    def _refresh_filter_matches(self):
+        """Recompute the sorted list of images matching the active filters"""
+        if not self.active_filters or self.facet_index is None:
+            self._filter_matches = []
+            self.filter_bar.set_match_count(None)
+            return
+        ids = self.facet_index.match(self.active_filters)
+        self._filter_matches = [name for name in self.image_files if name.rsplit('.', 1)[0] in ids]
+        self.filter_bar.set_match_count(len(self._filter_matches))
+        logger.info(f"{len(self._filter_matches)} images match {self.active_filters}")
+
+    def _show_label_status(self):
+        """Show the labeled status of the current image in the title"""
+        image_path = os.path.join(self.image_folder, self.image_files[self.current_index])
+        if self.label_index.is_labeled(self._current_image_id()):
+            self.title_display.set_image_name(image_path, '<span style="color: #2ecc71; font-weight: bold;">LABELED</span>')
+            self.setWindowTitle("Vietnamese Image Labeling Tool - Câu Hỏi - LABELED")
+        else:
+            self.title_display.set_image_name(image_path, "UNLABELED")
+            self.setWindowTitle("Vietnamese Image Labeling Tool - Câu Hỏi - UNLABELED")
+
+    def _on_image_scan_failed(self, message):
+        """Report an unreadable image folder"""
+        QMessageBox.critical(self, "Error", f"Could not read the 'data/image' folder: {message}")
+        if not self.image_files:
+            QApplication.quit()
 
     def init_ui(self):
         """Initialize the main UI components"""
         # Create components
         self.title_display = TitleDisplay()
-        self.image_viewer = ImageViewer()
+        self.filter_bar = FilterBar()
+        self.preview_cache = PreviewCache(self.preview_cache_dir, self.preview_cache_max_mb)
+        self.pixmap_cache = PixmapCache(self.pixmap_cache_max_mb)
+        self.image_prefetcher = ImagePrefetcher(
+            preview_cache=self.preview_cache,
+            pixmap_cache=self.pixmap_cache,
+            parent=self
+        )
+        self.image_viewer = ImageViewer(self.image_prefetcher, self.preview_cache)
+        self.search_panel = SearchPanel()
         self.question_list = VietnameseQuestionList()
         self.navigation = NavigationButtons()
 
@@ -62,6 +380,7 @@ class VietnamMainWindow(QWidget):
 
         # Add title at the top
         main_layout.addWidget(self.title_display)
+        main_layout.addWidget(self.filter_bar)
 
         # Create horizontal layout for image and controls
         content_layout = QHBoxLayout()
@@ -71,6 +390,7 @@ class VietnamMainWindow(QWidget):
         image_layout = QVBoxLayout()
         image_layout.setContentsMargins(0, 0, 0, 0)
         image_layout.addWidget(self.image_viewer)
+        image_layout.addWidget(self.search_panel)
         image_layout.addStretch()
 
         # Setup right side layout with increased space for questions
@@ -101,123 +421,62 @@ class VietnamMainWindow(QWidget):
         """Connect component signals to slots"""
         self.navigation.next_clicked.connect(self.next_image)
         self.navigation.back_clicked.connect(self.prev_image)
+        self.navigation.next_unlabeled_clicked.connect(self.next_unlabeled_image)
+        self.navigation.prev_unlabeled_clicked.connect(self.prev_unlabeled_image)
         self.question_list.content_changed.connect(self._on_content_changed)
         # Connect the question_confirmed signal to trigger save_current_data
         self.question_list.question_confirmed.connect(self._on_question_confirmed)
+        self.label_writer.save_finished.connect(self._on_label_saved)
+        self.label_writer.save_failed.connect(self._on_label_save_failed)
+        self.image_viewer.image_shown.connect(self._on_first_image_shown)
+
+        # Journal edits once typing pauses rather than on every keystroke
+        self._draft_timer = QTimer(self)
+        self._draft_timer.setSingleShot(True)
+        self._draft_timer.setInterval(DRAFT_DEBOUNCE_MS)
+        self._draft_timer.timeout.connect(self._record_draft)
+        self.question_list.edited.connect(self._schedule_draft)
+
+        self.filter_bar.filters_changed.connect(self._on_filters_changed)
+        self.search_panel.image_selected.connect(self.open_image_by_id)
+        self.label_index_worker = LabelIndexWorker(self.label_store, parent=self)
+        self.label_index_worker.index_built.connect(self._on_label_indexes_built)
+        self.label_index_worker.index_failed.connect(self._on_label_indexes_failed)
+        self.label_index_worker.start()
+
+        # Watch before scanning so nothing added during the scan is missed
+        self.folder_monitor = self._create_folder_monitor()
+        if self.folder_monitor is not None:
+            self.folder_monitor.files_changed.connect(self._on_folder_files_changed)
+
+        if self.image_scan_worker is not None:
+            self.image_scan_worker.batch_found.connect(self._on_image_batch_found)
+            self.image_scan_worker.scan_finished.connect(self._on_image_scan_finished)
+            self.image_scan_worker.scan_failed.connect(self._on_image_scan_failed)
+            self.image_scan_worker.start()
 
     def apply_styles(self):
-        """Apply global styles to the main window"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f0f0f0;
-                font-family: Arial, sans-serif;
-            }
-            QLabel {
-                font-size: 14px;
-            }
-            QPushButton {
-                padding: 6px 12px;
-                background-color: #4a90e2;
-                color: white;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #357ab7;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-            QTextEdit, QLineEdit {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 6px;
-                background-color: white;
-            }
-            QListWidget {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: white;
-            }
-            
-            /* Style standard message box buttons */
-            QMessageBox {
-                background-color: #f5f6fa;
-            }
-            QMessageBox QPushButton {
-                min-width: 120px;
-                min-height: 40px;
-                font-weight: bold;
-                font-size: 16px;
-                border-radius: 5px;
-                padding: 8px 16px;
-                color: black;
-                border: none;
-            }
-            /* Yes button - Green */
-            QMessageBox QPushButton[text="Yes"], 
-            QMessageBox QPushButton[text="&Yes"],
-            QMessageBox QPushButton[text="Có"] {
-                background-color: #00C853;
-            }
-            QMessageBox QPushButton[text="Yes"]:hover, 
-            QMessageBox QPushButton[text="&Yes"]:hover,
-            QMessageBox QPushButton[text="Có"]:hover {
-                background-color: #00E676;
-            }
-            /* No button - Red */
-            QMessageBox QPushButton[text="No"], 
-            QMessageBox QPushButton[text="&No"],
-            QMessageBox QPushButton[text="Không"] {
-                background-color: #D50000;
-            }
-            QMessageBox QPushButton[text="No"]:hover, 
-            QMessageBox QPushButton[text="&No"]:hover,
-            QMessageBox QPushButton[text="Không"]:hover {
-                background-color: #FF1744;
-            }
-            /* Cancel button - Gray */
-            QMessageBox QPushButton[text="Cancel"], 
-            QMessageBox QPushButton[text="&Cancel"],
-            QMessageBox QPushButton[text="Hủy"] {
-                background-color: #424242;
-            }
-            QMessageBox QPushButton[text="Cancel"]:hover, 
-            QMessageBox QPushButton[text="&Cancel"]:hover,
-            QMessageBox QPushButton[text="Hủy"]:hover {
-                background-color: #616161;
-            }
-            /* OK button - Blue */
-            QMessageBox QPushButton[text="OK"], 
-            QMessageBox QPushButton[text="&OK"] {
-                background-color: #2962FF;
-            }
-            QMessageBox QPushButton[text="OK"]:hover, 
-            QMessageBox QPushButton[text="&OK"]:hover {
-                background-color: #448AFF;
-            }
-        """)
+        """Apply the application stylesheet"""
+        QApplication.instance().setStyleSheet(APP_STYLESHEET)
 
     def load_current_image(self):
         """Load and display the current image and its data"""
         if self.current_index < len(self.image_files):
             # First, clear any existing data to ensure clean state for the new image
-            logger.info(f"Clearing existing data before loading image at index {self.current_index}")
+            logger.debug(f"Clearing existing data before loading image at index {self.current_index}")
             self.question_list.clear()
             
             image_name = self.image_files[self.current_index]
             image_path = os.path.join(self.image_folder, image_name)
             base_name = image_name.rsplit('.', 1)[0]
             
-            logger.info(f"Loading image: {image_name}, base name: {base_name}")
+            logger.debug(f"Loading image: {image_name}, base name: {base_name}")
             
-            json_path = os.path.join(self.label_folder, f"{base_name}.json")
-            logger.info(f"Label JSON path: {json_path}")
 
             # Check if image is already labeled
-            is_labeled = os.path.exists(json_path)
+            is_labeled = self.session.is_labeled(base_name)
             status_text = "LABELED" if is_labeled else "UNLABELED"
-            logger.info(f"Image labeled status: {is_labeled}")
+            logger.debug(f"Image labeled status: {is_labeled}")
             
             # Update title display with status (using HTML for green color if labeled)
             if is_labeled:
@@ -228,35 +487,16 @@ class VietnamMainWindow(QWidget):
             # Load question data if exists
             if is_labeled:
                 try:
-                    logger.info(f"Loading existing label data from {json_path}")
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Get image source from JSON file and handle transformation from old to new format
-                    image_source = data.get('image_source', 'image_crowdsourcing')
-                    # Transform 'self_collected' to 'manually_collected' for compatibility
-                    if image_source == 'self_collected':
-                        image_source = 'manually_collected'
-                        logger.info(f"Transformed image_source from 'self_collected' to 'manually_collected'")
-                    
-                    questions = data.get('questions', [])
-                    logger.info(f"Loaded {len(questions)} questions from JSON file")
-                    
-                    # Process questions to update any 'self_collected' references in QA sources
-                    for question in questions:
-                        if question.get('qa_source') == 'self_collected':
-                            question['qa_source'] = 'manually_collected'
-                        # Also check the legacy 'source' field if present
-                        if question.get('source') == 'self_collected':
-                            question['source'] = 'manually_collected'
-                    
-                    # Pass both image source and questions to component
-                    logger.info(f"Setting questions with image_source: {image_source}")
-                    self.question_list.set_questions(questions, image_source)
+                    logger.debug(f"Loading existing label data for {base_name}")
+                    # The session keeps the label as the original and renames legacy values
+                    # such as 'self_collected', so the component gets one canonical format
+                    label = self.session.open()
+                    logger.debug(f"Loaded {len(label.questions)} questions, image_source: {label.image_source}")
+                    self.question_list.set_questions(label.questions, label.image_source)
                     
                     # Explicitly reset the modified flag after loading
                     self.question_list.modified = False
-                    logger.info("Reset modified flag to False after loading existing data")
+                    logger.debug("Reset modified flag to False after loading existing data")
                     
                     # Make sure the UI immediately shows the correct status with green color
                     self.title_display.set_image_name(image_path, '<span style="color: #2ecc71; font-weight: bold;">LABELED</span>')
@@ -266,260 +506,404 @@ class VietnamMainWindow(QWidget):
                     logger.error(f"Error loading label data: {str(e)}")
                     logger.exception("Stack trace:")
                     self.question_list.clear()
-                    logger.info("Cleared question list due to error loading data")
+                    logger.debug("Cleared question list due to error loading data")
             else:
-                logger.info("Image is unlabeled, using clean default state")
+                logger.debug("Image is unlabeled, using clean default state")
+                self.session.open()
                 # No need to call clear() again as we did it at the beginning
                 # Just log for clarity
-                logger.info("Using empty question list for unlabeled image")
+                logger.debug("Using empty question list for unlabeled image")
+
+            # Re-apply edits recovered from the draft journal, if any
+            draft = self._restored_drafts.pop(base_name, None)
+            if draft is not None:
+                logger.debug(f"Restoring recovered draft for {base_name}")
+                self.question_list.apply_draft(draft)
+            elif not is_labeled:
+                self._apply_suggestion(base_name)
 
             # Update UI
             self.image_viewer.load_image(image_path)
-            logger.info(f"Loaded image into viewer: {image_path}")
+            logger.debug(f"Loaded image into viewer: {image_path}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Pixmap cache stats: {self.pixmap_cache.stats()}")
+
+            # Decode the neighbours in the background while the user works on this image
+            self._prefetch_neighbours()
+            self._request_prefill()
 
             # Update navigation buttons
             self.navigation.set_back_enabled(self.current_index > 0)
             self.navigation.set_next_enabled(True)
-            logger.info(f"Updated navigation buttons: back={self.current_index > 0}, next=True")
+            self._update_unlabeled_jumps()
+            logger.debug(f"Updated navigation buttons: back={self.current_index > 0}, next=True")
 
             # Update window title with status (only if not already set above)
             if not is_labeled:
                 self.setWindowTitle(f"Vietnamese Image Labeling Tool - Câu Hỏi - {status_text}")
-                logger.info(f"Set window title to unlabeled status: {status_text}")
+                logger.debug(f"Set window title to unlabeled status: {status_text}")
                 
-            logger.info(f"Completed loading image at index {self.current_index}")
+            logger.debug(f"Completed loading image at index {self.current_index}")
+        elif not self.image_files and not self._image_list_complete:
+            self.title_display.setText("Scanning image folder...")
+            logger.info("No images found yet, waiting for the folder scan")
         else:
             logger.error(f"Invalid current_index {self.current_index}, max index is {len(self.image_files)-1 if self.image_files else 'N/A'}")
 
+    def _on_first_image_shown(self, _image_path):
+        """Complete the startup report and start loading ML backends in the background"""
+        self.image_viewer.image_shown.disconnect(self._on_first_image_shown)
+        startup_timing.mark('first_image')
+        # Loads ML_PREWARM_PLUGINS (none by default); queued, so the import never delays painting the first image
+        QTimer.singleShot(0, plugins.registry.prewarm)
+        if AI_PREFILL_BACKEND:
+            self.prefill_worker = PrefillWorker(AI_PREFILL_BACKEND, parent=self)
+            self.prefill_worker.suggestion_ready.connect(self._on_suggestion_ready)
+            self._request_prefill()
+
+    def _request_prefill(self):
+        """Ask the prefill worker for the current and the next unlabeled images"""
+        if self.prefill_worker is None:
+            return
+        # Binary search in the unlabeled index, so labeled stretches of the folder are never walked
+        self.prefill_worker.request([
+            (name.rsplit('.', 1)[0], os.path.join(self.image_folder, name))
+            for name in self.session.upcoming_unlabeled(PREFILL_LOOKAHEAD + 1)
+        ])
+
+    def _on_suggestion_ready(self, image_id, _question):
+        """Show a suggestion that arrives while its image is open"""
+        if self.image_files and image_id == self._current_image_id():
+            self._apply_suggestion(image_id)
+
+    def _apply_suggestion(self, image_id):
+        """Fill the form with the AI suggestion of an unlabeled image the annotator has not edited"""
+        if self.prefill_worker is None or self.session.is_labeled(image_id) or self.question_list.is_modified():
+            return
+        question = self.prefill_worker.suggestion(image_id)
+        if question is not None:
+            logger.debug(f"Prefilling {image_id} with an AI suggestion")
+            self.question_list.apply_suggestion(QuestionRecord.from_dict(question))
+
+    def _current_image_id(self):
+        """Return the id (file name without extension) of the current image"""
+        return self.session.current_image_id
+
+    def _schedule_draft(self):
+        """Restart the debounce timer after an edit"""
+        self._draft_timer.start()
+
+    def _record_draft(self):
+        """Write the current unsaved edits to the draft journal"""
+        if not self.image_files:
+            return
+        image_id = self._current_image_id()
+        if self.question_list.is_modified():
+            self.draft_journal.record(image_id, self.question_list.get_draft())
+        else:
+            self.draft_journal.discard(image_id)
+
+    def _offer_draft_recovery(self):
+        """Offer to restore drafts that were never saved, e.g. because the app crashed
+
+        Called once the image list is complete.
+
+        Returns:
+            bool: True if current_index moved to a recovered image that still needs loading
+        """
+        pending = self.draft_journal.pending()
+        if not pending:
+            return False
+
+        image_indices = {name.rsplit('.', 1)[0]: i for i, name in enumerate(self.image_files)}
+        recoverable = {image_id: draft for image_id, draft in pending.items() if image_id in image_indices}
+        if not recoverable:
+            logger.info(f"Dropping {len(pending)} drafts for images that no longer exist")
+            self.draft_journal.discard_all()
+            return False
+
+        reply = QMessageBox.question(
+            self,
+            "Khôi phục bản nháp",
+            f"Tìm thấy {len(recoverable)} ảnh có thay đổi chưa được lưu từ phiên làm việc trước.\n"
+            "Bạn có muốn khôi phục các thay đổi này không?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes
+        )
+        if reply == QMessageBox.Yes:
+            logger.info(f"Restoring {len(recoverable)} drafts: {sorted(recoverable)}")
+            self._restored_drafts = recoverable
+            # Jump to the first image with a recovered draft unless the user already started editing
+            if self.question_list.is_modified():
+                return False
+            self.current_index = min(image_indices[image_id] for image_id in recoverable)
+            return True
+        logger.info("User discarded recovered drafts")
+        self.draft_journal.discard_all()
+        return False
+
+    def _prefetch_neighbours(self):
+        """Queue the images around the current index for background decoding"""
+        radius = self.image_prefetcher.radius
+        start = max(0, self.current_index - radius)
+        end = min(len(self.image_files), self.current_index + radius + 1)
+
+        # Nearest images first so the likely next/previous image is decoded first
+        indices = sorted(range(start, end), key=lambda i: abs(i - self.current_index))
+        self.image_prefetcher.prefetch([
+            os.path.join(self.image_folder, self.image_files[i]) for i in indices
+        ])
+
+    def closeEvent(self, event):
+        """Stop background workers before the window closes"""
+        if self.image_scan_worker is not None:
+            self.image_scan_worker.requestInterruption()
+            self.image_scan_worker.wait()
+        self.label_index_worker.wait()
+        if self.folder_monitor is not None:
+            # The monitor kept the list current, so save it and skip the scan on the next start
+            self.folder_monitor.flush()
+            self.folder_monitor.stop()
+            if self._image_list_complete:
+                try:
+                    self.image_list_cache.save(self.image_folder, self.image_files, folder_mtime_ns(self.image_folder))
+                except OSError as e:
+                    logger.warning(f"Could not save image list cache: {str(e)}")
+        self.image_prefetcher.shutdown()
+        if self.prefill_worker is not None:
+            self.prefill_worker.stop()
+        # Journal any edits made since the last debounce tick
+        if self._draft_timer.isActive():
+            self._draft_timer.stop()
+            self._record_draft()
+        # Drain the write-behind queue so no confirmed label is lost on exit, then drop the drafts
+        # of labels whose save_finished has not reached _on_label_saved, before closing the journal
+        written = self.label_writer.stop()
+        self.label_writer.save_finished.disconnect(self._on_label_saved)
+        for image_id in written:
+            self.draft_journal.discard(image_id)
+        self.draft_journal.close()
+        self.label_store.close()
+        super().closeEvent(event)
+
     def save_current_data(self):
-        """Save the current data to a JSON file
+        """Save the current data through the label store
         
+        The label is queued on the background writer; a failed write is reported
+        later through _on_label_save_failed.
+
         Returns:
-            bool: True if save was successful, False otherwise
+            bool: True if the label was queued, False if required fields are missing
         """
-        logger.info("Starting save_current_data...")
+        logger.debug("Starting save_current_data...")
         
         if not self.question_list.has_questions():
             # This method already checks for all required fields
             # Just log the issue without showing a warning to the user
-            logger.info("Cannot save - missing required fields")
+            logger.debug("Cannot save - missing required fields")
             return False
 
-        original_questions = self.question_list.get_questions()
-        logger.info(f"Original questions to save: {original_questions}")
-        
-        # Format questions according to the specified structure with the exact field order
-        formatted_questions = []
-        for question in original_questions:
-            # Create a dictionary with ordered keys to ensure they appear in the correct order in JSON
-            
-            # Format answers as an array of strings
-            answers = []
-            if question.get('answerable', 0) == 1 and 'answers' in question and question['answers']:
-                # Handle both formats: array of objects or array of strings
-                if isinstance(question['answers'][0], str):
-                    answers = [question['answers'][0]]
-                else:
-                    answer_text = question['answers'][0].get('answer_text', '')
-                    if answer_text:
-                        answers = [answer_text]
-            else:
-                # Default answer for unanswerable questions
-                answers = ["Không thể trả lời được câu hỏi dựa vào thông tin trong ảnh"]
-                
-            # Replace source value if it's self_collected
-            qa_source = question.get('source', 'manually_annotated')
-            if qa_source == 'self_collected':
-                qa_source = 'manually_collected'
-                
-            # Use OrderedDict to maintain the exact field order in the JSON output
-            from collections import OrderedDict
-            formatted_question = OrderedDict([
-                ("question_id", question.get('question_id', 1)),
-                ("question", question.get('question', '')),
-                ("question_type", self.question_list.question_type_combo.currentText()),  # Use display text instead of data value
-                ("answerable", question.get('answerable', 0)),
-                ("answers", answers),
-                ("tags", question.get('tags', [])),
-                ("qa_source", qa_source)  # Renamed from source to qa_source and updated value
-            ])
-            
-            formatted_questions.append(formatted_question)
+        # The record holds the fields in label file order, with answers as a list of strings
+        question = self.question_list.current_record()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Question to save: {question}")
         
-        logger.info(f"Formatted questions: {formatted_questions}")
+        image_name = self.session.current_name
+        base_name = self.session.current_image_id
         
-        image_name = self.image_files[self.current_index]
-        base_name = image_name.rsplit('.', 1)[0]
+        logger.debug(f"Saving for image: {image_name}, base name: {base_name}")
+        if base_name not in self._labeled_before_save:
+            self._labeled_before_save[base_name] = self.session.is_labeled(base_name)
+
+        # The session hands the label to the background writer - the file is written
+        # atomically off the GUI thread and the result comes back through a signal.
+        # The image is optimistically marked as labeled; reverted if the write fails
+        logger.debug(f"Queueing label for {base_name}")
+        label = self.session.save(question, self.question_list.get_image_source())
+        self._update_unlabeled_jumps()
+        self._index_label(base_name, label.to_dict())
+
+        # Update status to LABELED with green color
+        self.title_display.set_image_name(
+            os.path.join(self.image_folder, image_name), 
+            '<span style="color: #2ecc71; font-weight: bold;">LABELED</span>'
+        )
         
-        logger.info(f"Saving for image: {image_name}, base name: {base_name}")
+        # Update window title
+        self.setWindowTitle(f"Vietnamese Image Labeling Tool - Câu Hỏi - LABELED")
         
-        # Path for JSON file
-        json_path = os.path.join(
-            self.label_folder,
-            base_name + '.json'
-        )
+        # The saved values are what later edits are compared against
+        self.question_list.mark_saved()
+        logger.debug("Save queued successfully!")
         
-        logger.info(f"JSON path: {json_path}")
-        logger.info(f"Label folder exists: {os.path.exists(self.label_folder)}")
-        logger.info(f"Label folder path: {os.path.abspath(self.label_folder)}")
-
-        # Get the selected image source type and update if it's self_collected
-        selected_source = self.question_list.get_image_source()
-        if selected_source == 'self_collected':
-            selected_source = 'manually_collected'
-        logger.info(f"Selected image source: {selected_source}")
-
-        # Create the data structure for JSON following the exact format from the example
-        from collections import OrderedDict
-        data = OrderedDict([
-            ('image_id', base_name),
-            ('image_source', selected_source),
-            ('questions', formatted_questions)
-        ])
+        return True
 
+    def _on_label_saved(self, image_id, mtime):
+        """Record the final modification time of a label written in the background"""
+        self.label_writer.acknowledge(image_id)
+        self._labeled_before_save.pop(image_id, None)
+        self._mark_labeled(image_id, mtime)
+        self.draft_journal.discard(image_id)
+        logger.info(f"Label for {image_id} written to the label store")
+
+    def _on_label_save_failed(self, image_id, message):
+        """Undo the optimistic LABELED status and tell the user a background write failed"""
+        was_labeled = self._labeled_before_save.pop(image_id, False)
+        # Index whatever the store still holds for the image
         try:
-            # Save JSON file
-            logger.info(f"Attempting to save JSON to: {json_path}")
-            os.makedirs(os.path.dirname(json_path), exist_ok=True)  # Ensure directory exists
-            
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json_content = json.dumps(data, indent=2, ensure_ascii=False)
-                f.write(json_content)
-                logger.info(f"Successfully wrote JSON file: {json_path}")
-            
-            # Update status to LABELED with green color
-            self.title_display.set_image_name(
-                os.path.join(self.image_folder, image_name), 
-                '<span style="color: #2ecc71; font-weight: bold;">LABELED</span>'
-            )
-            
-            # Update window title
-            self.setWindowTitle(f"Vietnamese Image Labeling Tool - Câu Hỏi - LABELED")
-            
-            # Show confirmation message
-            QMessageBox.information(
-                self,
-                "Đã lưu",
-                "Dữ liệu đã được lưu thành công!"
-            )
-            
-            # Reset modified flag
-            self.question_list.modified = False
-            logger.info("Save completed successfully!")
-            
+            self._index_label(image_id, self.label_store.load(image_id))
+        except ValueError as e:
+            logger.error(f"Could not re-index label {image_id}: {str(e)}")
+        if not was_labeled:
+            self._mark_unlabeled(image_id)
+            current_name = self.image_files[self.current_index]
+            if current_name.rsplit('.', 1)[0] == image_id:
+                self.title_display.set_image_name(os.path.join(self.image_folder, current_name), "UNLABELED")
+                self.setWindowTitle("Vietnamese Image Labeling Tool - Câu Hỏi - UNLABELED")
+
+        logger.error(f"Background save of {image_id} failed: {message}")
+        QMessageBox.critical(
+            self, 
+            "Error", 
+            f"Failed to save label data for image {image_id}: {message}"
+        )
+
+    def _confirm_leave_image(self):
+        """Ask about saving unsaved changes before leaving the current image
+
+        Returns:
+            bool: True if navigation may proceed, False to stay on the current image
+        """
+        if not self.question_list.is_modified():
             return True
-        except Exception as e:
-            logger.error(f"Error saving data: {str(e)}")
-            logger.exception("Detailed error:")
-            QMessageBox.critical(
-                self, 
-                "Error", 
-                f"Failed to save label data: {str(e)}"
-            )
+
+        logger.info("Content modified, asking about saving before leaving the current image")
+        reply = QMessageBox.question(
+            self,
+            "Save Changes",
+            "Do you want to save your changes?",
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
+        )
+
+        if reply == QMessageBox.Cancel:
+            logger.info("User canceled navigation, staying on current image")
             return False
+        elif reply == QMessageBox.Yes:
+            logger.info("User chose to save before navigating")
+            # Only save if all required fields are filled
+            if not self.question_list.has_questions():
+                logger.warning("Cannot save - missing required fields")
+                # Just proceed without saving
+                logger.info("Leaving the current image without saving incomplete data")
+                self.draft_journal.discard(self._current_image_id())
+            elif not self.save_current_data():
+                logger.warning("Save failed, staying on current image")
+                return False
+        else:
+            logger.info("User chose not to save changes")
+            self.draft_journal.discard(self._current_image_id())
+        return True
+
+    def _go_to_index(self, index):
+        """Load the image at index"""
+        logger.debug(f"Moving from image index {self.current_index} to {index}")
+        self.current_index = index
+
+        # Ensure clean state before loading new image
+        self.question_list.clear()
+
+        # Load the new image
+        self.load_current_image()
 
     def next_image(self):
         """Handle next image button click"""
-        logger.info("Next image button clicked")
-        
-        # If content was modified, ask about saving
-        if self.question_list.is_modified():
-            logger.info("Content modified, asking about saving before moving to next image")
-            reply = QMessageBox.question(
-                self,
-                "Save Changes",
-                "Do you want to save your changes?",
-                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-            )
-            
-            if reply == QMessageBox.Cancel:
-                logger.info("User canceled navigation, staying on current image")
+        logger.debug("Next image button clicked")
+        if not self.image_files or not self._confirm_leave_image():
+            return
+
+        # Walk only the images matching the filter bar, if a filter is set
+        if self.active_filters:
+            target = next_name_after(self._filter_matches, self.image_files[self.current_index])
+            if target is None:
+                logger.info("No more images match the filters")
+                QMessageBox.information(self, "Completed", "No more images match the filters!")
                 return
-            elif reply == QMessageBox.Yes:
-                logger.info("User chose to save before navigating")
-                # Only save if all required fields are filled
-                if not self.question_list.has_questions():
-                    logger.warning("Cannot save - missing required fields")
-                    # Just proceed to next image without saving
-                    logger.info("Proceeding to next image without saving incomplete data")
-                else:
-                    if not self.save_current_data():
-                        logger.warning("Save failed, staying on current image")
-                        return
-            else:
-                logger.info("User chose not to save changes")
-        
+            self._go_to_index(self.session.index_of(target))
         # Move to next image
-        if self.current_index < len(self.image_files) - 1:
-            logger.info(f"Moving from image index {self.current_index} to {self.current_index + 1}")
-            self.current_index += 1
-            
-            # Ensure clean state before loading new image
-            self.question_list.clear()
-            
-            # Load the new image
-            self.load_current_image()
+        elif self.current_index < len(self.image_files) - 1:
+            self._go_to_index(self.current_index + 1)
         else:
             logger.info("Reached the end of image list")
             QMessageBox.information(self, "Completed", "All images have been labeled!")
 
     def prev_image(self):
         """Handle previous image button click"""
-        logger.info("Previous image button clicked")
-        
-        # Check for unsaved changes
-        if self.question_list.is_modified():
-            logger.info("Content modified, asking about saving before moving to previous image")
-            reply = QMessageBox.question(
-                self,
-                "Save Changes",
-                "Do you want to save your changes?",
-                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-            )
-            
-            if reply == QMessageBox.Cancel:
-                logger.info("User canceled navigation, staying on current image")
+        logger.debug("Previous image button clicked")
+        if not self.image_files or not self._confirm_leave_image():
+            return
+
+        if self.active_filters:
+            target = previous_name_before(self._filter_matches, self.image_files[self.current_index])
+            if target is None:
+                logger.info("No earlier images match the filters")
                 return
-            elif reply == QMessageBox.Yes:
-                logger.info("User chose to save before navigating")
-                # Only save if all required fields are filled
-                if not self.question_list.has_questions():
-                    logger.warning("Cannot save - missing required fields")
-                    # Just proceed to previous image without saving
-                    logger.info("Proceeding to previous image without saving incomplete data")
-                else:
-                    if not self.save_current_data():
-                        logger.warning("Save failed, staying on current image")
-                        return
-            else:
-                logger.info("User chose not to save changes")
-        
+            self._go_to_index(self.session.index_of(target))
         # Move to previous image
-        if self.current_index > 0:
-            logger.info(f"Moving from image index {self.current_index} to {self.current_index - 1}")
-            self.current_index -= 1
-            
-            # Ensure clean state before loading new image
-            self.question_list.clear()
-            
-            # Load the new image
-            self.load_current_image()
+        elif self.current_index > 0:
+            self._go_to_index(self.current_index - 1)
         else:
             logger.info("Already at the first image, cannot go back further")
 
+    def open_image_by_id(self, image_id):
+        """Open an image picked from the search results"""
+        logger.info(f"Opening image {image_id} from search")
+        name = self.unlabeled_index.name_for(image_id)
+        if name is None:
+            QMessageBox.warning(self, "Not Found", f"Image {image_id} is not in the 'data/image' folder.")
+            return
+        if name == self.image_files[self.current_index] or not self._confirm_leave_image():
+            return
+        self._go_to_index(self.session.index_of(name))
+
+    def next_unlabeled_image(self):
+        """Jump to the next unlabeled image without loading the images in between"""
+        logger.debug("Next unlabeled button clicked")
+        if not self.image_files or not self._confirm_leave_image():
+            return
+
+        # Looked up after the prompt, since saving changes the unlabeled set
+        target = self.session.next_unlabeled_index()
+        if target is None:
+            logger.info("No unlabeled images after the current one")
+            QMessageBox.information(self, "Completed", "No unlabeled images after this one!")
+            return
+        self._go_to_index(target)
+
+    def prev_unlabeled_image(self):
+        """Jump to the previous unlabeled image without loading the images in between"""
+        logger.debug("Previous unlabeled button clicked")
+        if not self.image_files or not self._confirm_leave_image():
+            return
+
+        target = self.session.previous_unlabeled_index()
+        if target is None:
+            logger.info("No unlabeled images before the current one")
+            QMessageBox.information(self, "Completed", "No unlabeled images before this one!")
+            return
+        self._go_to_index(target)
+
     def _on_content_changed(self):
         """Handle content changes in the question list"""
         # Only update status if the content is truly modified
-        if not self.question_list.is_modified():
+        if not self.question_list.is_modified() or not self.image_files:
             return
             
         # Get image information
         image_name = self.image_files[self.current_index]
         base_name = image_name.rsplit('.', 1)[0]
-        json_path = os.path.join(self.label_folder, f"{base_name}.json")
         
         # For labeled images, always show LABELED status (in green) instead of MODIFIED
-        if os.path.exists(json_path):
+        if self.label_index.is_labeled(base_name):
             current_image_path = os.path.join(self.image_folder, self.image_files[self.current_index])
             self.title_display.set_image_name(current_image_path, '<span style="color: #2ecc71; font-weight: bold;">LABELED</span>')
             self.setWindowTitle(f"Vietnamese Image Labeling Tool - Câu Hỏi - LABELED")
@@ -532,14 +916,14 @@ class VietnamMainWindow(QWidget):
             
     def _on_question_confirmed(self):
         """Handle question confirmed signal by saving the data and moving to next image"""
-        logger.info("Question confirmed, initiating save...")
+        logger.debug("Question confirmed, initiating save...")
         
         # For confirmation, we enforce strict validation of required fields
         # This is handled by save_current_data which calls has_questions
         # with is_confirmed=True set by the VietnameseQuestionList component
         
         if self.save_current_data():
-            logger.info("Save successful, moving to next image...")
+            logger.debug("Save successful, moving to next image...")
             # Move to next image if available
             if self.current_index < len(self.image_files) - 1:
                 self.next_image()
@@ -0,0 +1,6 @@
+"""
+Background workers for the Image Labelling Tool
+Contains the Qt objects that run core logic off the GUI thread and report back through signals
+"""
+# Empty __init__.py to make the directory a package
+# Each worker should be imported directly to avoid circular imports
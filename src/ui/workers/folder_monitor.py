@@ -0,0 +1,68 @@
+import logging
+
+from PyQt5.QtCore import QObject, QSocketNotifier, QTimer, pyqtSignal
+
+from src.core.folder_watcher import FolderWatcher
+
+logger = logging.getLogger(__name__)
+
+# Quiet period after the last file event before a batch of changes is delivered
+FOLDER_EVENT_BATCH_MS = 300
+
+
+class FolderMonitor(QObject):
+    """Deliver batched file changes of watched folders on the GUI thread
+
+    Events are read whenever the inotify descriptor becomes readable and
+    collected until the folders have been quiet for a short while, so copying
+    thousands of files in produces a handful of updates rather than one per file.
+    Repeated events for the same file collapse into its latest state.
+    """
+
+    # folder, sorted names of added or rewritten files, sorted names of removed files
+    files_changed = pyqtSignal(str, list, list)
+
+    def __init__(self, folders, batch_ms=FOLDER_EVENT_BATCH_MS, parent=None):
+        super().__init__(parent)
+        self._watcher = FolderWatcher()
+        for folder in folders:
+            self._watcher.add_folder(folder)
+        self._pending = {}  # (folder, name) -> True if added, False if removed
+
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.setInterval(batch_ms)
+        self._batch_timer.timeout.connect(self.flush)
+
+        self._notifier = QSocketNotifier(self._watcher.fileno(), QSocketNotifier.Read, self)
+        self._notifier.activated.connect(self._on_readable)
+
+    def _on_readable(self):
+        events = self._watcher.read_events()
+        for folder, name, added in events:
+            self._pending[(folder, name)] = added
+        if events:
+            self._batch_timer.start()
+
+    def flush(self):
+        """Deliver every change collected so far"""
+        self._batch_timer.stop()
+        self._on_readable()
+        self._batch_timer.stop()
+        if not self._pending:
+            return
+
+        changes = {}  # folder -> (added, removed)
+        for (folder, name), added in self._pending.items():
+            changes.setdefault(folder, ([], []))[0 if added else 1].append(name)
+        self._pending.clear()
+
+        for folder, (added, removed) in changes.items():
+            logger.info(f"{folder}: {len(added)} files added or changed, {len(removed)} removed")
+            self.files_changed.emit(folder, sorted(added), sorted(removed))
+
+    def stop(self):
+        """Stop watching"""
+        self._batch_timer.stop()
+        self._notifier.setEnabled(False)
+        self._watcher.close()
@@ -0,0 +1,43 @@
+import logging
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from src.core.image_list import scan_images, folder_mtime_ns
+
+logger = logging.getLogger(__name__)
+
+
+class ImageScanWorker(QThread):
+    """Scan the image folder on a background thread, delivering names as they are found"""
+
+    # Sorted batch of newly discovered image file names
+    batch_found = pyqtSignal(list)
+    # All image file names (sorted) and the folder mtime taken before the scan started
+    scan_finished = pyqtSignal(list, object)
+    # Error message if the folder could not be read
+    scan_failed = pyqtSignal(str)
+
+    def __init__(self, folder, parent=None):
+        super().__init__(parent)
+        self.folder = folder
+
+    def run(self):
+        try:
+            # Taken first, so changes made while scanning make the saved list stale
+            mtime_ns = folder_mtime_ns(self.folder)
+            found = []
+            for batch in scan_images(self.folder):
+                if self.isInterruptionRequested():
+                    logger.info("Image scan interrupted")
+                    return
+                batch.sort()
+                found.extend(batch)
+                self.batch_found.emit(batch)
+        except OSError as e:
+            logger.error(f"Failed to scan {self.folder}: {str(e)}")
+            self.scan_failed.emit(str(e))
+            return
+
+        found.sort()
+        logger.info(f"Image scan finished: {len(found)} images in {self.folder}")
+        self.scan_finished.emit(found, mtime_ns)
@@ -0,0 +1,41 @@
+import logging
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from src.core.label_facets import FacetIndex
+from src.core.text_search import TextSearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+class LabelIndexWorker(QThread):
+    """Read every label once on a background thread and build the label indexes"""
+
+    # The built FacetIndex and TextSearchIndex - owned by the GUI thread from then on
+    index_built = pyqtSignal(object, object)
+    # Error message if the labels could not be read
+    index_failed = pyqtSignal(str)
+
+    def __init__(self, label_store, parent=None):
+        super().__init__(parent)
+        self.label_store = label_store
+
+    def run(self):
+        started = time.perf_counter()
+        facet_index = FacetIndex()
+        search_index = TextSearchIndex()
+        try:
+            # One pass over the store feeds both indexes
+            for image_id, data in self.label_store.iter_labels():
+                facet_index.update(image_id, data)
+                search_index.update(image_id, data)
+        except Exception as e:
+            logger.exception("Failed to build the label indexes")
+            self.index_failed.emit(str(e))
+            return
+        finally:
+            # Release only this thread's SQLite connection - the GUI and writer threads share the store
+            self.label_store.release()
+        logger.info(f"Indexed {len(facet_index)} labels in {(time.perf_counter() - started) * 1000:.1f} ms")
+        self.index_built.emit(facet_index, search_index)
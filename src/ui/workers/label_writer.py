@@ -0,0 +1,93 @@
+import logging
+import threading
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class LabelWriter(QObject):
+    """Write-behind queue that saves labels on a background thread
+
+    submit() queues an immutable LabelRecord and returns immediately; it is
+    turned into its file format on the writer thread. Saves of the same image
+    that are still queued are coalesced, so only the latest label is written.
+    The outcome of every write is reported through save_finished or
+    save_failed, which are delivered on the GUI thread.
+    """
+
+    # image id, modification time reported by the label store
+    save_finished = pyqtSignal(str, float)
+    # image id, error message
+    save_failed = pyqtSignal(str, str)
+
+    def __init__(self, label_store, parent=None):
+        super().__init__(parent)
+        self.label_store = label_store
+        self._pending = OrderedDict()  # image id -> LabelRecord, oldest first
+        self._condition = threading.Condition()
+        self._writing = False
+        self._stopping = False
+        self._unacknowledged = set()  # ids written whose save_finished was not handled yet
+        self._thread = threading.Thread(target=self._run, name="label-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, image_id, label):
+        """Queue a LabelRecord for writing, replacing any queued label of the same image"""
+        with self._condition:
+            if image_id in self._pending:
+                logger.debug(f"Coalescing queued save of {image_id}")
+            self._pending[image_id] = label
+            self._pending.move_to_end(image_id)
+            self._condition.notify()
+
+    def pending_count(self):
+        """Return the number of labels waiting to be written"""
+        with self._condition:
+            return len(self._pending) + (1 if self._writing else 0)
+
+    def acknowledge(self, image_id):
+        """Record that the save_finished signal of an image was handled"""
+        with self._condition:
+            self._unacknowledged.discard(image_id)
+
+    def stop(self, timeout=None):
+        """Write everything still queued, then stop the writer thread
+
+        Returns:
+            set: Ids of labels written whose save_finished was not acknowledged,
+                e.g. because the signal is still queued for the GUI thread
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error(f"Label writer did not finish within {timeout}s, {self.pending_count()} labels pending")
+        with self._condition:
+            return set(self._unacknowledged)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                image_id, label = self._pending.popitem(last=False)
+                self._writing = True
+
+            try:
+                mtime = self.label_store.save(image_id, label.to_dict())
+            except Exception as e:
+                logger.exception(f"Failed to write label for {image_id}")
+                self.save_failed.emit(image_id, str(e))
+            else:
+                logger.info(f"Wrote label for {image_id}")
+                with self._condition:
+                    self._unacknowledged.add(image_id)
+                self.save_finished.emit(image_id, mtime)
+            finally:
+                with self._condition:
+                    self._writing = False
@@ -0,0 +1,96 @@
+import logging
+import multiprocessing
+import queue
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from src.ml.suggestions import run_worker, SUGGESTION_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+# Interval at which finished suggestions are collected from the worker process
+PREFILL_POLL_MS = 200
+
+# Seconds the worker process gets to finish its current image on exit
+PREFILL_STOP_TIMEOUT = 2
+
+
+class PrefillWorker(QObject):
+    """Run a suggestion backend over upcoming images in a separate process
+
+    Models run in a spawned process, so inference never holds the GUI
+    thread or its GIL. Requests go through one queue and results come back
+    through another, which is polled with a QTimer. Each image is requested
+    once per session, and its suggestion is kept for when the annotator
+    arrives. If the backend fails to load or the process dies, polling stops
+    and later requests are ignored.
+    """
+
+    # image id, suggested question in label file format
+    suggestion_ready = pyqtSignal(str, dict)
+
+    def __init__(self, backend_name, cache_path=SUGGESTION_CACHE_PATH, parent=None):
+        super().__init__(parent)
+        # Spawned rather than forked: forking a process that runs Qt threads is unsafe
+        context = multiprocessing.get_context('spawn')
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._process = context.Process(target=run_worker, name="ai-prefill", daemon=True,
+                                        args=(backend_name, cache_path, self._requests, self._results))
+        self._process.start()
+        logger.info(f"Started AI prefill worker with backend '{backend_name}'")
+
+        self._requested = set()  # image ids sent to the worker
+        self._suggestions = {}  # image id -> suggested question
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(PREFILL_POLL_MS)
+        self._poll_timer.timeout.connect(self._poll)
+        self._poll_timer.start()
+
+    def is_running(self):
+        """Check if the worker process is still serving requests"""
+        return self._poll_timer.isActive()
+
+    def request(self, images):
+        """Queue (image_id, image_path) pairs that were not requested yet, in order"""
+        if not self.is_running():
+            return
+        for image_id, image_path in images:
+            if image_id not in self._requested:
+                self._requested.add(image_id)
+                self._requests.put((image_id, image_path))
+
+    def suggestion(self, image_id):
+        """Return the suggestion received for an image, or None"""
+        return self._suggestions.get(image_id)
+
+    def _poll(self):
+        # Checked before draining, so results sent right before the process exited are still collected
+        alive = self._process.is_alive()
+        while True:
+            try:
+                image_id, question = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if image_id is None:
+                logger.error(f"AI prefill is disabled, its backend could not be loaded: {question}")
+                self._poll_timer.stop()
+                return
+            self._suggestions[image_id] = question
+            self.suggestion_ready.emit(image_id, question)
+        if not alive:
+            logger.error(f"AI prefill worker exited unexpectedly (exit code {self._process.exitcode})")
+            self._poll_timer.stop()
+
+    def stop(self):
+        """Stop the worker process, terminating it if its queued requests take too long"""
+        self._poll_timer.stop()
+        self._requests.put(None)
+        self._process.join(PREFILL_STOP_TIMEOUT)
+        if self._process.is_alive():
+            logger.warning("AI prefill worker did not stop in time, terminating it")
+            self._process.terminate()
+            self._process.join()
+        # Requests left in the queue are abandoned, so do not wait for its feeder thread at exit
+        self._requests.cancel_join_thread()